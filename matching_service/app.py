@@ -1,11 +1,21 @@
 # app.py
 from __future__ import annotations
 
+import atexit
+import logging
+import logging.handlers
 import os
+import queue
+import threading
+from datetime import date, time
+from functools import lru_cache, singledispatch
 from uuid import UUID
-from typing import Any
+from typing import Any, Optional, Tuple
 
-from flask import Flask, request, jsonify
+import fastjsonschema
+import orjson
+from cachetools import TTLCache
+from flask import Flask, request, stream_with_context
 from dotenv import load_dotenv
 
 from service.u2u_service import MatchingService
@@ -14,53 +24,270 @@ load_dotenv(dotenv_path=os.path.join(os.path.dirname(__file__), ".env"))
 
 app = Flask(__name__)
 
+# Canonical WSGI entry point (served via wsgi.py); keep tooling pointed at `app`.
+__all__ = ["app"]
+
+
+# ---- Logging: records are formatted and written on a listener thread ----
+class _DeferredQueueHandler(logging.handlers.QueueHandler):
+    """Enqueue records as-is so formatting happens on the listener thread, not the request thread."""
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+
+_LOG_QUEUE: queue.SimpleQueue = queue.SimpleQueue()
+_LOG_STREAM = logging.StreamHandler()
+_LOG_STREAM.setFormatter(logging.Formatter("[matching-service] %(asctime)s %(levelname)s %(message)s"))
+_LOG_LISTENER: Optional[logging.handlers.QueueListener] = None
+
+
+def _start_log_listener() -> None:
+    # Threads do not survive fork, so gunicorn workers (preload_app) restart it.
+    global _LOG_LISTENER
+    _LOG_LISTENER = logging.handlers.QueueListener(_LOG_QUEUE, _LOG_STREAM)
+    _LOG_LISTENER.start()
+
+
+def _stop_log_listener() -> None:
+    if _LOG_LISTENER is not None:
+        _LOG_LISTENER.stop()
+
+
+_start_log_listener()
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_start_log_listener)
+atexit.register(_stop_log_listener)
+
+log = logging.getLogger("matching_service")
+log.setLevel(os.getenv("LOG_LEVEL", "INFO").upper())
+log.addHandler(_DeferredQueueHandler(_LOG_QUEUE))
+log.propagate = False
+
 TOP_K_MIN = 1
 TOP_K_MAX = 50
 MMR_LAMBDA_MIN_EXCLUSIVE = 0.0
 MMR_LAMBDA_MAX_INCLUSIVE = 1.0
 
+# Compiled once at import; fastjsonschema generates a straight-line validator.
+U2U_MATCHES_SCHEMA = {
+    "type": "object",
+    "required": ["target_id"],
+    "properties": {
+        "target_id": {"type": "string", "minLength": 1},
+        "top_k": {"type": ["integer", "null"], "minimum": TOP_K_MIN, "maximum": TOP_K_MAX},
+        "min_score": {"type": ["number", "null"], "minimum": 0.0, "maximum": 1.0},
+        "apply_mmr": {"type": ["boolean", "null"]},
+        "mmr_lambda": {
+            "type": ["number", "null"],
+            "exclusiveMinimum": MMR_LAMBDA_MIN_EXCLUSIVE,
+            "maximum": MMR_LAMBDA_MAX_INCLUSIVE,
+        },
+    },
+}
+_validate_u2u_matches = fastjsonschema.compile(U2U_MATCHES_SCHEMA)
+
 # ---- Initialize once (important for performance) ----
 SERVICE = MatchingService(
     embedder_type=os.getenv("EMBEDDER_TYPE", "qwen"),
     embedder_model=os.getenv("EMBEDDER_MODEL"),
+    # CPU unless set: gunicorn preload_app loads the model before forking,
+    # and a CUDA context does not survive a fork ("auto" picks CUDA if visible)
     device=os.getenv("DEVICE", "cpu"),
     cache_vectors=True,
 )
 
 
-def to_jsonable(x: Any) -> Any:
-    """Recursively convert objects (UUID, etc.) into JSON-serializable types."""
-    if isinstance(x, UUID):
-        return str(x)
-    if isinstance(x, dict):
-        return {k: to_jsonable(v) for k, v in x.items()}
-    if isinstance(x, list):
-        return [to_jsonable(v) for v in x]
-    if isinstance(x, tuple):
-        return [to_jsonable(v) for v in x]
-    return x
+def warm_service(embedder: bool = True, users: bool = True) -> None:
+    """
+    Warm the embedder and/or the user pool before serving traffic.
+
+    Loading users opens database connections, so under gunicorn --preload it
+    must only run in the workers, never in the master.
+
+    Env:
+      WARMUP=0            disable warmup
+      WARMUP_USER_IDS     comma-separated hot user ids to pre-cache
+    """
+    if os.getenv("WARMUP", "1") == "0":
+        return
+
+    user_ids = []
+    for raw in os.getenv("WARMUP_USER_IDS", "").split(",") if users else ():
+        raw = raw.strip()
+        if not raw:
+            continue
+        try:
+            user_ids.append(UUID(raw))
+        except ValueError:
+            log.warning("warmup: skipping invalid user id %r", raw)
+
+    try:
+        stats = SERVICE.warmup(
+            user_ids=user_ids,
+            prefetch_pool=users,
+            warm_embedder=embedder,
+        )
+        log.info("warmup %s", stats)
+    except Exception:
+        log.exception("warmup failed")
+
+
+# Load/warm the model at import so gunicorn --preload shares it across workers.
+# DB prefetch (pool and WARMUP_USER_IDS) happens per worker (see gunicorn.conf.py)
+# to avoid forking open sockets.
+warm_service(users=False)
+
+
+_ORJSON_OPTIONS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+
+
+@singledispatch
+def _default(obj: Any) -> Any:
+    """Fallback for types orjson does not serialize natively (UUID/datetime/numpy are native)."""
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+@_default.register(set)
+@_default.register(frozenset)
+def _(obj) -> list:
+    return list(obj)
+
+
+@_default.register(UUID)
+def _(obj: UUID) -> str:
+    return str(obj)
+
+
+@_default.register(date)
+@_default.register(time)
+def _(obj) -> str:
+    return obj.isoformat()
+
+
+def _dumps(obj: Any) -> bytes:
+    return orjson.dumps(obj, default=_default, option=_ORJSON_OPTIONS)
+
+
+def _raw_json(body: bytes, status: int = 200):
+    """Wrap already-serialized JSON bytes in a response."""
+    return app.response_class(body, status=status, mimetype="application/json")
+
+
+def ojson(obj: Any, status: int = 200):
+    """Serialize obj with orjson in a single pass and wrap it in a JSON response."""
+    return _raw_json(_dumps(obj), status)
+
+
+# ---- Response cache for /api/u2u/matches and /api/u2u/event-matches ----
+# Repeat polls with identical params skip retrieval + MMR and serialization.
+# Event-scoped entries carry the event_id in their key.
+# Entries hold the serialized body; cleared whenever an embedding is rebuilt.
+#
+# With MATCH_CACHE_FUZZY=1 a second store keys min_score/mmr_lambda on 0.05
+# buckets, so near-identical parameter tuples (MMR is smooth in lambda) also hit.
+_MATCH_CACHE_SIZE = int(os.getenv("MATCH_CACHE_SIZE", "2048"))
+_MATCH_CACHE_TTL = float(os.getenv("MATCH_CACHE_TTL", "30"))
+_MATCH_CACHE_FUZZY = os.getenv("MATCH_CACHE_FUZZY", "0") == "1"
+_FUZZY_BUCKETS_PER_UNIT = 20  # 0.05-wide buckets
+
+_MATCHES_CACHE: TTLCache = TTLCache(maxsize=_MATCH_CACHE_SIZE, ttl=_MATCH_CACHE_TTL)
+_MATCHES_FUZZY_CACHE: TTLCache = TTLCache(maxsize=_MATCH_CACHE_SIZE, ttl=_MATCH_CACHE_TTL)
+_MATCHES_CACHE_LOCK = threading.Lock()
+_MATCHES_CACHE_STATS = {"hits": 0, "misses": 0}
+
+MatchesCacheKey = Tuple[Any, ...]
+
+
+def _bucket(value: float) -> float:
+    return round(value * _FUZZY_BUCKETS_PER_UNIT) / _FUZZY_BUCKETS_PER_UNIT
+
+
+def _matches_cache_keys(
+    target_id: UUID,
+    top_k: int,
+    min_score: float,
+    apply_mmr: bool,
+    mmr_lambda: float,
+    event_id: Optional[str] = None,
+) -> Tuple[MatchesCacheKey, Optional[MatchesCacheKey]]:
+    """Return (exact_key, fuzzy_key); fuzzy_key is None unless MATCH_CACHE_FUZZY=1."""
+    exact = (event_id, target_id, top_k, round(min_score, 3), apply_mmr, round(mmr_lambda, 3))
+    if not _MATCH_CACHE_FUZZY:
+        return exact, None
+    return exact, (event_id, target_id, top_k, _bucket(min_score), apply_mmr, _bucket(mmr_lambda))
+
+
+def _matches_cache_get(keys: Tuple[MatchesCacheKey, Optional[MatchesCacheKey]]) -> Optional[bytes]:
+    exact, fuzzy = keys
+    with _MATCHES_CACHE_LOCK:
+        body = _MATCHES_CACHE.get(exact)
+        if body is None and fuzzy is not None:
+            body = _MATCHES_FUZZY_CACHE.get(fuzzy)
+        _MATCHES_CACHE_STATS["hits" if body is not None else "misses"] += 1
+        return body
+
+
+def _matches_cache_put(keys: Tuple[MatchesCacheKey, Optional[MatchesCacheKey]], body: bytes) -> None:
+    exact, fuzzy = keys
+    with _MATCHES_CACHE_LOCK:
+        _MATCHES_CACHE[exact] = body
+        if fuzzy is not None:
+            _MATCHES_FUZZY_CACHE[fuzzy] = body
+
+
+def matches_cache_stats() -> dict:
+    with _MATCHES_CACHE_LOCK:
+        return {
+            "size": len(_MATCHES_CACHE),
+            "fuzzy_size": len(_MATCHES_FUZZY_CACHE),
+            **_MATCHES_CACHE_STATS,
+        }
+
+
+def clear_matches_cache() -> None:
+    with _MATCHES_CACHE_LOCK:
+        _MATCHES_CACHE.clear()
+        _MATCHES_FUZZY_CACHE.clear()
+
+
+@lru_cache(maxsize=4096)
+def _parse_uuid(value: str) -> UUID:
+    """Parse a UUID string; hot target ids (repeat pollers) reuse the parsed object."""
+    return UUID(value)
+
+
+def _json_body() -> dict:
+    """Parse the request body with orjson; non-object or malformed bodies become {}."""
+    try:
+        data = orjson.loads(request.get_data(cache=False))
+    except orjson.JSONDecodeError:
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+# One hashed lookup instead of an isinstance ladder. True/1/1.0 (and False/0/0.0)
+# hash equal, so the numeric keys also cover bools and 0/1 floats.
+_BOOL_MAP: dict[Any, bool] = {
+    1: True, 0: False,
+    "true": True, "1": True, "yes": True, "y": True,
+    "false": False, "0": False, "no": False, "n": False,
+}
 
 
 def parse_bool_strict(value: Any, *, field_name: str, default: bool) -> bool:
     if value is None:
         return default
 
-    if isinstance(value, bool):
-        return value
+    key = value.strip().lower() if isinstance(value, str) else value
+    try:
+        parsed = _BOOL_MAP.get(key)
+    except TypeError:  # unhashable (list/dict)
+        parsed = None
 
-    if isinstance(value, (int, float)):
-        if value in (0, 1):
-            return bool(value)
+    if parsed is None:
         raise ValueError(f"Invalid boolean for {field_name}: expected true/false (or 1/0)")
-
-    if isinstance(value, str):
-        normalized = value.strip().lower()
-        if normalized in {"true", "1", "yes", "y"}:
-            return True
-        if normalized in {"false", "0", "no", "n"}:
-            return False
-
-    raise ValueError(f"Invalid boolean for {field_name}: expected true/false (or 1/0)")
+    return parsed
 
 
 def parse_int_bounded(value: Any, *, field_name: str, default: int, min_value: int, max_value: int) -> int:
@@ -95,7 +322,7 @@ def parse_float_bounded(value: Any, *, field_name: str, default: float, min_valu
 
 @app.get("/health")
 def health():
-    return jsonify({"ok": True})
+    return ojson({"ok": True, "matches_cache": matches_cache_stats()})
 
 
 @app.post("/api/u2u/matches")
@@ -110,6 +337,10 @@ def u2u_matches():
         "mmr_lambda": 0.5           # optional
       }
 
+    Fields are validated against U2U_MATCHES_SCHEMA, so values must be JSON
+    typed: "5" or "true" get a 400 here (unlike /api/u2u/event-matches, which
+    still coerces strings). Integral floats such as 5.0 are valid for top_k.
+
     Response JSON:
       {
         "target_id": "<uuid-string>",
@@ -118,51 +349,36 @@ def u2u_matches():
         ]
       }
     """
-    data = request.get_json(silent=True) or {}
-
-    target_id_str = data.get("target_id")
-    if not target_id_str:
-        return jsonify({"error": "Missing field: target_id"}), 400
+    data = _json_body()
 
     try:
-        target_id = UUID(str(target_id_str))
-    except Exception:
-        return jsonify({"error": "Invalid UUID format for target_id"}), 400
+        _validate_u2u_matches(data)
+    except fastjsonschema.JsonSchemaValueException as e:
+        return ojson({"error": e.message}, 400)
 
     try:
-        top_k = parse_int_bounded(
-            data.get("top_k"),
-            field_name="top_k",
-            default=5,
-            min_value=TOP_K_MIN,
-            max_value=TOP_K_MAX,
-        )
-        min_score = parse_float_bounded(
-            data.get("min_score"),
-            field_name="min_score",
-            default=0.0,
-            min_value=0.0,
-            max_value=1.0,
-        )
-        apply_mmr = parse_bool_strict(
-            data.get("apply_mmr"),
-            field_name="apply_mmr",
-            default=True,
-        )
-        mmr_lambda = parse_float_bounded(
-            data.get("mmr_lambda"),
-            field_name="mmr_lambda",
-            default=0.5,
-            min_value=MMR_LAMBDA_MIN_EXCLUSIVE,
-            max_value=MMR_LAMBDA_MAX_INCLUSIVE,
-            min_exclusive=True,
-        )
-    except ValueError as e:
-        return jsonify({"error": str(e)}), 400
-
-    print(
-        "[matching-service] /api/u2u/matches",
-        {
+        target_id = _parse_uuid(data["target_id"])
+    except ValueError:
+        return ojson({"error": "Invalid UUID format for target_id"}, 400)
+
+    top_k = data.get("top_k")
+    # "integer" accepts integral floats (5.0); the engine needs a real int
+    top_k = 5 if top_k is None else int(top_k)
+    min_score = data.get("min_score")
+    if min_score is None:
+        min_score = 0.0
+    apply_mmr = data.get("apply_mmr")
+    if apply_mmr is None:
+        apply_mmr = True
+    mmr_lambda = data.get("mmr_lambda")
+    if mmr_lambda is None:
+        mmr_lambda = 0.5
+
+    # Lazy %s args for the text formatter; the same fields in extra for structured handlers
+    log.info(
+        "u2u_matches target_id=%s top_k=%s min_score=%s apply_mmr=%s mmr_lambda=%s",
+        target_id, top_k, min_score, apply_mmr, mmr_lambda,
+        extra={
             "target_id": str(target_id),
             "top_k": top_k,
             "min_score": min_score,
@@ -171,6 +387,11 @@ def u2u_matches():
         },
     )
 
+    cache_keys = _matches_cache_keys(target_id, top_k, min_score, apply_mmr, mmr_lambda)
+    cached = _matches_cache_get(cache_keys)
+    if cached is not None:
+        return _raw_json(cached)
+
     try:
         matches = SERVICE.find_matches_without_reasons(
             user_id=target_id,
@@ -181,16 +402,24 @@ def u2u_matches():
         )
     except ValueError as e:
         # e.g. user not found
-        return jsonify({"error": str(e)}), 404
+        return ojson({"error": str(e)}, 404)
     except Exception as e:
-        return jsonify({"error": f"Internal error: {e}"}), 500
+        return ojson({"error": f"Internal error: {e}"}, 500)
 
-    return jsonify(
-        to_jsonable({
-            "target_id": target_id,
-            "matches": matches,
-        })
-    )
+    def generate():
+        # Emit the envelope and one chunk per match so encoding overlaps the
+        # client read; the chunks are joined into the cache once fully sent.
+        chunks = [b'{"target_id":' + _dumps(target_id) + b',"matches":[']
+        yield chunks[0]
+        for i, match in enumerate(matches):
+            chunk = (b"," if i else b"") + _dumps(match)
+            chunks.append(chunk)
+            yield chunk
+        chunks.append(b"]}")
+        yield chunks[-1]
+        _matches_cache_put(cache_keys, b"".join(chunks))
+
+    return app.response_class(stream_with_context(generate()), mimetype="application/json")
 
 
 @app.post("/api/u2u/event-matches")
@@ -208,19 +437,19 @@ def u2u_event_matches():
         "mmr_lambda": 0.5           # optional
       }
     """
-    data = request.get_json(silent=True) or {}
+    data = _json_body()
 
     target_id_str = data.get("target_id")
     event_id = (data.get("event_id") or "").strip()
     if not target_id_str:
-        return jsonify({"error": "Missing field: target_id"}), 400
+        return ojson({"error": "Missing field: target_id"}, 400)
     if not event_id:
-        return jsonify({"error": "Missing field: event_id"}), 400
+        return ojson({"error": "Missing field: event_id"}, 400)
 
     try:
-        target_id = UUID(str(target_id_str))
+        target_id = _parse_uuid(str(target_id_str))
     except Exception:
-        return jsonify({"error": "Invalid UUID format for target_id"}), 400
+        return ojson({"error": "Invalid UUID format for target_id"}, 400)
 
     try:
         top_k = parse_int_bounded(
@@ -251,7 +480,12 @@ def u2u_event_matches():
             min_exclusive=True,
         )
     except ValueError as e:
-        return jsonify({"error": str(e)}), 400
+        return ojson({"error": str(e)}, 400)
+
+    cache_keys = _matches_cache_keys(target_id, top_k, min_score, apply_mmr, mmr_lambda, event_id)
+    cached = _matches_cache_get(cache_keys)
+    if cached is not None:
+        return _raw_json(cached)
 
     try:
         matches = SERVICE.find_matches_in_event_without_reasons(
@@ -263,17 +497,17 @@ def u2u_event_matches():
             mmr_lambda=mmr_lambda,
         )
     except ValueError as e:
-        return jsonify({"error": str(e)}), 404
+        return ojson({"error": str(e)}, 404)
     except Exception as e:
-        return jsonify({"error": f"Internal error: {e}"}), 500
-
-    return jsonify(
-        to_jsonable({
-            "target_id": target_id,
-            "event_id": event_id,
-            "matches": matches,
-        })
-    )
+        return ojson({"error": f"Internal error: {e}"}, 500)
+
+    body = _dumps({
+        "target_id": target_id,
+        "event_id": event_id,
+        "matches": matches,
+    })
+    _matches_cache_put(cache_keys, body)
+    return _raw_json(body)
 
 
 @app.post("/api/u2u/match-reason")
@@ -290,24 +524,24 @@ def u2u_match_reason():
         "interest_similarity": 0.55   # optional
       }
     """
-    data = request.get_json(silent=True) or {}
+    data = _json_body()
 
     target_id_str = data.get("target_id")
     matched_user_id_str = data.get("matched_user_id")
     if not target_id_str:
-        return jsonify({"error": "Missing field: target_id"}), 400
+        return ojson({"error": "Missing field: target_id"}, 400)
     if not matched_user_id_str:
-        return jsonify({"error": "Missing field: matched_user_id"}), 400
+        return ojson({"error": "Missing field: matched_user_id"}, 400)
 
     try:
-        target_id = UUID(str(target_id_str))
+        target_id = _parse_uuid(str(target_id_str))
     except Exception:
-        return jsonify({"error": "Invalid UUID format for target_id"}), 400
+        return ojson({"error": "Invalid UUID format for target_id"}, 400)
 
     try:
-        matched_user_id = UUID(str(matched_user_id_str))
+        matched_user_id = _parse_uuid(str(matched_user_id_str))
     except Exception:
-        return jsonify({"error": "Invalid UUID format for matched_user_id"}), 400
+        return ojson({"error": "Invalid UUID format for matched_user_id"}, 400)
 
     try:
         score = parse_float_bounded(
@@ -332,7 +566,7 @@ def u2u_match_reason():
             max_value=1.0,
         )
     except ValueError as e:
-        return jsonify({"error": str(e)}), 400
+        return ojson({"error": str(e)}, 400)
 
     try:
         result = SERVICE.generate_reason_for_pair(
@@ -343,11 +577,11 @@ def u2u_match_reason():
             interest_similarity=interest_similarity,
         )
     except ValueError as e:
-        return jsonify({"error": str(e)}), 404
+        return ojson({"error": str(e)}, 404)
     except Exception as e:
-        return jsonify({"error": f"Internal error: {e}"}), 500
+        return ojson({"error": f"Internal error: {e}"}, 500)
 
-    return jsonify(to_jsonable(result))
+    return ojson(result)
 
 
 @app.post("/api/u2u/embeddings/rebuild")
@@ -357,23 +591,25 @@ def rebuild_embedding():
     Request JSON:
       { "user_id": "<uuid-string>" }
     """
-    data = request.get_json(silent=True) or {}
+    data = _json_body()
     user_id_str = data.get("user_id")
     if not user_id_str:
-        return jsonify({"error": "Missing field: user_id"}), 400
+        return ojson({"error": "Missing field: user_id"}, 400)
 
     try:
-        user_id = UUID(str(user_id_str))
+        user_id = _parse_uuid(str(user_id_str))
     except Exception:
-        return jsonify({"error": "Invalid UUID format for user_id"}), 400
+        return ojson({"error": "Invalid UUID format for user_id"}, 400)
 
     try:
         result = SERVICE.rebuild_user_embedding(user_id)
-        return jsonify(to_jsonable(result))
+        # Profile changed: cached match lists (for this user or others) may be stale.
+        clear_matches_cache()
+        return ojson(result)
     except ValueError as e:
-        return jsonify({"error": str(e)}), 404
+        return ojson({"error": str(e)}, 404)
     except Exception as e:
-        return jsonify({"error": f"Internal error: {e}"}), 500
+        return ojson({"error": f"Internal error: {e}"}, 500)
 
 
 if __name__ == "__main__":
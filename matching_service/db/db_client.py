@@ -7,21 +7,81 @@ Provides a single global instance of Supabase client for database operations.
 import os
 import json
 import base64
-from typing import Optional
-from supabase import create_client, Client
-from dotenv import load_dotenv
+from functools import cache
+import httpx
+from supabase import create_client, Client, ClientOptions
 
 
-class SupabaseClient:
+@cache
+def get_supabase_client() -> Client:
     """
-    Singleton class for Supabase client management
+    Get the Supabase client singleton instance
+
+    The client is created on first call; later calls hit the functools.cache
+    fast path.
+
+    Returns:
+        Client: Supabase client instance
 
-    Ensures only one Supabase client instance exists throughout the application lifecycle.
+    Raises:
+        ValueError: If SUPABASE_URL or SUPABASE_KEY environment variables are not set
     """
+    # Get Supabase credentials from environment. The .env file is loaded once
+    # by the process entry point (app.py / scripts), not on this path.
+    url = os.environ.get("SUPABASE_URL")
+    # Backend tasks should prefer service role key to bypass RLS safely.
+    key = (
+        os.environ.get("SUPABASE_SERVICE_ROLE_KEY")
+        or os.environ.get("SUPABASE_KEY")
+        or os.environ.get("SUPABASE_PUBLISHABLE_KEY")
+    )
+
+    if not url or not key:
+        raise ValueError(
+            "Supabase credentials not found. "
+            "Please set SUPABASE_URL and SUPABASE_SERVICE_ROLE_KEY (preferred) "
+            "or SUPABASE_KEY/SUPABASE_PUBLISHABLE_KEY."
+        )
+
+    # Log which key role is being used (decode JWT payload without exposing key)
+    try:
+        payload = key.split(".")[1]
+        payload += "=" * (4 - len(payload) % 4)  # pad base64
+        claims = json.loads(base64.b64decode(payload))
+        print(f"[supabase-client] Initialized with role: {claims.get('role', 'UNKNOWN')}")
+    except Exception:
+        print("[supabase-client] Could not decode key role")
+
+    # Create Supabase client on a shared, pooled HTTP/2 connection so repository
+    # queries reuse warm TLS connections instead of reconnecting per call.
+    # HTTP/2 multiplexes requests, so a small pool is enough and stays well
+    # under Supavisor's connection limits. httpx advertises every decoder it
+    # has (gzip/deflate, plus br and zstd when brotli/zstandard are installed),
+    # so text-heavy profile lists come back compressed.
+    http_client = httpx.Client(
+        http2=True,
+        follow_redirects=True,
+        # Fail fast on connect; SUPABASE_TIMEOUT bounds each read/write
+        timeout=httpx.Timeout(float(os.environ.get("SUPABASE_TIMEOUT", "30")), connect=5.0),
+        limits=httpx.Limits(
+            max_connections=int(os.environ.get("SUPABASE_MAX_CONNECTIONS", "15")),
+            max_keepalive_connections=int(os.environ.get("SUPABASE_MAX_KEEPALIVE", "5")),
+            keepalive_expiry=float(os.environ.get("SUPABASE_KEEPALIVE_EXPIRY", "30")),
+        ),
+    )
+    client = create_client(url, key, options=ClientOptions(httpx_client=http_client))
+
+    # Explicitly set the auth token on the PostgREST client to ensure
+    # the service role key is used for all database operations (bypasses RLS).
+    client.postgrest.auth(key)
+
+    return client
 
-    _instance: Optional[Client] = None
-    _initialized: bool = False
-    _key: Optional[str] = None
+
+class SupabaseClient:
+    """
+    Backwards-compatible shim over get_supabase_client()
+    """
 
     @classmethod
     def get_instance(cls) -> Client:
@@ -30,77 +90,12 @@ class SupabaseClient:
 
         Returns:
             Client: Supabase client instance
-
-        Raises:
-            ValueError: If SUPABASE_URL or SUPABASE_KEY environment variables are not set
-        """
-        if cls._instance is None:
-            cls._initialize()
-        return cls._instance
-
-    @classmethod
-    def _initialize(cls) -> None:
         """
-        Initialize the Supabase client
-
-        Loads environment variables and creates the client instance.
-        """
-        if cls._initialized:
-            return
-
-        # Load environment variables from matching_service/.env
-        service_root = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
-        load_dotenv(dotenv_path=os.path.join(service_root, ".env"))
-
-        # Get Supabase credentials from environment
-        url = os.environ.get("SUPABASE_URL")
-        # Backend tasks should prefer service role key to bypass RLS safely.
-        key = (
-            os.environ.get("SUPABASE_SERVICE_ROLE_KEY")
-            or os.environ.get("SUPABASE_KEY")
-            or os.environ.get("SUPABASE_PUBLISHABLE_KEY")
-        )
-
-        if not url or not key:
-            raise ValueError(
-                "Supabase credentials not found. "
-                "Please set SUPABASE_URL and SUPABASE_SERVICE_ROLE_KEY (preferred) "
-                "or SUPABASE_KEY/SUPABASE_PUBLISHABLE_KEY."
-            )
-
-        # Log which key role is being used (decode JWT payload without exposing key)
-        try:
-            payload = key.split(".")[1]
-            payload += "=" * (4 - len(payload) % 4)  # pad base64
-            claims = json.loads(base64.b64decode(payload))
-            print(f"[supabase-client] Initialized with role: {claims.get('role', 'UNKNOWN')}")
-        except Exception:
-            print("[supabase-client] Could not decode key role")
-
-        # Create Supabase client
-        cls._instance = create_client(url, key)
-        cls._key = key
-
-        # Explicitly set the auth token on the PostgREST client to ensure
-        # the service role key is used for all database operations (bypasses RLS).
-        cls._instance.postgrest.auth(key)
-
-        cls._initialized = True
+        return get_supabase_client()
 
     @classmethod
     def reset(cls) -> None:
         """
         Reset the singleton instance (mainly for testing purposes)
         """
-        cls._instance = None
-        cls._initialized = False
-
-
-def get_supabase_client() -> Client:
-    """
-    Convenience function to get Supabase client instance
-
-    Returns:
-        Client: Supabase client instance
-    """
-    return SupabaseClient.get_instance()
\ No newline at end of file
+        get_supabase_client.cache_clear()
@@ -2,16 +2,25 @@
 POJO / DTO Package
 """
 
-from .profile import ProfileDTO
-from .message import MessageDTO
-from .conversation import ConversationDTO
-from .conference import ConferenceDTO
-from .conference_participant import ConferenceParticipantDTO
+from .profile import ProfileDTO, ProfileStruct, profile_dtos_to_dicts, rows_to_profile_structs
+from .message import MessageDTO, message_dtos_to_dicts
+from .conversation import ConversationDTO, conversation_dtos_to_dicts
+from .conference import ConferenceDTO, LocType, PriceType, conference_dtos_to_dicts
+from .conference_participant import ConferenceParticipantDTO, conference_participant_dtos_to_dicts
 
 __all__ = [
     "ProfileDTO",
+    "profile_dtos_to_dicts",
+    "ProfileStruct",
+    "rows_to_profile_structs",
     "MessageDTO",
+    "message_dtos_to_dicts",
     "ConversationDTO",
+    "conversation_dtos_to_dicts",
     "ConferenceDTO",
+    "conference_dtos_to_dicts",
+    "LocType",
+    "PriceType",
     "ConferenceParticipantDTO",
+    "conference_participant_dtos_to_dicts",
 ]
\ No newline at end of file
@@ -3,9 +3,48 @@ Conference DTO - Conference/Event data model
 """
 
 from datetime import datetime
-from typing import Optional
+from enum import IntEnum
+from functools import cached_property
+from typing import Any, List, Optional
 from uuid import UUID
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr, TypeAdapter
+
+
+class LocType(IntEnum):
+    """Interned location_type values"""
+    UNKNOWN = -1
+    IN_PERSON = 0
+    VIRTUAL = 1
+    HYBRID = 2
+
+
+class PriceType(IntEnum):
+    """Interned price_type values"""
+    UNKNOWN = -1
+    FREE = 0
+    PAID = 1
+
+
+_LOC_TYPES = {
+    "in-person": LocType.IN_PERSON,
+    "virtual": LocType.VIRTUAL,
+    "hybrid": LocType.HYBRID,
+}
+
+_PRICE_TYPES = {
+    "free": PriceType.FREE,
+    "paid": PriceType.PAID,
+}
+
+
+def _parse_iso(value: Optional[str]) -> Optional[datetime]:
+    """Parse an ISO date/datetime string, returning None if missing or invalid"""
+    if not value:
+        return None
+    try:
+        return datetime.fromisoformat(value)
+    except (ValueError, TypeError):
+        return None
 
 
 class ConferenceDTO(BaseModel):
@@ -48,55 +87,77 @@ class ConferenceDTO(BaseModel):
     # RSVP
     rsvp_questions: Optional[str] = Field(None, description="Additional RSVP questions (JSON or text)")
 
-    class Config:
-        """Pydantic configuration"""
-        from_attributes = True
-        json_encoders = {
-            datetime: lambda v: v.isoformat(),
-            UUID: lambda v: str(v),
-        }
+    model_config = ConfigDict(from_attributes=True, frozen=True, extra="ignore")
+
+    # Enum forms of location_type/price_type, set once on load
+    _loc: LocType = PrivateAttr(default=LocType.UNKNOWN)
+    _price: PriceType = PrivateAttr(default=PriceType.UNKNOWN)
+
+    def model_post_init(self, __context: Any) -> None:
+        """Intern string enums (also runs for model_construct / from_row)"""
+        self._loc = _LOC_TYPES.get(self.location_type, LocType.UNKNOWN)
+        self._price = _PRICE_TYPES.get(self.price_type, PriceType.UNKNOWN)
+
+    @classmethod
+    def from_row(cls, row: dict) -> "ConferenceDTO":
+        """
+        Build from a trusted database row without validation.
+        Note: Fields keep their wire types (e.g. UUIDs and timestamps stay strings)
+        """
+        return cls.model_construct(**row)
 
     def to_dict(self) -> dict:
-        """Convert to dictionary, excluding None values"""
-        return self.model_dump(exclude_none=True)
+        """Convert to a JSON-compatible dictionary, excluding None values"""
+        return self.model_dump(mode="json", exclude_none=True, warnings=False)
 
     def to_dict_with_none(self) -> dict:
-        """Convert to dictionary, including None values"""
-        return self.model_dump()
+        """Convert to a JSON-compatible dictionary, including None values"""
+        return self.model_dump(mode="json", warnings=False)
+
+    @cached_property
+    def _start_dt(self) -> Optional[datetime]:
+        """Parsed start_date, computed once per instance (None if missing/invalid)"""
+        return _parse_iso(self.start_date)
 
-    def is_active(self) -> bool:
+    @cached_property
+    def _end_dt(self) -> Optional[datetime]:
+        """Parsed end_date, computed once per instance (None if missing/invalid)"""
+        return _parse_iso(self.end_date)
+
+    def is_active(self, now: Optional[datetime] = None) -> bool:
         """
         Check if the conference is currently active
-        Note: Requires date strings to be in parseable format
+        Note: Requires date strings to be in parseable format; pass `now`
+        when checking many conferences to reuse a single timestamp
         """
-        if not self.start_date or not self.end_date:
+        start = self._start_dt
+        end = self._end_dt
+        if start is None or end is None:
             return False
 
+        if now is None:
+            now = datetime.now()
         try:
-            from datetime import datetime as dt
-            now = dt.now()
-            start = dt.fromisoformat(self.start_date)
-            end = dt.fromisoformat(self.end_date)
             return start <= now <= end
-        except (ValueError, TypeError):
-            # Return False if date format is invalid
+        except TypeError:
+            # Naive/aware mismatch between stored dates and `now`
             return False
 
     def is_free(self) -> bool:
         """Check if the conference is free"""
-        return self.price_type == "free" or self.price_amount is None or self.price_amount == 0
+        return self._price == PriceType.FREE or self.price_amount is None or self.price_amount == 0
 
     def is_virtual(self) -> bool:
         """Check if the conference is virtual"""
-        return self.location_type == "virtual"
+        return self._loc == LocType.VIRTUAL
 
     def is_hybrid(self) -> bool:
         """Check if the conference is hybrid (both in-person and virtual)"""
-        return self.location_type == "hybrid"
+        return self._loc == LocType.HYBRID
 
     def is_in_person(self) -> bool:
         """Check if the conference is in-person only"""
-        return self.location_type == "in-person"
+        return self._loc == LocType.IN_PERSON
 
     def has_capacity_limit(self) -> bool:
         """Check if there is a capacity limit"""
@@ -104,4 +165,12 @@ class ConferenceDTO(BaseModel):
 
     def requires_approval(self) -> bool:
         """Check if host approval is required"""
-        return self.require_approval is True
\ No newline at end of file
+        return self.require_approval is True
+
+
+_LIST_ADAPTER = TypeAdapter(List[ConferenceDTO])
+
+
+def conference_dtos_to_dicts(dtos: List[ConferenceDTO], exclude_none: bool = True) -> List[dict]:
+    """Bulk-serialize DTOs to JSON-compatible dicts in a single pydantic-core pass"""
+    return _LIST_ADAPTER.dump_python(dtos, mode="json", exclude_none=exclude_none, warnings=False)
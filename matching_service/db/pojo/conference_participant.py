@@ -3,9 +3,9 @@ Conference Participant DTO - Conference participant data model
 """
 
 from datetime import datetime
-from typing import Optional
+from typing import List, Optional
 from uuid import UUID
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
 
 
 class ConferenceParticipantDTO(BaseModel):
@@ -23,22 +23,32 @@ class ConferenceParticipantDTO(BaseModel):
     # Timestamp
     joined_at: Optional[datetime] = Field(None, description="Join timestamp")
 
-    class Config:
-        """Pydantic configuration"""
-        from_attributes = True
-        json_encoders = {
-            datetime: lambda v: v.isoformat(),
-            UUID: lambda v: str(v),
-        }
+    model_config = ConfigDict(from_attributes=True, frozen=True, extra="ignore")
+
+    @classmethod
+    def from_row(cls, row: dict) -> "ConferenceParticipantDTO":
+        """
+        Build from a trusted database row without validation.
+        Note: Fields keep their wire types (e.g. UUIDs and timestamps stay strings)
+        """
+        return cls.model_construct(**row)
 
     def to_dict(self) -> dict:
-        """Convert to dictionary, excluding None values"""
-        return self.model_dump(exclude_none=True)
+        """Convert to a JSON-compatible dictionary, excluding None values"""
+        return self.model_dump(mode="json", exclude_none=True, warnings=False)
 
     def to_dict_with_none(self) -> dict:
-        """Convert to dictionary, including None values"""
-        return self.model_dump()
+        """Convert to a JSON-compatible dictionary, including None values"""
+        return self.model_dump(mode="json", warnings=False)
 
     def get_composite_key(self) -> tuple[UUID, str]:
         """Get composite primary key"""
-        return (self.researcher_id, self.conference_id)
\ No newline at end of file
+        return (self.researcher_id, self.conference_id)
+
+
+_LIST_ADAPTER = TypeAdapter(List[ConferenceParticipantDTO])
+
+
+def conference_participant_dtos_to_dicts(dtos: List[ConferenceParticipantDTO], exclude_none: bool = True) -> List[dict]:
+    """Bulk-serialize DTOs to JSON-compatible dicts in a single pydantic-core pass"""
+    return _LIST_ADAPTER.dump_python(dtos, mode="json", exclude_none=exclude_none, warnings=False)
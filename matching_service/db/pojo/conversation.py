@@ -3,9 +3,9 @@ Conversation DTO - Conversation data model
 """
 
 from datetime import datetime
-from typing import Optional
+from typing import List, Optional
 from uuid import UUID
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
 
 
 class ConversationDTO(BaseModel):
@@ -26,21 +26,23 @@ class ConversationDTO(BaseModel):
     created_at: datetime = Field(..., description="Conversation creation timestamp")
     last_message_at: Optional[datetime] = Field(None, description="Last message timestamp")
 
-    class Config:
-        """Pydantic configuration"""
-        from_attributes = True
-        json_encoders = {
-            datetime: lambda v: v.isoformat(),
-            UUID: lambda v: str(v),
-        }
+    model_config = ConfigDict(from_attributes=True, frozen=True, extra="ignore")
+
+    @classmethod
+    def from_row(cls, row: dict) -> "ConversationDTO":
+        """
+        Build from a trusted database row without validation.
+        Note: Fields keep their wire types (e.g. UUIDs and timestamps stay strings)
+        """
+        return cls.model_construct(**row)
 
     def to_dict(self) -> dict:
-        """Convert to dictionary, excluding None values"""
-        return self.model_dump(exclude_none=True)
+        """Convert to a JSON-compatible dictionary, excluding None values"""
+        return self.model_dump(mode="json", exclude_none=True, warnings=False)
 
     def to_dict_with_none(self) -> dict:
-        """Convert to dictionary, including None values"""
-        return self.model_dump()
+        """Convert to a JSON-compatible dictionary, including None values"""
+        return self.model_dump(mode="json", warnings=False)
 
     def get_participants(self) -> tuple[UUID, UUID]:
         """Get participant ID tuple"""
@@ -48,12 +50,23 @@ class ConversationDTO(BaseModel):
 
     def has_participant(self, user_id: UUID) -> bool:
         """Check if a user is a participant in this conversation"""
-        return user_id in (self.participant1_id, self.participant2_id)
+        # Compare string forms: rows built via from_row keep UUIDs as strings
+        user_id = str(user_id)
+        return user_id in (str(self.participant1_id), str(self.participant2_id))
 
     def get_other_participant(self, user_id: UUID) -> Optional[UUID]:
         """Get the other participant's ID in this conversation"""
-        if user_id == self.participant1_id:
+        user_id = str(user_id)
+        if user_id == str(self.participant1_id):
             return self.participant2_id
-        elif user_id == self.participant2_id:
+        elif user_id == str(self.participant2_id):
             return self.participant1_id
-        return None
\ No newline at end of file
+        return None
+
+
+_LIST_ADAPTER = TypeAdapter(List[ConversationDTO])
+
+
+def conversation_dtos_to_dicts(dtos: List[ConversationDTO], exclude_none: bool = True) -> List[dict]:
+    """Bulk-serialize DTOs to JSON-compatible dicts in a single pydantic-core pass"""
+    return _LIST_ADAPTER.dump_python(dtos, mode="json", exclude_none=exclude_none, warnings=False)
@@ -3,9 +3,9 @@ Message DTO - Message data model
 """
 
 from datetime import datetime
-from typing import Optional
+from typing import List, Optional
 from uuid import UUID
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
 
 
 class MessageDTO(BaseModel):
@@ -29,18 +29,28 @@ class MessageDTO(BaseModel):
     # Timestamp
     created_at: datetime = Field(..., description="Creation timestamp")
 
-    class Config:
-        """Pydantic configuration"""
-        from_attributes = True
-        json_encoders = {
-            datetime: lambda v: v.isoformat(),
-            UUID: lambda v: str(v),
-        }
+    model_config = ConfigDict(from_attributes=True, frozen=True, extra="ignore")
+
+    @classmethod
+    def from_row(cls, row: dict) -> "MessageDTO":
+        """
+        Build from a trusted database row without validation.
+        Note: Fields keep their wire types (e.g. UUIDs and timestamps stay strings)
+        """
+        return cls.model_construct(**row)
 
     def to_dict(self) -> dict:
-        """Convert to dictionary, excluding None values"""
-        return self.model_dump(exclude_none=True)
+        """Convert to a JSON-compatible dictionary, excluding None values"""
+        return self.model_dump(mode="json", exclude_none=True, warnings=False)
 
     def to_dict_with_none(self) -> dict:
-        """Convert to dictionary, including None values"""
-        return self.model_dump()
\ No newline at end of file
+        """Convert to a JSON-compatible dictionary, including None values"""
+        return self.model_dump(mode="json", warnings=False)
+
+
+_LIST_ADAPTER = TypeAdapter(List[MessageDTO])
+
+
+def message_dtos_to_dicts(dtos: List[MessageDTO], exclude_none: bool = True) -> List[dict]:
+    """Bulk-serialize DTOs to JSON-compatible dicts in a single pydantic-core pass"""
+    return _LIST_ADAPTER.dump_python(dtos, mode="json", exclude_none=exclude_none, warnings=False)
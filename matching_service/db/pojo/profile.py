@@ -3,9 +3,11 @@ Profile DTO - User/Researcher profile data model
 """
 
 from datetime import datetime
+from functools import cached_property
 from typing import Optional, List, Union, Any
 from uuid import UUID
-from pydantic import BaseModel, Field, EmailStr
+import msgspec
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter, EmailStr
 
 
 class ProfileDTO(BaseModel):
@@ -64,18 +66,90 @@ class ProfileDTO(BaseModel):
     created_at: datetime = Field(..., description="Creation timestamp")
     updated_at: Optional[datetime] = Field(None, description="Last update timestamp")
 
-    class Config:
-        """Pydantic configuration"""
-        from_attributes = True  # Allow creation from dict/ORM objects
-        json_encoders = {
-            datetime: lambda v: v.isoformat(),
-            UUID: lambda v: str(v),
-        }
+    model_config = ConfigDict(from_attributes=True, frozen=True, extra="ignore")
+
+    @classmethod
+    def from_row(cls, row: dict) -> "ProfileDTO":
+        """
+        Build from a trusted database row without validation.
+        Note: Fields keep their wire types (e.g. UUIDs and timestamps stay strings)
+        """
+        return cls.model_construct(**row)
+
+    @cached_property
+    def created_at_iso(self) -> Optional[str]:
+        """created_at as ISO text, formatted once per DTO (from_row keeps the wire string)"""
+        value = self.created_at
+        if not value:
+            return None
+        return value if isinstance(value, str) else value.isoformat()
 
     def to_dict(self) -> dict:
-        """Convert to dictionary, excluding None values"""
-        return self.model_dump(exclude_none=True)
+        """Convert to a JSON-compatible dictionary, excluding None values"""
+        return self.model_dump(mode="json", exclude_none=True, warnings=False)
 
     def to_dict_with_none(self) -> dict:
-        """Convert to dictionary, including None values"""
-        return self.model_dump()
\ No newline at end of file
+        """Convert to a JSON-compatible dictionary, including None values"""
+        return self.model_dump(mode="json", warnings=False)
+
+
+_LIST_ADAPTER = TypeAdapter(List[ProfileDTO])
+
+
+def profile_dtos_to_dicts(dtos: List[ProfileDTO], exclude_none: bool = True) -> List[dict]:
+    """Bulk-serialize DTOs to JSON-compatible dicts in a single pydantic-core pass"""
+    return _LIST_ADAPTER.dump_python(dtos, mode="json", exclude_none=exclude_none, warnings=False)
+
+
+class ProfileStruct(msgspec.Struct, frozen=True, gc=False):
+    """
+    Lightweight read-only mirror of ProfileDTO for bulk matching reads
+
+    Decoded with msgspec.convert (typed, in C) and consumed by the profile
+    mapper through the same attribute names as ProfileDTO.
+    """
+
+    # id/timestamps stay as wire strings: matching keys users by str id and
+    # only needs ISO text, so skip the UUID/datetime parse + re-format.
+    id: str
+    created_at: str
+    name: Optional[str] = None
+    email: Optional[str] = None
+    bio: Optional[str] = None
+    occupation: Optional[str] = None
+    school: Optional[str] = None
+    institution: Optional[str] = None
+    major: Optional[str] = None
+    degree: Optional[str] = None
+    year: Optional[str] = None
+    expected_grad_date: Optional[str] = None
+    research_areas: Optional[Union[List[str], str]] = None
+    research_area: Optional[str] = None
+    interest_areas: Optional[Union[List[str], str]] = None
+    interests: Optional[Union[List[str], str]] = None
+    publications: Optional[Union[List[Any], str]] = None
+    company: Optional[str] = None
+    title: Optional[str] = None
+    work_experience_years: Optional[str] = None
+    current_skills: Optional[Union[List[str], str]] = None
+    hobbies: Optional[Union[List[str], str]] = None
+    github: Optional[str] = None
+    linkedin: Optional[str] = None
+    short_answer: Optional[str] = None
+    other_description: Optional[str] = None
+    user_embedding: Optional[Union[List[float], str]] = None
+    updated_at: Optional[str] = None
+
+    @property
+    def created_at_iso(self) -> Optional[str]:
+        """created_at is already the wire ISO string (same attribute as on ProfileDTO)"""
+        return self.created_at or None
+
+    def as_dto(self) -> ProfileDTO:
+        """Convert to a validated ProfileDTO (only where pydantic validation is needed)"""
+        return ProfileDTO.model_validate(msgspec.structs.asdict(self))
+
+
+def rows_to_profile_structs(rows: List[dict]) -> List[ProfileStruct]:
+    """Decode raw Supabase rows into ProfileStructs; unknown columns are ignored"""
+    return msgspec.convert(rows, List[ProfileStruct], strict=False)
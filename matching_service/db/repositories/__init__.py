@@ -2,7 +2,7 @@
 Repositories Package
 """
 
-from .base_repository import BaseRepository
+from .base_repository import BaseRepository, DatabaseError, cache_invalidate
 from .profile_repository import ProfileRepository
 from .message_repository import MessageRepository
 from .conversation_repository import ConversationRepository
@@ -11,6 +11,8 @@ from .conference_participant_repository import ConferenceParticipantRepository
 
 __all__ = [
     "BaseRepository",
+    "DatabaseError",
+    "cache_invalidate",
     "ProfileRepository",
     "MessageRepository",
     "ConversationRepository",
@@ -2,10 +2,22 @@
 Base Repository
 
 Provides common database operations for all repositories.
+
+Trust boundary: rows returned by Supabase come from our own Postgres schema
+and are hydrated by a generated constructor (no pydantic validation). Pass
+validate=True on read methods when the data may not match the DTO schema.
 """
 
-from typing import Any, Dict, List, Optional, Type, TypeVar, Generic
+import functools
+import re
+import threading
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Type, TypeVar, Generic
+from cachetools import TTLCache
+import orjson
+from postgrest.exceptions import APIError
+from postgrest.utils import sanitize_param
 from pydantic import BaseModel
+from pydantic_core import PydanticUndefined
 from supabase import Client
 from ..db_client import get_supabase_client
 
@@ -13,13 +25,199 @@ from ..db_client import get_supabase_client
 T = TypeVar('T', bound=BaseModel)
 
 
+# ---- Read cache (opt-in per repository via cache_reads) ----
+# Shared by all repositories; keyed by (table, method, args). Writes through a
+# repository drop that table's entries. DTOs are frozen, so hits share objects.
+_READ_CACHE: TTLCache = TTLCache(maxsize=1000, ttl=30)
+_READ_CACHE_LOCK = threading.Lock()
+_MISS = object()
+
+# PostgREST media type for a single bare object (what .maybe_single() sends)
+_SINGLE_OBJECT = "application/vnd.pgrst.object+json"
+# PGRST116 details for a single-object request that matched nothing
+# ("The result contains 0 rows"), as opposed to e.g. "contains 2 rows"
+_ZERO_ROWS = re.compile(r"\b0 rows")
+
+
+def cache_invalidate(table_name: Optional[str] = None) -> None:
+    """
+    Drop cached reads for one table (or every table when table_name is None)
+    
+    Args:
+        table_name: Table whose entries should be dropped
+    """
+    with _READ_CACHE_LOCK:
+        if table_name is None:
+            _READ_CACHE.clear()
+            return
+        for key in [key for key in _READ_CACHE.keys() if key[0] == table_name]:
+            _READ_CACHE.pop(key, None)
+
+
+def id_str(value: Any) -> str:
+    """
+    Stringify an ID once at the API boundary
+    
+    str values (the common case on the request path) pass through untouched;
+    UUIDs and other types are converted.
+    
+    Args:
+        value: ID as str, UUID or any str()-able value
+        
+    Returns:
+        The ID as a string
+    """
+    return value if type(value) is str else str(value)
+
+def _compile_builder(dto_class: Type[T]) -> Callable[[Dict[str, Any]], T]:
+    """
+    Generate a row -> DTO constructor specialised to one DTO class
+    
+    The generated function fills __dict__ from a dict literal of
+    d.get(field, default) lookups, so rows skip model_construct's generic
+    per-field loop. Missing required fields come back as None. Classes using
+    aliases, default factories or bare private attributes fall back to
+    model_construct.
+    
+    Args:
+        dto_class: DTO class to build
+        
+    Returns:
+        Function taking a raw row dict and returning a DTO
+    """
+    fields = dto_class.model_fields
+    if (
+        (dto_class.__private_attributes__ and not dto_class.__pydantic_post_init__)
+        or any(f.alias or f.validation_alias or f.default_factory for f in fields.values())
+    ):
+        construct = dto_class.model_construct
+        return lambda data: construct(**data)
+    
+    namespace: Dict[str, Any] = {
+        "_new": object.__new__,
+        "_set": object.__setattr__,
+        "_cls": dto_class,
+        "_names": frozenset(fields),
+    }
+    items = []
+    for i, (name, field) in enumerate(fields.items()):
+        default = field.default
+        namespace[f"_d{i}"] = None if default is PydanticUndefined else default
+        items.append(f"{name!r}: d.get({name!r}, _d{i})")
+    
+    source = (
+        "def _build(d):\n"
+        "    m = _new(_cls)\n"
+        f"    _set(m, '__dict__', {{{', '.join(items)}}})\n"
+        "    _set(m, '__pydantic_fields_set__', _names & d.keys())\n"
+        "    _set(m, '__pydantic_extra__', None)\n"
+        "    _set(m, '__pydantic_private__', None)\n"
+        + ("    m.model_post_init(None)\n" if dto_class.__pydantic_post_init__ else "")
+        + "    return m\n"
+    )
+    exec(compile(source, f"<{dto_class.__name__} builder>", "exec"), namespace)
+    return namespace["_build"]
+
+def _freeze(value: Any) -> Any:
+    """Turn dict/list arguments into hashable cache-key parts"""
+    if isinstance(value, dict):
+        return frozenset((k, _freeze(v)) for k, v in value.items())
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
+def cached_read(method: Callable) -> Callable:
+    """
+    Cache a repository read method in the shared TTL cache
+    
+    No-op unless the repository sets cache_reads = True. List and dict
+    results are copied on the way out so callers cannot mutate the cached
+    value.
+    """
+    name = method.__name__
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        if not self.cache_reads:
+            return method(self, *args, **kwargs)
+
+        key = (self.table_name, name, _freeze(args), _freeze(kwargs))
+        try:
+            with _READ_CACHE_LOCK:
+                hit = _READ_CACHE.get(key, _MISS)
+        except TypeError:
+            # Unhashable argument: bypass the cache
+            return method(self, *args, **kwargs)
+
+        if hit is _MISS:
+            hit = method(self, *args, **kwargs)
+            with _READ_CACHE_LOCK:
+                _READ_CACHE[key] = hit
+
+        if isinstance(hit, list):
+            return list(hit)
+        if isinstance(hit, dict):
+            return dict(hit)
+        return hit
+
+    return wrapper
+
+
+class DatabaseError(Exception):
+    """
+    Raised when a repository operation fails
+    
+    The message is only formatted when the error is rendered, so the
+    wrapping itself stays cheap.
+    
+    Attributes:
+        table: Table the operation ran against
+        op: Operation description (e.g. "filter records from")
+        cause: Underlying exception
+    """
+    
+    def __init__(self, table: str, op: str, cause: BaseException):
+        super().__init__(table, op, cause)
+        self.table = table
+        self.op = op
+        self.cause = cause
+    
+    def __str__(self) -> str:
+        return f"Failed to {self.op} {self.table}: {self.cause}"
+
+
+def _wrap_errors(op: str) -> Callable[[Callable], Callable]:
+    """
+    Re-raise failures from a repository method as DatabaseError
+    
+    Args:
+        op: Operation description used in the error message
+    """
+    def decorator(method: Callable) -> Callable:
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            try:
+                return method(self, *args, **kwargs)
+            except DatabaseError:
+                raise
+            except Exception as e:
+                raise DatabaseError(self.table_name, op, e) from e
+        return wrapper
+    return decorator
+
 class BaseRepository(Generic[T]):
     """
     Base repository class with common CRUD operations
     
     All specific repositories should inherit from this class.
+    Read-heavy, slowly changing tables can set cache_reads = True to serve
+    get_by_id/get_many_by_ids/filter/count (and other @cached_read methods)
+    from a 30s cache.
     """
     
+    cache_reads: bool = False
+    
     def __init__(self, table_name: str, dto_class: Type[T]):
         """
         Initialize base repository
@@ -31,95 +229,307 @@ class BaseRepository(Generic[T]):
         self.table_name = table_name
         self.dto_class = dto_class
         self.client: Client = get_supabase_client()
+        # Specialised once per repository; used by the per-row hot loop
+        self._construct = _compile_builder(dto_class)
+        # Pre-bound table builder factory: self._table() == client.table(table_name)
+        self._table = functools.partial(self.client.table, table_name)
+        # Table endpoint resolved once for the builder-free equality reads
+        self._rest_url = str(self.client.postgrest.base_url.joinpath(table_name))
     
-    def _convert_to_dto(self, data: Dict[str, Any]) -> T:
+    def _convert_to_dto(self, data: Dict[str, Any], validate: bool = False) -> T:
         """
         Convert raw database data to DTO object
         
+        Rows come from our own database and are trusted, so DTOs are built
+        by the generated constructor and skip pydantic validation.
+        
         Args:
             data: Raw data from database
+            validate: Run full pydantic validation instead
             
         Returns:
             DTO object
         """
-
-        return self.dto_class(**data)
+        if validate:
+            return self.dto_class.model_validate(data)
+        return self._construct(data)
     
-    def _convert_to_dto_list(self, data_list: List[Dict[str, Any]]) -> List[T]:
+    def _convert_to_dto_list(self, data_list: List[Dict[str, Any]], validate: bool = False) -> List[T]:
         """
         Convert list of raw database data to list of DTO objects
         
         Args:
             data_list: List of raw data from database
+            validate: Run full pydantic validation instead
             
         Returns:
             List of DTO objects
         """
-        return [self._convert_to_dto(data) for data in data_list]
+        if validate:
+            model_validate = self.dto_class.model_validate
+            return [model_validate(data) for data in data_list]
+        construct = self._construct
+        return [construct(data) for data in data_list]
+    
+    def _select_eq_raw(
+        self,
+        filters: Dict[str, Any],
+        columns: str = "*",
+        limit: Optional[int] = None,
+        single: bool = False,
+        order: Optional[str] = None
+    ) -> Any:
+        """
+        Run an equality-filtered SELECT straight on the PostgREST session
+        
+        Skips the query builder objects for hot single-key lookups; the request
+        matches what .select(columns).eq(...).order(...).limit(...) would send,
+        plus .maybe_single() when single is set.
+        
+        Args:
+            filters: Dictionary of field-value pairs (None values are skipped)
+            columns: PostgREST column list to select
+            limit: Maximum number of rows to return
+            single: Ask PostgREST for one bare object instead of an array
+            order: PostgREST order clause, e.g. "joined_at.asc"
+            
+        Returns:
+            List of raw row dictionaries, or one row dictionary (None if not
+            found) when single is set
+            
+        Raises:
+            APIError: If PostgREST rejects the request
+        """
+        params = {"select": columns}
+        for field, value in filters.items():
+            if value is not None:
+                params[field] = f"eq.{value}"
+        if order is not None:
+            params["order"] = order
+        if limit is not None:
+            params["limit"] = str(limit)
+        
+        postgrest = self.client.postgrest
+        headers = postgrest.headers
+        if single:
+            headers = {**headers, "Accept": _SINGLE_OBJECT}
+        response = postgrest.session.get(
+            self._rest_url,
+            params=params,
+            headers=headers,
+            auth=postgrest.basic_auth,
+        )
+        if not response.is_success:
+            try:
+                error = orjson.loads(response.content)
+            except orjson.JSONDecodeError:
+                error = {"message": response.text, "code": str(response.status_code)}
+            # A single-object request answers 406 (PGRST116) for both zero and
+            # several rows; only the zero-row case means "not found"
+            if single and response.status_code == 406 and _ZERO_ROWS.search(str(error.get("details", ""))):
+                return None
+            raise APIError(error)
+        # orjson over httpx's stdlib-json Response.json(); bytes go straight in
+        return orjson.loads(response.content)
+    
+    def _raw_filter(self, filters: Dict[str, Any], columns: str = "*") -> List[Dict[str, Any]]:
+        """
+        Filter records and return the raw row dictionaries (no DTO construction)
+        
+        List/tuple/set values become an IN filter; other values use equality.
+        
+        Args:
+            filters: Dictionary of field-value pairs (None values are skipped)
+            columns: PostgREST column list to select
+            
+        Returns:
+            List of raw row dictionaries
+        """
+        query = self._table().select(columns)
+        for field, value in filters.items():
+            if value is None:
+                continue
+            if isinstance(value, (list, tuple, set, frozenset)):
+                query = query.in_(field, list(value))
+            else:
+                query = query.eq(field, value)
+        return query.execute().data or []
     
-    def get_all(self, limit: Optional[int] = None, offset: int = 0) -> List[T]:
+    @staticmethod
+    def _apply_keyset(
+        query,
+        order_by: str,
+        ascending: bool,
+        cursor: Optional[Tuple[Any, Any]],
+        nullable: bool = False
+    ):
+        """
+        Order by (order_by, id) and resume strictly after a keyset cursor
+        
+        Replaces OFFSET paging: Postgres seeks straight to the cursor via an
+        index on (..., order_by, id) instead of scanning and discarding rows.
+        
+        NULLs sort as Postgres orders them by default (as the largest value:
+        last ascending, first descending). For a nullable column the cursor
+        condition also pages through and past the NULL rows.
+        
+        Args:
+            query: PostgREST select builder
+            order_by: Sort column
+            ascending: Sort direction
+            cursor: (order_by value, id) of the last row already seen
+            nullable: Whether order_by can be NULL
+            
+        Returns:
+            The query with ordering and the cursor condition applied
+        """
+        desc = not ascending
+        query = query.order(order_by, desc=desc, nullsfirst=desc).order("id", desc=desc)
+        if cursor is None:
+            return query
+        
+        value, last_id = cursor
+        op = "lt" if desc else "gt"
+        if value is None:
+            # Inside the NULL block: the rest of it, then (descending) every non-NULL row
+            in_nulls = f"and({order_by}.is.null,id.{op}.{last_id})"
+            if desc:
+                return query.or_(f"{in_nulls},{order_by}.not.is.null")
+            return query.or_(in_nulls)
+        
+        value = sanitize_param(value.isoformat() if hasattr(value, "isoformat") else value)
+        condition = f"{order_by}.{op}.{value},and({order_by}.eq.{value},id.{op}.{last_id})"
+        if nullable and not desc:
+            # NULL rows come after every value when ascending
+            condition += f",{order_by}.is.null"
+        return query.or_(condition)
+    
+    @staticmethod
+    def keyset_cursor(items: List[Any], order_by: str = "created_at") -> Optional[Tuple[Any, Any]]:
+        """
+        Build the cursor for the page after items
+        
+        Args:
+            items: Page of DTOs (or row dicts) returned by a keyset query
+            order_by: Sort column used for the page
+            
+        Returns:
+            (order_by value, id) of the last item, or None for an empty page
+        """
+        if not items:
+            return None
+        last = items[-1]
+        if isinstance(last, dict):
+            return last[order_by], last["id"]
+        return getattr(last, order_by), last.id
+    
+    @_wrap_errors("get all records from")
+    def get_all(
+        self,
+        limit: Optional[int] = None,
+        offset: int = 0,
+        validate: bool = False,
+        columns: str = "*"
+    ) -> List[T]:
         """
         Get all records from the table
         
         Args:
             limit: Maximum number of records to return (None for all)
             offset: Number of records to skip
+            validate: Run full pydantic validation on rows
+            columns: PostgREST column list to select (narrow lists build partial DTOs)
             
         Returns:
             List of DTO objects
             
         Raises:
-            Exception: If database query fails
+            DatabaseError: If database query fails
         """
-        try:
-            query = self.client.table(self.table_name).select("*")
-            
-            if limit is not None:
-                query = query.limit(limit)
-            
-            if offset > 0:
-                query = query.offset(offset)
-            
-            response = query.execute()
-            return self._convert_to_dto_list(response.data)
+        query = self._table().select(columns)
+        
+        if limit is not None:
+            query = query.limit(limit)
         
-        except Exception as e:
-            raise Exception(f"Failed to get all records from {self.table_name}: {str(e)}")
+        if offset > 0:
+            query = query.offset(offset)
+        
+        response = query.execute()
+        return self._convert_to_dto_list(response.data, validate)
     
-    def get_by_id(self, id_field: str, id_value: Any) -> Optional[T]:
+    @cached_read
+    @_wrap_errors("get record by id from")
+    def get_by_id(
+        self,
+        id_field: str,
+        id_value: Any,
+        validate: bool = False,
+        columns: str = "*"
+    ) -> Optional[T]:
         """
         Get a single record by ID
         
         Args:
             id_field: Name of the ID field (e.g., "id", "user_id")
             id_value: Value of the ID
+            validate: Run full pydantic validation on the row
+            columns: PostgREST column list to select (narrow lists build partial DTOs)
             
         Returns:
             DTO object if found, None otherwise
             
         Raises:
-            Exception: If database query fails
+            DatabaseError: If database query fails
         """
-        try:
-            response = self.client.table(self.table_name)\
-                .select("*")\
-                .eq(id_field, str(id_value))\
-                .execute()
-            
-            if response.data and len(response.data) > 0:
-                return self._convert_to_dto(response.data[0])
-            return None
+        row = self._select_eq_raw({id_field: id_str(id_value)}, columns, single=True)
+        
+        if row:
+            return self._convert_to_dto(row, validate)
+        return None
+    
+    @cached_read
+    @_wrap_errors("get records by id from")
+    def get_many_by_ids(
+        self,
+        id_field: str,
+        id_values: Iterable[Any],
+        columns: str = "*",
+        batch_size: int = 100
+    ) -> Dict[str, T]:
+        """
+        Get many records by ID with one IN query per batch
         
-        except Exception as e:
-            raise Exception(f"Failed to get record by {id_field} from {self.table_name}: {str(e)}")
+        Args:
+            id_field: Name of the ID field
+            id_values: ID values (duplicates are collapsed)
+            columns: PostgREST column list to select (must include id_field)
+            batch_size: Maximum IDs per request, keeps the URL bounded
+            
+        Returns:
+            Dictionary of ID string to DTO (missing IDs are omitted)
+            
+        Raises:
+            DatabaseError: If database query fails
+        """
+        ids = list(dict.fromkeys(id_str(value) for value in id_values))
+        construct = self._construct
+        found: Dict[str, T] = {}
+        for start in range(0, len(ids), batch_size):
+            for row in self._raw_filter({id_field: ids[start:start + batch_size]}, columns):
+                found[id_str(row[id_field])] = construct(row)
+        return found
     
+    @cached_read
+    @_wrap_errors("filter records from")
     def filter(
         self, 
         filters: Dict[str, Any], 
         limit: Optional[int] = None,
         offset: int = 0,
         order_by: Optional[str] = None,
-        ascending: bool = True
+        ascending: bool = True,
+        validate: bool = False,
+        columns: str = "*"
     ) -> List[T]:
         """
         Filter records by multiple conditions
@@ -130,38 +540,125 @@ class BaseRepository(Generic[T]):
             offset: Number of records to skip
             order_by: Field name to order by
             ascending: Sort order (True for ascending, False for descending)
+            validate: Run full pydantic validation on rows
+            columns: PostgREST column list to select (narrow lists build partial DTOs)
             
         Returns:
             List of DTO objects matching the filters
             
         Raises:
-            Exception: If database query fails
+            DatabaseError: If database query fails
         """
-        try:
-            query = self.client.table(self.table_name).select("*")
+        # Drop None filters once, in a comprehension
+        filters = {field: value for field, value in filters.items() if value is not None}
+        
+        # Common case: one equality filter, no offset
+        if len(filters) == 1 and offset <= 0 and not validate:
+            (field, value), = filters.items()
+            return self._filter_one(field, value, limit, order_by, ascending, columns)
+        
+        query = self._table().select(columns)
+        
+        # Apply filters
+        for field, value in filters.items():
+            query = query.eq(field, value)
+        
+        # Apply ordering
+        if order_by:
+            query = query.order(order_by, desc=not ascending)
+        
+        # Apply pagination
+        if limit is not None:
+            query = query.limit(limit)
+        
+        if offset > 0:
+            query = query.offset(offset)
+        
+        response = query.execute()
+        return self._convert_to_dto_list(response.data, validate)
+    
+    def _filter_one(
+        self,
+        field: str,
+        value: Any,
+        limit: Optional[int],
+        order_by: Optional[str],
+        ascending: bool,
+        columns: str
+    ) -> List[T]:
+        """
+        Fast path for filter() with a single equality condition
+        
+        Builds the query parameters in one pass and sends them on the
+        builder-free session path.
+        
+        Args:
+            field: Field to match
+            value: Value to match (not None)
+            limit: Maximum number of records to return
+            order_by: Field name to order by
+            ascending: Sort order
+            columns: PostgREST column list to select
+            
+        Returns:
+            List of DTO objects matching the filter
+        """
+        rows = self._select_eq_raw(
+            {field: value},
+            columns,
+            limit=limit,
+            order=f"{order_by}.{'asc' if ascending else 'desc'}" if order_by else None,
+        )
+        construct = self._construct
+        return [construct(row) for row in rows]
+    
+    def iter_filter(
+        self,
+        filters: Dict[str, Any],
+        batch_size: int = 500,
+        order_by: str = "id",
+        columns: str = "*"
+    ) -> Iterator[T]:
+        """
+        Iterate over filtered records using keyset pagination
+        
+        Rows are fetched batch_size at a time ordered by order_by, using the
+        last seen value as a "greater than" cursor. Memory stays bounded and a
+        caller that stops early never fetches the remaining rows.
+        
+        Args:
+            filters: Dictionary of field-value pairs for filtering
+            batch_size: Rows per request
+            order_by: Unique, sortable column used as the cursor
+            columns: PostgREST column list to select (must include order_by)
             
-            # Apply filters
+        Yields:
+            DTO objects in ascending order_by order
+            
+        Raises:
+            DatabaseError: If database query fails
+        """
+        construct = self._construct
+        cursor = None
+        while True:
+            query = self._table().select(columns)
             for field, value in filters.items():
                 if value is not None:
                     query = query.eq(field, value)
+            if cursor is not None:
+                query = query.gt(order_by, cursor)
+            try:
+                rows = query.order(order_by).limit(batch_size).execute().data or []
+            except Exception as e:
+                raise DatabaseError(self.table_name, "iterate records from", e) from e
             
-            # Apply ordering
-            if order_by:
-                query = query.order(order_by, desc=not ascending)
-            
-            # Apply pagination
-            if limit is not None:
-                query = query.limit(limit)
-            
-            if offset > 0:
-                query = query.offset(offset)
-            
-            response = query.execute()
-            return self._convert_to_dto_list(response.data)
-        
-        except Exception as e:
-            raise Exception(f"Failed to filter records from {self.table_name}: {str(e)}")
+            for row in rows:
+                yield construct(row)
+            if len(rows) < batch_size:
+                return
+            cursor = rows[-1][order_by]
     
+    @_wrap_errors("create record in")
     def create(self, data: Dict[str, Any]) -> T:
         """
         Create a new record
@@ -173,21 +670,19 @@ class BaseRepository(Generic[T]):
             Created DTO object
             
         Raises:
-            Exception: If database insert fails
+            DatabaseError: If database insert fails
         """
-        try:
-            response = self.client.table(self.table_name)\
-                .insert(data)\
-                .execute()
-            
-            if response.data and len(response.data) > 0:
-                return self._convert_to_dto(response.data[0])
-            
-            raise Exception("No data returned after insert")
+        response = self._table()\
+            .insert(data)\
+            .execute()
+        cache_invalidate(self.table_name)
         
-        except Exception as e:
-            raise Exception(f"Failed to create record in {self.table_name}: {str(e)}")
+        if response.data and len(response.data) > 0:
+            return self._convert_to_dto(response.data[0])
+        
+        raise Exception("No data returned after insert")
     
+    @_wrap_errors("update record in")
     def update(self, id_field: str, id_value: Any, data: Dict[str, Any]) -> Optional[T]:
         """
         Update an existing record
@@ -201,21 +696,19 @@ class BaseRepository(Generic[T]):
             Updated DTO object if successful, None if record not found
             
         Raises:
-            Exception: If database update fails
+            DatabaseError: If database update fails
         """
-        try:
-            response = self.client.table(self.table_name)\
-                .update(data)\
-                .eq(id_field, str(id_value))\
-                .execute()
-            
-            if response.data and len(response.data) > 0:
-                return self._convert_to_dto(response.data[0])
-            return None
+        response = self._table()\
+            .update(data)\
+            .eq(id_field, id_str(id_value))\
+            .execute()
+        cache_invalidate(self.table_name)
         
-        except Exception as e:
-            raise Exception(f"Failed to update record in {self.table_name}: {str(e)}")
+        if response.data and len(response.data) > 0:
+            return self._convert_to_dto(response.data[0])
+        return None
     
+    @_wrap_errors("delete record from")
     def delete(self, id_field: str, id_value: Any) -> bool:
         """
         Delete a record
@@ -228,43 +721,67 @@ class BaseRepository(Generic[T]):
             True if deleted successfully, False otherwise
             
         Raises:
-            Exception: If database delete fails
+            DatabaseError: If database delete fails
         """
-        try:
-            response = self.client.table(self.table_name)\
-                .delete()\
-                .eq(id_field, str(id_value))\
-                .execute()
-            
-            return response.data is not None and len(response.data) > 0
+        response = self._table()\
+            .delete()\
+            .eq(id_field, id_str(id_value))\
+            .execute()
+        cache_invalidate(self.table_name)
         
-        except Exception as e:
-            raise Exception(f"Failed to delete record from {self.table_name}: {str(e)}")
+        return response.data is not None and len(response.data) > 0
     
-    def count(self, filters: Optional[Dict[str, Any]] = None) -> int:
+    @cached_read
+    @_wrap_errors("count records in")
+    def count(self, filters: Optional[Dict[str, Any]] = None, exact: bool = True) -> int:
         """
         Count records in the table
         
         Args:
             filters: Optional dictionary of field-value pairs for filtering
+            exact: If False, ask PostgREST for an "estimated" count, which is
+                exact for small results and falls back to the planner's row
+                estimate instead of a full COUNT(*) for large ones
             
         Returns:
             Number of records matching the filters
             
         Raises:
-            Exception: If database query fails
+            DatabaseError: If database query fails
         """
-        try:
-            query = self.client.table(self.table_name).select("*", count="exact")
+        # HEAD request: PostgREST answers with only the Content-Range count,
+        # no row bodies. "*" rather than "id" since not every table has one.
+        query = self._table().select("*", count="exact" if exact else "estimated", head=True)
+        
+        # Apply filters if provided
+        if filters:
+            for field, value in filters.items():
+                if value is not None:
+                    query = query.eq(field, value)
+        
+        response = query.execute()
+        return response.count if response.count is not None else 0
+    
+    @cached_read
+    @_wrap_errors("check existence in")
+    def exists(self, filters: Dict[str, Any]) -> bool:
+        """
+        Check whether any record matches the filters
+        
+        Args:
+            filters: Dictionary of field-value pairs for filtering
             
-            # Apply filters if provided
-            if filters:
-                for field, value in filters.items():
-                    if value is not None:
-                        query = query.eq(field, value)
+        Returns:
+            True if at least one record matches, False otherwise
             
-            response = query.execute()
-            return response.count if response.count is not None else 0
+        Raises:
+            DatabaseError: If database query fails
+        """
+        # HEAD + count: only the Content-Range header comes back, no row or DTO
+        query = self._table().select("*", count="exact", head=True)
+        for field, value in filters.items():
+            if value is not None:
+                query = query.eq(field, value)
         
-        except Exception as e:
-            raise Exception(f"Failed to count records in {self.table_name}: {str(e)}")
+        response = query.execute()
+        return bool(response.count)
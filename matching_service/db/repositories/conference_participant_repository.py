@@ -4,9 +4,10 @@ Conference Participant Repository
 Handles all database operations for conference participants (many-to-many relationship).
 """
 
-from typing import List, Optional
+from typing import Dict, Iterator, List, Optional, Set
 from uuid import UUID
-from .base_repository import BaseRepository
+from postgrest.exceptions import APIError
+from .base_repository import BaseRepository, cache_invalidate, cached_read, id_str
 from ..pojo.conference_participant import ConferenceParticipantDTO
 
 
@@ -17,6 +18,9 @@ class ConferenceParticipantRepository(BaseRepository[ConferenceParticipantDTO]):
     Note: This table uses a composite key (researcher_id, conference_id)
     """
     
+    # Participation is read-heavy; reads are served from the shared 30s cache
+    cache_reads = True
+    
     def __init__(self):
         """Initialize conference participant repository"""
         super().__init__("conference_participants", ConferenceParticipantDTO)
@@ -36,11 +40,15 @@ class ConferenceParticipantRepository(BaseRepository[ConferenceParticipantDTO]):
         Returns:
             ConferenceParticipantDTO if found, None otherwise
         """
-        participants = self.filter({
-            "researcher_id": researcher_id,
-            "conference_id": conference_id
-        }, limit=1)
-        return participants[0] if participants else None
+        try:
+            row = self._select_eq_raw({
+                "researcher_id": id_str(researcher_id),
+                "conference_id": conference_id
+            }, single=True)
+            return self._convert_to_dto(row) if row else None
+        
+        except Exception as e:
+            raise Exception(f"Failed to get participant from {self.table_name}: {str(e)}")
     
     def get_conference_participants(
         self, 
@@ -64,6 +72,51 @@ class ConferenceParticipantRepository(BaseRepository[ConferenceParticipantDTO]):
             ascending=True
         )
     
+    def iter_conference_participants(
+        self,
+        conference_id: str,
+        batch_size: int = 500
+    ) -> Iterator[ConferenceParticipantDTO]:
+        """
+        Stream all participants of a conference in bounded batches
+        
+        Keyset-paginated on researcher_id (unique within a conference), so
+        rows come back in researcher_id order rather than join order.
+        
+        Args:
+            conference_id: Conference ID
+            batch_size: Rows per request
+            
+        Yields:
+            ConferenceParticipantDTO objects
+        """
+        return self.iter_filter(
+            {"conference_id": conference_id},
+            batch_size=batch_size,
+            order_by="researcher_id"
+        )
+    
+    @cached_read
+    def get_conference_participant_ids(self, conference_id: str) -> List[str]:
+        """
+        Get the researcher IDs registered for a conference
+        
+        Selects only researcher_id and skips DTO construction, for callers
+        that just need the participant pool.
+        
+        Args:
+            conference_id: Conference ID
+            
+        Returns:
+            List of researcher ID strings
+        """
+        try:
+            rows = self._select_eq_raw({"conference_id": conference_id}, columns="researcher_id")
+            return [row["researcher_id"] for row in rows]
+        
+        except Exception as e:
+            raise Exception(f"Failed to get participant ids from {self.table_name}: {str(e)}")
+    
     def get_researcher_conferences(
         self, 
         researcher_id: UUID,
@@ -97,8 +150,10 @@ class ConferenceParticipantRepository(BaseRepository[ConferenceParticipantDTO]):
         Returns:
             True if researcher is a participant, False otherwise
         """
-        participant = self.get_by_composite_key(researcher_id, conference_id)
-        return participant is not None
+        return self.exists({
+            "researcher_id": id_str(researcher_id),
+            "conference_id": conference_id
+        })
     
     def add_participant(
         self, 
@@ -118,17 +173,30 @@ class ConferenceParticipantRepository(BaseRepository[ConferenceParticipantDTO]):
         Raises:
             Exception: If participant already exists or creation fails
         """
-        # Check if already exists
-        if self.is_participant(researcher_id, conference_id):
-            raise Exception(
-                f"Researcher {researcher_id} is already a participant in conference {conference_id}"
-            )
-        
         participant_data = {
-            "researcher_id": str(researcher_id),
+            "researcher_id": id_str(researcher_id),
             "conference_id": conference_id
         }
-        return self.create(participant_data)
+        try:
+            # INSERT ... ON CONFLICT DO NOTHING: the primary key enforces uniqueness
+            # atomically and a duplicate comes back as an empty result.
+            response = self._table()\
+                .upsert(
+                    participant_data,
+                    on_conflict="conference_id,researcher_id",
+                    ignore_duplicates=True
+                )\
+                .execute()
+            cache_invalidate(self.table_name)
+        
+        except Exception as e:
+            raise Exception(f"Failed to add participant: {str(e)}")
+        
+        if not response.data:
+            raise Exception(
+                f"Researcher {researcher_id} is already a participant in conference {conference_id}"
+            )
+        return self._convert_to_dto(response.data[0])
     
     def remove_participant(self, researcher_id: UUID, conference_id: str) -> bool:
         """
@@ -142,11 +210,12 @@ class ConferenceParticipantRepository(BaseRepository[ConferenceParticipantDTO]):
             True if removed successfully, False otherwise
         """
         try:
-            response = self.client.table(self.table_name)\
+            response = self._table()\
                 .delete()\
-                .eq("researcher_id", str(researcher_id))\
+                .eq("researcher_id", id_str(researcher_id))\
                 .eq("conference_id", conference_id)\
                 .execute()
+            cache_invalidate(self.table_name)
             
             return response.data is not None and len(response.data) > 0
         
@@ -193,16 +262,26 @@ class ConferenceParticipantRepository(BaseRepository[ConferenceParticipantDTO]):
             List of researcher UUIDs
         """
         try:
-            # Get participants from both conferences
-            participants1 = self.get_conference_participants(conference_id1)
-            participants2 = self.get_conference_participants(conference_id2)
-            
-            # Find common researcher IDs
-            ids1 = {p.researcher_id for p in participants1}
-            ids2 = {p.researcher_id for p in participants2}
-            
-            common_ids = ids1.intersection(ids2)
-            return list(common_ids)
+            try:
+                # Intersect in Postgres: one round-trip, only the shared ids come back
+                response = self.client.rpc(
+                    "get_common_participants",
+                    {"c1": conference_id1, "c2": conference_id2}
+                ).execute()
+                common_ids = {row["researcher_id"] for row in response.data or []}
+            except APIError:
+                # RPC not deployed yet: fall back to one IN query and bucket here
+                rows = self._raw_filter(
+                    {"conference_id": {conference_id1, conference_id2}},
+                    columns="researcher_id,conference_id"
+                )
+                buckets: Dict[str, Set[str]] = {conference_id1: set(), conference_id2: set()}
+                for row in rows:
+                    buckets[row["conference_id"]].add(row["researcher_id"])
+                # C-level set intersection over plain strings; no DTOs on this path
+                common_ids = buckets[conference_id1] & buckets[conference_id2]
+
+            return [UUID(researcher_id) for researcher_id in common_ids]
         
         except Exception as e:
             raise Exception(f"Failed to get common participants: {str(e)}")
@@ -4,17 +4,40 @@ Conference Repository
 Handles all database operations for conferences/events.
 """
 
+import time
+from datetime import date
 from typing import List, Optional
 from uuid import UUID
-from .base_repository import BaseRepository
+from .base_repository import BaseRepository, _wrap_errors, cached_read
 from ..pojo.conference import ConferenceDTO
 
 
+# [minute bucket, ISO date] - today's date is recomputed at most once a minute
+_today_cache = [-1.0, ""]
+
+
+def _today_iso() -> str:
+    """
+    Get today's local date as YYYY-MM-DD, refreshed at most once a minute
+    
+    Returns:
+        ISO date string
+    """
+    minute = time.monotonic() // 60
+    if _today_cache[0] != minute:
+        _today_cache[1] = date.today().isoformat()
+        _today_cache[0] = minute
+    return _today_cache[1]
+
+
 class ConferenceRepository(BaseRepository[ConferenceDTO]):
     """
     Repository for conference-related database operations
     """
     
+    # Conferences are read-heavy and change slowly
+    cache_reads = True
+    
     def __init__(self):
         """Initialize conference repository"""
         super().__init__("conferences", ConferenceDTO)
@@ -49,6 +72,7 @@ class ConferenceRepository(BaseRepository[ConferenceDTO]):
             ascending=False
         )
     
+    @_wrap_errors("search by location in")
     def get_by_location(self, location: str, limit: Optional[int] = None) -> List[ConferenceDTO]:
         """
         Get conferences by location (partial match)
@@ -60,21 +84,18 @@ class ConferenceRepository(BaseRepository[ConferenceDTO]):
         Returns:
             List of ConferenceDTO objects
         """
-        try:
-            query = self.client.table(self.table_name)\
-                .select("*")\
-                .ilike("location", f"%{location}%")\
-                .order("created_at", desc=True)
-            
-            if limit:
-                query = query.limit(limit)
-            
-            response = query.execute()
-            return self._convert_to_dto_list(response.data)
+        query = self._table()\
+            .select("*")\
+            .ilike("location", f"%{location}%")\
+            .order("created_at", desc=True)
         
-        except Exception as e:
-            raise Exception(f"Failed to search by location: {str(e)}")
+        if limit:
+            query = query.limit(limit)
+        
+        response = query.execute()
+        return self._convert_to_dto_list(response.data)
     
+    @_wrap_errors("search by name in")
     def search_by_name(self, name: str, limit: Optional[int] = None) -> List[ConferenceDTO]:
         """
         Search conferences by name (case-insensitive partial match)
@@ -86,21 +107,18 @@ class ConferenceRepository(BaseRepository[ConferenceDTO]):
         Returns:
             List of ConferenceDTO objects
         """
-        try:
-            query = self.client.table(self.table_name)\
-                .select("*")\
-                .ilike("name", f"%{name}%")\
-                .order("created_at", desc=True)
-            
-            if limit:
-                query = query.limit(limit)
-            
-            response = query.execute()
-            return self._convert_to_dto_list(response.data)
+        query = self._table()\
+            .select("*")\
+            .ilike("name", f"%{name}%")\
+            .order("created_at", desc=True)
         
-        except Exception as e:
-            raise Exception(f"Failed to search by name: {str(e)}")
+        if limit:
+            query = query.limit(limit)
+        
+        response = query.execute()
+        return self._convert_to_dto_list(response.data)
     
+    @cached_read
     def get_upcoming_conferences(self, limit: Optional[int] = None) -> List[ConferenceDTO]:
         """
         Get upcoming conferences (start_date in the future)
@@ -114,11 +132,9 @@ class ConferenceRepository(BaseRepository[ConferenceDTO]):
             List of ConferenceDTO objects
         """
         try:
-            from datetime import datetime
-            
-            today = datetime.now().strftime("%Y-%m-%d")
+            today = _today_iso()
             
-            query = self.client.table(self.table_name)\
+            query = self._table()\
                 .select("*")\
                 .gte("start_date", today)\
                 .order("start_date", desc=False)
@@ -132,6 +148,7 @@ class ConferenceRepository(BaseRepository[ConferenceDTO]):
         except Exception as e:
             raise Exception(f"Failed to get upcoming conferences: {str(e)}")
     
+    @cached_read
     def get_past_conferences(self, limit: Optional[int] = None) -> List[ConferenceDTO]:
         """
         Get past conferences (end_date in the past)
@@ -143,11 +160,9 @@ class ConferenceRepository(BaseRepository[ConferenceDTO]):
             List of ConferenceDTO objects
         """
         try:
-            from datetime import datetime
-            
-            today = datetime.now().strftime("%Y-%m-%d")
+            today = _today_iso()
             
-            query = self.client.table(self.table_name)\
+            query = self._table()\
                 .select("*")\
                 .lt("end_date", today)\
                 .order("end_date", desc=True)
@@ -218,7 +233,7 @@ class ConferenceRepository(BaseRepository[ConferenceDTO]):
             List of ConferenceDTO objects
         """
         try:
-            query = self.client.table(self.table_name).select("*")
+            query = self._table().select("*")
 
             if min_price is not None:
                 query = query.gte("price_amount", min_price)
@@ -253,7 +268,7 @@ class ConferenceRepository(BaseRepository[ConferenceDTO]):
             List of ConferenceDTO objects
         """
         try:
-            query = self.client.table(self.table_name)\
+            query = self._table()\
                 .select("*")\
                 .not_.is_("capacity", "null")
 
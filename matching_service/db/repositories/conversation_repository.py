@@ -4,12 +4,20 @@ Conversation Repository
 Handles all database operations for conversations.
 """
 
-from typing import List, Optional
+from datetime import datetime, timezone
+from typing import Any, Iterator, List, Optional, Tuple
 from uuid import UUID
-from .base_repository import BaseRepository
+from postgrest.exceptions import APIError
+from .base_repository import BaseRepository, cache_invalidate, id_str
 from ..pojo.conversation import ConversationDTO
 
 
+def _ordered_pair(user1_id: UUID, user2_id: UUID) -> Tuple[str, str]:
+    """Return the two participant IDs in canonical (ascending) order"""
+    first, second = id_str(user1_id), id_str(user2_id)
+    return (first, second) if first <= second else (second, first)
+
+
 class ConversationRepository(BaseRepository[ConversationDTO]):
     """
     Repository for conversation-related database operations
@@ -31,27 +39,33 @@ class ConversationRepository(BaseRepository[ConversationDTO]):
         """
         return super().get_by_id("id", conversation_id)
     
-    def get_by_participants(self, user1_id: UUID, user2_id: UUID) -> Optional[ConversationDTO]:
+    def get_by_participants(
+        self,
+        user1_id: UUID,
+        user2_id: UUID,
+        columns: str = "*"
+    ) -> Optional[ConversationDTO]:
         """
         Get conversation between two specific users
         
-        Note: Checks both participant1_id and participant2_id combinations
+        Participants are stored in canonical order (participant1_id <
+        participant2_id), so this is a single seek on the unique
+        (participant1_id, participant2_id) index.
         
         Args:
             user1_id: First user's ID
             user2_id: Second user's ID
+            columns: PostgREST column list to select (narrow lists build partial DTOs)
             
         Returns:
             ConversationDTO if found, None otherwise
         """
+        first, second = _ordered_pair(user1_id, user2_id)
         try:
-            # Try both combinations since we don't know the order
-            response = self.client.table(self.table_name)\
-                .select("*")\
-                .or_(
-                    f"and(participant1_id.eq.{user1_id},participant2_id.eq.{user2_id}),"
-                    f"and(participant1_id.eq.{user2_id},participant2_id.eq.{user1_id})"
-                )\
+            response = self._table()\
+                .select(columns)\
+                .eq("participant1_id", first)\
+                .eq("participant2_id", second)\
                 .limit(1)\
                 .execute()
             
@@ -66,29 +80,40 @@ class ConversationRepository(BaseRepository[ConversationDTO]):
         self, 
         user_id: UUID,
         limit: Optional[int] = None,
-        offset: int = 0
+        offset: int = 0,
+        cursor: Optional[Tuple[Any, int]] = None,
+        columns: str = "*"
     ) -> List[ConversationDTO]:
         """
         Get all conversations for a specific user
         
+        Prefer cursor over offset for paging: pass
+        keyset_cursor(previous_page, "last_message_at") to continue.
+        
         Args:
             user_id: User's ID
             limit: Maximum number of conversations to return
-            offset: Number of conversations to skip
+            offset: Number of conversations to skip (ignored when cursor is given)
+            cursor: (last_message_at, id) of the last conversation of the previous page
+            columns: PostgREST column list to select (keep id and last_message_at for paging)
             
         Returns:
-            List of ConversationDTO objects, ordered by last_message_at (newest first)
+            List of ConversationDTO objects, ordered by last_message_at (newest
+            first, conversations without messages before the rest)
         """
         try:
-            query = self.client.table(self.table_name)\
-                .select("*")\
-                .or_(f"participant1_id.eq.{user_id},participant2_id.eq.{user_id}")\
-                .order("last_message_at", desc=True)
+            query = self._table()\
+                .select(columns)\
+                .or_(f"participant1_id.eq.{user_id},participant2_id.eq.{user_id}")
+            
+            # (last_message_at, id) order with or without a cursor, so pages
+            # stay stable when several conversations share a timestamp
+            query = self._apply_keyset(query, "last_message_at", False, cursor, nullable=True)
             
             if limit:
                 query = query.limit(limit)
             
-            if offset > 0:
+            if offset > 0 and cursor is None:
                 query = query.offset(offset)
             
             response = query.execute()
@@ -97,10 +122,38 @@ class ConversationRepository(BaseRepository[ConversationDTO]):
         except Exception as e:
             raise Exception(f"Failed to get user conversations: {str(e)}")
     
+    def iter_user_conversations(
+        self,
+        user_id: UUID,
+        page_size: int = 500,
+        columns: str = "*"
+    ) -> Iterator[ConversationDTO]:
+        """
+        Stream a user's conversations, newest first, in keyset pages
+        
+        Args:
+            user_id: User's ID
+            page_size: Rows per request
+            columns: PostgREST column list to select (must include id and last_message_at)
+            
+        Yields:
+            ConversationDTO objects
+        """
+        cursor = None
+        while True:
+            page = self.get_user_conversations(
+                user_id, limit=page_size, cursor=cursor, columns=columns
+            )
+            yield from page
+            if len(page) < page_size:
+                return
+            cursor = self.keyset_cursor(page, "last_message_at")
+    
     def get_active_conversations(
         self, 
         user_id: UUID,
-        limit: Optional[int] = None
+        limit: Optional[int] = None,
+        columns: str = "*"
     ) -> List[ConversationDTO]:
         """
         Get active conversations for a user (those with recent messages)
@@ -108,13 +161,14 @@ class ConversationRepository(BaseRepository[ConversationDTO]):
         Args:
             user_id: User's ID
             limit: Maximum number of conversations to return
+            columns: PostgREST column list to select (narrow lists build partial DTOs)
             
         Returns:
             List of ConversationDTO objects with recent activity
         """
         try:
-            query = self.client.table(self.table_name)\
-                .select("*")\
+            query = self._table()\
+                .select(columns)\
                 .or_(f"participant1_id.eq.{user_id},participant2_id.eq.{user_id}")\
                 .not_.is_("last_message_at", "null")\
                 .order("last_message_at", desc=True)
@@ -132,6 +186,8 @@ class ConversationRepository(BaseRepository[ConversationDTO]):
         """
         Create a new conversation between two users
         
+        The pair is stored in canonical order; see get_by_participants.
+        
         Args:
             participant1_id: First participant's ID
             participant2_id: Second participant's ID
@@ -139,9 +195,10 @@ class ConversationRepository(BaseRepository[ConversationDTO]):
         Returns:
             Created ConversationDTO
         """
+        first, second = _ordered_pair(participant1_id, participant2_id)
         conversation_data = {
-            "participant1_id": str(participant1_id),
-            "participant2_id": str(participant2_id)
+            "participant1_id": first,
+            "participant2_id": second
         }
         return self.create(conversation_data)
     
@@ -149,19 +206,30 @@ class ConversationRepository(BaseRepository[ConversationDTO]):
         """
         Update the last_message_at timestamp to current time
         
+        Message inserts already bump last_message_at through the
+        touch_conversation_on_message trigger; this is for manual touches.
+        The timestamp is taken from the database clock, not the app server.
+        
         Args:
             conversation_id: Conversation ID
             
         Returns:
             Updated ConversationDTO if successful, None otherwise
         """
-        from datetime import datetime
-        
-        return self.update(
-            "id", 
-            conversation_id, 
-            {"last_message_at": datetime.now().isoformat()}
-        )
+        try:
+            response = self.client.rpc(
+                "touch_conversation",
+                {"conversation_id": conversation_id}
+            ).execute()
+        except APIError:
+            # RPC not deployed yet: fall back to a UTC timestamp from here
+            return self.update(
+                "id",
+                conversation_id,
+                {"last_message_at": datetime.now(timezone.utc).isoformat()}
+            )
+        cache_invalidate(self.table_name)
+        return self._convert_to_dto(response.data[0]) if response.data else None
     
     def delete_conversation(self, conversation_id: int) -> bool:
         """
@@ -175,19 +243,20 @@ class ConversationRepository(BaseRepository[ConversationDTO]):
         """
         return super().delete("id", conversation_id)
     
-    def count_user_conversations(self, user_id: UUID) -> int:
+    def count_user_conversations(self, user_id: UUID, exact: bool = False) -> int:
         """
         Count total conversations for a user
         
         Args:
             user_id: User's ID
+            exact: If False, large counts may be a planner estimate
             
         Returns:
             Number of conversations
         """
         try:
-            response = self.client.table(self.table_name)\
-                .select("*", count="exact")\
+            response = self._table()\
+                .select("*", count="exact" if exact else "estimated", head=True)\
                 .or_(f"participant1_id.eq.{user_id},participant2_id.eq.{user_id}")\
                 .execute()
             
@@ -4,9 +4,9 @@ Message Repository
 Handles all database operations for messages.
 """
 
-from typing import List, Optional
+from typing import Any, Iterable, Iterator, List, Optional, Tuple
 from uuid import UUID
-from .base_repository import BaseRepository
+from .base_repository import BaseRepository, _wrap_errors, id_str
 from ..pojo.message import MessageDTO
 
 
@@ -31,37 +31,69 @@ class MessageRepository(BaseRepository[MessageDTO]):
         """
         return super().get_by_id("id", message_id)
     
+    def get_many(self, message_ids: Iterable[int], columns: str = "*") -> List[MessageDTO]:
+        """
+        Get multiple messages by ID, one round-trip per 100 IDs
+        
+        Args:
+            message_ids: Message IDs
+            columns: PostgREST column list to select (must include id)
+            
+        Returns:
+            List of MessageDTO objects in input order (missing IDs are omitted)
+            
+        Raises:
+            DatabaseError: If database query fails
+        """
+        ids = [id_str(message_id) for message_id in message_ids]
+        found = self.get_many_by_ids("id", ids, columns)
+        return [found[i] for i in dict.fromkeys(ids) if i in found]
+    
     def get_by_conversation(
         self, 
         conversation_id: int, 
         limit: Optional[int] = None,
         offset: int = 0,
-        ascending: bool = True
+        ascending: bool = True,
+        cursor: Optional[Tuple[Any, int]] = None,
+        columns: str = "*"
     ) -> List[MessageDTO]:
         """
         Get all messages in a conversation
         
+        Prefer cursor over offset for paging: pass keyset_cursor(previous_page)
+        to continue after the last message seen.
+        
         Args:
             conversation_id: Conversation ID
             limit: Maximum number of messages to return
-            offset: Number of messages to skip
+            offset: Number of messages to skip (ignored when cursor is given)
             ascending: Sort order by created_at (True for oldest first, False for newest first)
+            cursor: (created_at, id) of the last message of the previous page
+            columns: PostgREST column list to select (keep id and created_at for paging)
             
         Returns:
             List of MessageDTO objects
         """
+        if cursor is not None:
+            return self._keyset_page(
+                {"conversation_id": conversation_id}, limit, ascending, cursor, columns
+            )
         return self.filter(
             filters={"conversation_id": conversation_id},
             limit=limit,
             offset=offset,
             order_by="created_at",
-            ascending=ascending
+            ascending=ascending,
+            columns=columns
         )
     
     def get_by_sender(
         self, 
         sender_id: UUID, 
-        limit: Optional[int] = None
+        limit: Optional[int] = None,
+        cursor: Optional[Tuple[Any, int]] = None,
+        columns: str = "*"
     ) -> List[MessageDTO]:
         """
         Get all messages sent by a specific user
@@ -69,17 +101,84 @@ class MessageRepository(BaseRepository[MessageDTO]):
         Args:
             sender_id: Sender user ID
             limit: Maximum number of messages to return
+            cursor: (created_at, id) of the last message of the previous page
+            columns: PostgREST column list to select (keep id and created_at for paging)
             
         Returns:
             List of MessageDTO objects
         """
+        if cursor is not None:
+            return self._keyset_page({"sender_id": sender_id}, limit, False, cursor, columns)
         return self.filter(
             filters={"sender_id": sender_id},
             limit=limit,
             order_by="created_at",
-            ascending=False
+            ascending=False,
+            columns=columns
         )
     
+    @_wrap_errors("page messages from")
+    def _keyset_page(
+        self,
+        filters: dict,
+        limit: Optional[int],
+        ascending: bool,
+        cursor: Optional[Tuple[Any, int]],
+        columns: str = "*"
+    ) -> List[MessageDTO]:
+        """
+        Fetch one (created_at, id) keyset page of messages
+        
+        Args:
+            filters: Equality filters
+            limit: Page size
+            ascending: Sort order by created_at
+            cursor: (created_at, id) of the last message already seen, None for the first page
+            columns: PostgREST column list to select
+            
+        Returns:
+            List of MessageDTO objects
+        """
+        query = self._table().select(columns)
+        for field, value in filters.items():
+            query = query.eq(field, value)
+        query = self._apply_keyset(query, "created_at", ascending, cursor)
+        if limit:
+            query = query.limit(limit)
+        return self._convert_to_dto_list(query.execute().data)
+    
+    def iter_by_conversation(
+        self,
+        conversation_id: int,
+        page_size: int = 500,
+        ascending: bool = True,
+        columns: str = "*"
+    ) -> Iterator[MessageDTO]:
+        """
+        Stream a conversation's messages in keyset pages
+        
+        Memory stays bounded by page_size, and a caller that stops early
+        never fetches the remaining pages.
+        
+        Args:
+            conversation_id: Conversation ID
+            page_size: Rows per request
+            ascending: Sort order by created_at
+            columns: PostgREST column list to select (must include id and created_at)
+            
+        Yields:
+            MessageDTO objects
+        """
+        cursor = None
+        while True:
+            page = self._keyset_page(
+                {"conversation_id": conversation_id}, page_size, ascending, cursor, columns
+            )
+            yield from page
+            if len(page) < page_size:
+                return
+            cursor = self.keyset_cursor(page)
+    
     def get_system_messages(
         self, 
         conversation_id: int,
@@ -115,12 +214,10 @@ class MessageRepository(BaseRepository[MessageDTO]):
         Returns:
             MessageDTO if found, None otherwise
         """
-        messages = self.get_by_conversation(
-            conversation_id=conversation_id,
-            limit=1,
-            ascending=False
+        return next(
+            self.iter_by_conversation(conversation_id, page_size=1, ascending=False),
+            None
         )
-        return messages[0] if messages else None
     
     def create_message(self, message_data: dict) -> MessageDTO:
         """
@@ -146,14 +243,15 @@ class MessageRepository(BaseRepository[MessageDTO]):
         """
         return super().delete("id", message_id)
     
-    def count_messages_in_conversation(self, conversation_id: int) -> int:
+    def count_messages_in_conversation(self, conversation_id: int, exact: bool = False) -> int:
         """
         Count total messages in a conversation
         
         Args:
             conversation_id: Conversation ID
+            exact: If False, large counts may be a planner estimate
             
         Returns:
             Number of messages
         """
-        return self.count(filters={"conversation_id": conversation_id})
+        return self.count(filters={"conversation_id": conversation_id}, exact=exact)
@@ -4,10 +4,16 @@ Profile Repository
 Handles all database operations for user profiles.
 """
 
-from typing import List, Optional
+from typing import Iterable, Iterator, List, Mapping, Optional, Sequence, Set, Tuple
 from uuid import UUID
-from .base_repository import BaseRepository
-from ..pojo.profile import ProfileDTO
+from postgrest.exceptions import APIError
+from .base_repository import BaseRepository, _wrap_errors, id_str
+from ..pojo.profile import ProfileDTO, ProfileStruct, rows_to_profile_structs
+
+
+def _vector_literal(embedding: Sequence[float]) -> str:
+    """pgvector text form of an embedding, e.g. "[0.1,0.2]"."""
+    return "[" + ",".join(map(str, embedding)) + "]"
 
 
 class ProfileRepository(BaseRepository[ProfileDTO]):
@@ -31,6 +37,53 @@ class ProfileRepository(BaseRepository[ProfileDTO]):
         """
         return super().get_by_id("id", profile_id)
     
+    def get_many(self, profile_ids: Iterable[UUID], columns: str = "*") -> List[ProfileDTO]:
+        """
+        Get multiple profiles by ID, one round-trip per 100 IDs
+        
+        Args:
+            profile_ids: User profile UUIDs
+            columns: PostgREST column list to select (must include id)
+            
+        Returns:
+            List of ProfileDTO objects in input order (missing IDs are omitted)
+            
+        Raises:
+            DatabaseError: If database query fails
+        """
+        ids = [id_str(profile_id) for profile_id in profile_ids]
+        found = self.get_many_by_ids("id", ids, columns)
+        return [found[i] for i in dict.fromkeys(ids) if i in found]
+    
+    def get_all_structs(self, limit: Optional[int] = None, offset: int = 0) -> List[ProfileStruct]:
+        """
+        Get all profiles as msgspec structs (fast typed decode for bulk matching reads)
+        
+        Args:
+            limit: Maximum number of records to return (None for all)
+            offset: Number of records to skip
+            
+        Returns:
+            List of ProfileStruct objects
+            
+        Raises:
+            Exception: If database query fails
+        """
+        try:
+            query = self._table().select("*")
+            
+            if limit is not None:
+                query = query.limit(limit)
+            
+            if offset > 0:
+                query = query.offset(offset)
+            
+            response = query.execute()
+            return rows_to_profile_structs(response.data)
+        
+        except Exception as e:
+            raise Exception(f"Failed to get all records from {self.table_name}: {str(e)}")
+    
     def get_by_email(self, email: str) -> Optional[ProfileDTO]:
         """
         Get profile by email address
@@ -44,36 +97,48 @@ class ProfileRepository(BaseRepository[ProfileDTO]):
         profiles = self.filter({"email": email}, limit=1)
         return profiles[0] if profiles else None
     
-    def get_by_school(self, school: str, limit: Optional[int] = None) -> List[ProfileDTO]:
+    def get_by_school(
+        self,
+        school: str,
+        limit: Optional[int] = None,
+        columns: str = "*"
+    ) -> List[ProfileDTO]:
         """
         Get all profiles from a specific school
         
         Args:
             school: School name
             limit: Maximum number of results
+            columns: PostgREST column list to select (narrow lists build partial DTOs)
             
         Returns:
             List of ProfileDTO objects
         """
-        return self.filter({"school": school}, limit=limit)
+        return self.filter({"school": school}, limit=limit, columns=columns)
     
-    def get_by_research_area(self, research_area: str, limit: Optional[int] = None) -> List[ProfileDTO]:
+    def get_by_research_area(
+        self,
+        research_area: str,
+        limit: Optional[int] = None,
+        columns: str = "*"
+    ) -> List[ProfileDTO]:
         """
-        Get profiles by research area (partial match)
+        Get profiles by research area (case-insensitive partial match)
         
-        Note: This uses exact match. For fuzzy search, use custom query.
+        Served by the pg_trgm GIN index on profiles.research_area.
         
         Args:
             research_area: Research area keyword
             limit: Maximum number of results
+            columns: PostgREST column list to select (narrow lists build partial DTOs)
             
         Returns:
             List of ProfileDTO objects
         """
         try:
-            query = self.client.table(self.table_name)\
-                .select("*")\
-                .ilike("research_areas", f"%{research_area}%")
+            query = self._table()\
+                .select(columns)\
+                .ilike("research_area", f"%{research_area}%")
             
             if limit:
                 query = query.limit(limit)
@@ -84,20 +149,28 @@ class ProfileRepository(BaseRepository[ProfileDTO]):
         except Exception as e:
             raise Exception(f"Failed to search by research area: {str(e)}")
     
-    def search_by_name(self, name: str, limit: Optional[int] = None) -> List[ProfileDTO]:
+    def search_by_name(
+        self,
+        name: str,
+        limit: Optional[int] = None,
+        columns: str = "*"
+    ) -> List[ProfileDTO]:
         """
         Search profiles by name (case-insensitive partial match)
         
+        Served by the pg_trgm GIN index on profiles.name.
+        
         Args:
             name: Name to search for
             limit: Maximum number of results
+            columns: PostgREST column list to select (narrow lists build partial DTOs)
             
         Returns:
             List of ProfileDTO objects
         """
         try:
-            query = self.client.table(self.table_name)\
-                .select("*")\
+            query = self._table()\
+                .select(columns)\
                 .ilike("name", f"%{name}%")
             
             if limit:
@@ -127,9 +200,9 @@ class ProfileRepository(BaseRepository[ProfileDTO]):
         Update cached user_embedding vector for one profile.
         """
         try:
-            response = self.client.table(self.table_name)\
+            response = self._table()\
                 .update({"user_embedding": embedding})\
-                .eq("id", str(profile_id))\
+                .eq("id", id_str(profile_id))\
                 .execute()
 
             if response.data and len(response.data) > 0:
@@ -138,12 +211,62 @@ class ProfileRepository(BaseRepository[ProfileDTO]):
         except Exception as e:
             raise Exception(f"Failed to update user_embedding for {profile_id}: {str(e)}")
 
-    def get_profiles_missing_embedding(self, limit: Optional[int] = None) -> List[ProfileDTO]:
+    @_wrap_errors("update embeddings in")
+    def update_user_embeddings(
+        self,
+        embeddings: Mapping[str, Sequence[float]],
+        batch_size: int = 500
+    ) -> Set[str]:
+        """
+        Update user_embedding for many profiles, one round-trip per batch_size rows
+        
+        Calls the update_user_embeddings RPC (a single UPDATE ... FROM unnest)
+        and falls back to one update per profile if it is not deployed.
+        
+        Args:
+            embeddings: Dict of profile id -> embedding
+            batch_size: Profiles per request
+            
+        Returns:
+            Set of profile ids that were updated
+            
+        Raises:
+            DatabaseError: If database query fails
+        """
+        items = [(id_str(profile_id), vector) for profile_id, vector in embeddings.items()]
+        updated: Set[str] = set()
+        for start in range(0, len(items), batch_size):
+            chunk = items[start:start + batch_size]
+            try:
+                response = self.client.rpc(
+                    "update_user_embeddings",
+                    {
+                        "ids": [profile_id for profile_id, _ in chunk],
+                        "embeddings": [_vector_literal(vector) for _, vector in chunk],
+                    }
+                ).execute()
+            except APIError:
+                # RPC not deployed yet: one update per profile
+                for profile_id, vector in chunk:
+                    if self.update_user_embedding(profile_id, list(vector)):
+                        updated.add(profile_id)
+                continue
+            updated.update(str(row) for row in response.data or [])
+        return updated
+
+    def get_profiles_missing_embedding(
+        self,
+        limit: Optional[int] = None,
+        columns: str = "id"
+    ) -> List[ProfileDTO]:
         """
         Get profiles where user_embedding is null.
+        
+        Only ids are fetched by default (the backfill re-reads each profile);
+        pass columns="*" for full DTOs.
         """
         try:
-            query = self.client.table(self.table_name).select("*").is_("user_embedding", "null")
+            query = self._table().select(columns).is_("user_embedding", "null")
             if limit:
                 query = query.limit(limit)
             response = query.execute()
@@ -151,6 +274,114 @@ class ProfileRepository(BaseRepository[ProfileDTO]):
         except Exception as e:
             raise Exception(f"Failed to fetch profiles missing embedding: {str(e)}")
     
+    @_wrap_errors("page profiles missing embedding from")
+    def _missing_embedding_page(
+        self,
+        page_size: int,
+        after_id: Optional[UUID],
+        columns: str = "*"
+    ) -> List[ProfileDTO]:
+        """
+        Fetch one id-ordered page of profiles where user_embedding is null
+        
+        Args:
+            page_size: Rows per page
+            after_id: Last id of the previous page, None for the first page
+            columns: PostgREST column list to select (must include id)
+            
+        Returns:
+            List of ProfileDTO objects
+        """
+        query = self._table().select(columns).is_("user_embedding", "null").order("id")
+        if after_id is not None:
+            query = query.gt("id", id_str(after_id))
+        return self._convert_to_dto_list(query.limit(page_size).execute().data)
+    
+    def iter_profiles_missing_embedding(
+        self,
+        page_size: int = 256,
+        limit: Optional[int] = None,
+        columns: str = "*"
+    ) -> Iterator[List[ProfileDTO]]:
+        """
+        Stream profiles where user_embedding is null, one page at a time
+        
+        Pages resume after the last id seen, so rows that get their embedding
+        filled in while iterating never shift the next page.
+        
+        Args:
+            page_size: Rows per request
+            limit: Optional max number of profiles in total
+            columns: PostgREST column list to select (must include id)
+            
+        Yields:
+            Lists of ProfileDTO objects
+        """
+        after_id = None
+        remaining = limit
+        while remaining is None or remaining > 0:
+            size = page_size if remaining is None else min(page_size, remaining)
+            page = self._missing_embedding_page(size, after_id, columns)
+            if page:
+                yield page
+            if len(page) < size:
+                return
+            after_id = page[-1].id
+            if remaining is not None:
+                remaining -= len(page)
+    
+    @_wrap_errors("match embeddings in")
+    def match_by_embedding(
+        self,
+        embedding: List[float],
+        match_count: int,
+        exclude_id: Optional[UUID] = None
+    ) -> List[Tuple[str, float]]:
+        """
+        Nearest profiles by cosine similarity, ranked in Postgres
+        
+        Calls the match_profiles RPC, which walks the HNSW index on
+        profiles.user_embedding instead of shipping every vector here.
+        
+        Args:
+            embedding: Query vector, aligned to the user_embedding dimension
+            match_count: Number of profiles to return
+            exclude_id: Profile to leave out (usually the querying user)
+            
+        Returns:
+            List of (profile_id, cosine_similarity) tuples, most similar first
+            
+        Raises:
+            DatabaseError: If the query fails (e.g. RPC not deployed)
+        """
+        response = self.client.rpc(
+            "match_profiles",
+            {
+                # pgvector parses its text form; a JSON array is not castable
+                "query_embedding": _vector_literal(embedding),
+                "match_count": match_count,
+                "exclude_id": id_str(exclude_id) if exclude_id is not None else None,
+            }
+        ).execute()
+        return [(row["id"], float(row["similarity"])) for row in response.data or []]
+    
+    @_wrap_errors("count embedded profiles in")
+    def count_with_embedding(self) -> int:
+        """
+        Count profiles whose user_embedding is set (HEAD request, no rows)
+        
+        Returns:
+            Number of profiles with an embedding
+            
+        Raises:
+            DatabaseError: If database query fails
+        """
+        response = self._table()\
+            .select("*", count="exact", head=True)\
+            .not_.is_("user_embedding", "null")\
+            .execute()
+        return response.count if response.count is not None else 0
+    
     def delete_profile(self, profile_id: UUID) -> bool:
         """
         Delete a profile
@@ -13,7 +13,10 @@ from __future__ import annotations
 import os
 import sys
 import time
-from typing import List
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, List, Tuple
+
+from dotenv import load_dotenv
 
 # Allow script to run directly
 ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
@@ -22,167 +25,155 @@ SRC = os.path.join(ROOT, "db")
 if SRC not in sys.path:
     sys.path.insert(0, SRC)
 
+load_dotenv(dotenv_path=os.path.join(ROOT, ".env"))
+
 from repositories.profile_repository import ProfileRepository
+from pojo.profile import ProfileDTO
 from uuid import UUID
 
 
-def test_get_all_profiles():
+def test_get_all_profiles(repo: ProfileRepository, profiles: List[ProfileDTO], log: Callable = print):
     """
     Test 1: Get all profiles and print them
     """
-    print("=" * 80)
-    print("Test 1: Get All Profiles")
-    print("=" * 80)
+    log("=" * 80)
+    log("Test 1: Get All Profiles")
+    log("=" * 80)
 
     try:
-        repo = ProfileRepository()
-
-        # Get first 10 profiles
-        profiles = repo.get_all(limit=10)
-
-        print(f"\nFound {len(profiles)} profiles:\n")
+        log(f"\nFound {len(profiles)} profiles:\n")
 
         for i, profile in enumerate(profiles, 1):
-            print(f"{i}. Profile ID: {profile.id}")
-            print(f"   Name: {profile.name}")
-            print(f"   Email: {profile.email}")
-            print(f"   School: {profile.school}")
-            print(f"   Major: {profile.major}")
-            print(f"   Created at: {profile.created_at}")
-            print("-" * 80)
+            log(f"{i}. Profile ID: {profile.id}")
+            log(f"   Name: {profile.name}")
+            log(f"   Email: {profile.email}")
+            log(f"   School: {profile.school}")
+            log(f"   Major: {profile.major}")
+            log(f"   Created at: {profile.created_at}")
+            log("-" * 80)
 
         # Get total count
         total_count = repo.count()
-        print(f"\nTotal profiles in database: {total_count}")
+        log(f"\nTotal profiles in database: {total_count}")
 
         return True
 
     except Exception as e:
-        print(f"\n❌ Error: {str(e)}")
+        log(f"\n❌ Error: {str(e)}")
         return False
 
 
-def test_get_profile_by_id():
+def test_get_profile_by_id(repo: ProfileRepository, profiles: List[ProfileDTO], log: Callable = print):
     """
     Test 2: Get profile by ID
     """
-    print("\n" + "=" * 80)
-    print("Test 2: Get Profile by ID")
-    print("=" * 80)
+    log("\n" + "=" * 80)
+    log("Test 2: Get Profile by ID")
+    log("=" * 80)
 
     try:
-        repo = ProfileRepository()
-
-        # First, get a profile ID from the database
-        profiles = repo.get_all(limit=1)
-
         if not profiles:
-            print("\n⚠️  No profiles found in database to test with")
+            log("\n⚠️  No profiles found in database to test with")
             return False
 
         test_profile_id = profiles[0].id
-        print(f"\nSearching for profile with ID: {test_profile_id}")
+        log(f"\nSearching for profile with ID: {test_profile_id}")
 
         # Get profile by ID
         profile = repo.get_by_id(test_profile_id)
 
         if profile:
-            print("\n✅ Profile found:")
-            print(f"   ID: {profile.id}")
-            print(f"   Name: {profile.name}")
-            print(f"   Email: {profile.email}")
-            print(f"   School: {profile.school}")
-            print(f"   Major: {profile.major}")
-            print(f"   Bio: {profile.bio}")
-            print(f"   Research Areas: {profile.research_areas}")
-            print(f"   Occupation: {profile.occupation}")
-            print(f"   Created at: {profile.created_at}")
-            print(f"   Updated at: {profile.updated_at}")
+            log("\n✅ Profile found:")
+            log(f"   ID: {profile.id}")
+            log(f"   Name: {profile.name}")
+            log(f"   Email: {profile.email}")
+            log(f"   School: {profile.school}")
+            log(f"   Major: {profile.major}")
+            log(f"   Bio: {profile.bio}")
+            log(f"   Research Areas: {profile.research_areas}")
+            log(f"   Occupation: {profile.occupation}")
+            log(f"   Created at: {profile.created_at}")
+            log(f"   Updated at: {profile.updated_at}")
         else:
-            print("\n❌ Profile not found")
+            log("\n❌ Profile not found")
             return False
 
         # Test with non-existent ID
-        print("\n" + "-" * 80)
-        print("Testing with non-existent ID...")
+        log("\n" + "-" * 80)
+        log("Testing with non-existent ID...")
         fake_id = UUID("00000000-0000-0000-0000-000000000000")
         non_existent = repo.get_by_id(fake_id)
 
         if non_existent is None:
-            print("✅ Correctly returned None for non-existent ID")
+            log("✅ Correctly returned None for non-existent ID")
         else:
-            print("❌ Should return None for non-existent ID")
+            log("❌ Should return None for non-existent ID")
 
         return True
 
     except Exception as e:
-        print(f"\n❌ Error: {str(e)}")
+        log(f"\n❌ Error: {str(e)}")
         return False
 
 
-def test_get_profile_by_email():
+def test_get_profile_by_email(repo: ProfileRepository, profiles: List[ProfileDTO], log: Callable = print):
     """
     Test 3: Get profile by email
     """
-    print("\n" + "=" * 80)
-    print("Test 3: Get Profile by Email")
-    print("=" * 80)
+    log("\n" + "=" * 80)
+    log("Test 3: Get Profile by Email")
+    log("=" * 80)
 
     try:
-        repo = ProfileRepository()
-
-        # First, get an email from the database
-        profiles = repo.get_all(limit=5)
-
         if not profiles:
-            print("\n⚠️  No profiles found in database to test with")
+            log("\n⚠️  No profiles found in database to test with")
             return False
 
         # Find a profile with an email
         test_email = None
-        for p in profiles:
+        for p in profiles[:5]:
             if p.email:
                 test_email = p.email
                 break
 
         if not test_email:
-            print("\n⚠️  No profiles with email found to test with")
+            log("\n⚠️  No profiles with email found to test with")
             return False
 
-        print(f"\nSearching for profile with email: {test_email}")
+        log(f"\nSearching for profile with email: {test_email}")
 
         # Get profile by email
         profile = repo.get_by_email(test_email)
 
         if profile:
-            print("\n✅ Profile found:")
-            print(f"   ID: {profile.id}")
-            print(f"   Name: {profile.name}")
-            print(f"   Email: {profile.email}")
-            print(f"   School: {profile.school}")
-            print(f"   Major: {profile.major}")
-            print(f"   Research Areas: {profile.research_areas}")
-            print(f"   GitHub: {profile.github}")
-            print(f"   LinkedIn: {profile.linkedin}")
-            print(f"   Created at: {profile.created_at}")
+            log("\n✅ Profile found:")
+            log(f"   ID: {profile.id}")
+            log(f"   Name: {profile.name}")
+            log(f"   Email: {profile.email}")
+            log(f"   School: {profile.school}")
+            log(f"   Major: {profile.major}")
+            log(f"   Research Areas: {profile.research_areas}")
+            log(f"   GitHub: {profile.github}")
+            log(f"   LinkedIn: {profile.linkedin}")
+            log(f"   Created at: {profile.created_at}")
         else:
-            print("\n❌ Profile not found")
+            log("\n❌ Profile not found")
             return False
 
         # Test with non-existent email
-        print("\n" + "-" * 80)
-        print("Testing with non-existent email...")
+        log("\n" + "-" * 80)
+        log("Testing with non-existent email...")
         non_existent = repo.get_by_email("nonexistent@example.com")
 
         if non_existent is None:
-            print("✅ Correctly returned None for non-existent email")
+            log("✅ Correctly returned None for non-existent email")
         else:
-            print("❌ Should return None for non-existent email")
+            log("❌ Should return None for non-existent email")
 
         return True
 
     except Exception as e:
-        print(f"\n❌ Error: {str(e)}")
+        log(f"\n❌ Error: {str(e)}")
         return False
 
 
@@ -194,12 +185,31 @@ def run_all_tests():
     print("PROFILE REPOSITORY TESTS")
     print("=" * 80 + "\n")
 
-    results = {
-        "test_get_all_profiles": test_get_all_profiles(),
-        "test_get_profile_by_id": test_get_profile_by_id(),
-        "test_get_profile_by_email": test_get_profile_by_email(),
+    repo = ProfileRepository()
+    # One shared sample read (first 10 profiles) instead of one per test
+    profiles = repo.get_all(limit=10)
+
+    tests = {
+        "test_get_all_profiles": test_get_all_profiles,
+        "test_get_profile_by_id": test_get_profile_by_id,
+        "test_get_profile_by_email": test_get_profile_by_email,
     }
 
+    def run_buffered(test: Callable) -> Tuple[List[str], bool]:
+        lines: List[str] = []
+        log = lambda *args: lines.append(" ".join(str(a) for a in args))
+        return lines, test(repo, profiles, log)
+
+    # Tests are independent reads: overlap their round-trips, then print
+    # each test's output in order so it does not interleave
+    with ThreadPoolExecutor(max_workers=len(tests)) as pool:
+        futures = {name: pool.submit(run_buffered, test) for name, test in tests.items()}
+
+    results = {}
+    for name, future in futures.items():
+        lines, results[name] = future.result()
+        print("\n".join(lines))
+
     # Print summary
     print("\n" + "=" * 80)
     print("TEST SUMMARY")
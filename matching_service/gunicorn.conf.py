@@ -0,0 +1,31 @@
+"""
+Gunicorn config for the matching service.
+
+gthread workers keep one warm MatchingService per process and serve
+concurrent requests from a thread pool. Override via env vars:
+  GUNICORN_WORKERS   (default: 2; each worker holds the model and a full pool)
+  GUNICORN_THREADS   (default: 8)
+  HOST / PORT        (default: 0.0.0.0 / 5200)
+"""
+import multiprocessing
+import os
+
+bind = f"{os.getenv('HOST', '0.0.0.0')}:{os.getenv('PORT', '5200')}"
+workers = int(os.getenv("GUNICORN_WORKERS", "2"))
+worker_class = "gthread"
+threads = int(os.getenv("GUNICORN_THREADS", "8"))
+# Import app (and load the embedding model) once in the master, then fork.
+preload_app = True
+timeout = int(os.getenv("GUNICORN_TIMEOUT", "120"))
+accesslog = "-"
+
+
+def post_worker_init(worker):
+    """Prime each worker's user cache before it accepts requests."""
+    import torch
+
+    from app import warm_service
+
+    # Split the cores between workers instead of each using all of them
+    torch.set_num_threads(max(1, multiprocessing.cpu_count() // worker.cfg.workers))
+    warm_service(embedder=False)
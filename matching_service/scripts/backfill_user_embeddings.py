@@ -5,6 +5,7 @@ Usage:
   cd matching_service
   python scripts/backfill_user_embeddings.py
   python scripts/backfill_user_embeddings.py --limit 100
+  python scripts/backfill_user_embeddings.py --batch-size 128
 """
 
 from __future__ import annotations
@@ -31,6 +32,12 @@ def parse_args() -> argparse.Namespace:
         default=None,
         help="Optional max number of users to process",
     )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=256,
+        help="Profiles per page and per embedder call",
+    )
     return parser.parse_args()
 
 
@@ -40,9 +47,14 @@ def main() -> None:
 
     service = MatchingService(
         embedder_type="qwen",
+        # Bulk encoding: use the GPU when one is visible
+        device=os.getenv("DEVICE", "auto"),
         cache_vectors=False,
     )
-    result = service.backfill_missing_user_embeddings(limit=args.limit)
+    result = service.backfill_missing_user_embeddings(
+        limit=args.limit,
+        batch_size=args.batch_size,
+    )
 
     print("Backfill completed:")
     print(f"  total_profiles: {result['total_profiles']}")
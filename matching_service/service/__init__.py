@@ -4,8 +4,10 @@ Service Layer Package
 
 from .u2u_service import MatchingService
 from service.mapper.profile_mapper import (
+    embed_user_profiles,
     profile_dto_to_user_profile,
     profile_dtos_to_user_profiles,
+    profile_dtos_to_user_profiles_batched,
     build_exp_text,
     build_interest_text,
     build_tags,
@@ -13,8 +15,10 @@ from service.mapper.profile_mapper import (
 
 __all__ = [
     "MatchingService",
+    "embed_user_profiles",
     "profile_dto_to_user_profile",
     "profile_dtos_to_user_profiles",
+    "profile_dtos_to_user_profiles_batched",
     "build_exp_text",
     "build_interest_text",
     "build_tags",
@@ -0,0 +1,253 @@
+"""
+Embedding Cache - Persist text embeddings across service restarts
+
+SQLite-backed store keyed by a hash of (model id, text). Profile texts are
+deterministic per profile, so a warm start only encodes texts that changed.
+A SimHash index lets near-duplicate texts (small edits) reuse an entry.
+"""
+
+import hashlib
+import os
+import sqlite3
+import threading
+from typing import Dict, Iterable, List, Mapping, Optional, Sequence
+
+import numpy as np
+
+# SQLite's default limit on bound parameters is 999 on older builds
+_SELECT_CHUNK = 500
+
+# SimHash is split into 4 16-bit bands: two hashes within Hamming distance 3
+# share at least one band exactly, so an indexed band lookup finds them all
+_BANDS = 4
+_BAND_BITS = 64 // _BANDS
+_BAND_MASK = (1 << _BAND_BITS) - 1
+
+
+def simhash64(text: str) -> int:
+    """
+    64-bit SimHash over word 3-grams.
+
+    Args:
+        text: Canonicalized text
+
+    Returns:
+        Unsigned 64-bit fingerprint (0 for empty text)
+    """
+    words = text.split()
+    if not words:
+        return 0
+    shingles = [" ".join(words[i:i + 3]) for i in range(max(len(words) - 2, 1))]
+    hashes = np.fromiter(
+        (
+            int.from_bytes(hashlib.blake2b(s.encode("utf-8"), digest_size=8).digest(), "little")
+            for s in shingles
+        ),
+        dtype=np.uint64,
+        count=len(shingles),
+    )
+    bits = (hashes[:, None] >> np.arange(64, dtype=np.uint64)) & np.uint64(1)
+    votes = 2 * bits.sum(axis=0, dtype=np.int64) - len(shingles)
+    return int(np.packbits(votes[::-1] > 0).view(">u8")[0])
+
+
+def _to_signed(value: int) -> int:
+    # SQLite INTEGER is signed 64-bit
+    return value - (1 << 64) if value >= 1 << 63 else value
+
+
+class EmbeddingCache:
+    """
+    On-disk embedding cache shared by all threads of one process.
+
+    Vectors are stored as float16 bytes (half the size of float32); a cache
+    hit therefore differs from a fresh encode around the 3rd-4th decimal.
+    Rows are namespaced by model_id, so switching models never returns
+    stale vectors.
+    """
+
+    def __init__(self, path: str, model_id: str, fuzzy_distance: int = 0):
+        """
+        Initialize embedding cache.
+
+        Args:
+            path: SQLite database file (created if missing)
+            model_id: Identifies the model and settings that produced the vectors
+            fuzzy_distance: Max SimHash Hamming distance accepted by
+                get_similar_many (0, the default, disables fuzzy hits; at most 3)
+        """
+        self.path = path
+        self.model_id = model_id
+        self.fuzzy_distance = max(0, min(int(fuzzy_distance), _BANDS - 1))
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._pid: Optional[int] = None
+
+    def _connect(self) -> sqlite3.Connection:
+        # Connections must not cross a fork (gunicorn preload_app): reopen
+        # once per process
+        if self._conn is None or self._pid != os.getpid():
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            conn = sqlite3.connect(self.path, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS embeddings ("
+                " model_id TEXT NOT NULL,"
+                " key BLOB NOT NULL,"
+                " dim INTEGER NOT NULL,"
+                " vec BLOB NOT NULL,"
+                " PRIMARY KEY (model_id, key)"
+                ") WITHOUT ROWID"
+            )
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS simhashes ("
+                " model_id TEXT NOT NULL,"
+                " key BLOB NOT NULL,"
+                " simhash INTEGER NOT NULL,"
+                + "".join(f" b{i} INTEGER NOT NULL," for i in range(_BANDS))
+                + " PRIMARY KEY (model_id, key)"
+                ") WITHOUT ROWID"
+            )
+            for i in range(_BANDS):
+                conn.execute(
+                    f"CREATE INDEX IF NOT EXISTS idx_simhashes_b{i} ON simhashes (model_id, b{i})"
+                )
+            conn.commit()
+            self._conn = conn
+            self._pid = os.getpid()
+        return self._conn
+
+    def key(self, text: str) -> bytes:
+        """
+        Cache key for a text under this cache's model.
+
+        Args:
+            text: Text that would be sent to the embedder
+
+        Returns:
+            16-byte blake2b digest of model_id and text
+        """
+        payload = f"{self.model_id}\0{text}".encode("utf-8")
+        return hashlib.blake2b(payload, digest_size=16).digest()
+
+    def get_many(self, keys: Iterable[bytes]) -> Dict[bytes, List[float]]:
+        """
+        Look up cached vectors.
+
+        Args:
+            keys: Keys from key()
+
+        Returns:
+            Dict of key -> vector for the keys that were found
+        """
+        keys = list(dict.fromkeys(keys))
+        found: Dict[bytes, List[float]] = {}
+        if not keys:
+            return found
+
+        with self._lock:
+            conn = self._connect()
+            for start in range(0, len(keys), _SELECT_CHUNK):
+                chunk = keys[start:start + _SELECT_CHUNK]
+                rows = conn.execute(
+                    "SELECT key, dim, vec FROM embeddings"
+                    f" WHERE model_id = ? AND key IN ({','.join('?' * len(chunk))})",
+                    [self.model_id, *chunk],
+                ).fetchall()
+                for key, dim, blob in rows:
+                    vec = np.frombuffer(blob, dtype=np.float16)
+                    if vec.size == dim:
+                        found[bytes(key)] = vec.astype(np.float32).tolist()
+        return found
+
+    def get_similar_many(self, simhashes: Mapping[bytes, int]) -> Dict[bytes, List[float]]:
+        """
+        Find cached vectors for near-duplicate texts.
+
+        Args:
+            simhashes: Dict of key -> simhash64 of the canonical text
+
+        Returns:
+            Dict of key -> vector of the closest stored text within
+            fuzzy_distance, for the keys that have one
+        """
+        if not self.fuzzy_distance or not simhashes:
+            return {}
+
+        matched: Dict[bytes, bytes] = {}
+        band_filter = " OR ".join(f"b{i} = ?" for i in range(_BANDS))
+        with self._lock:
+            conn = self._connect()
+            for key, fingerprint in simhashes.items():
+                bands = [(fingerprint >> (_BAND_BITS * i)) & _BAND_MASK for i in range(_BANDS)]
+                rows = conn.execute(
+                    f"SELECT key, simhash FROM simhashes WHERE model_id = ? AND ({band_filter})",
+                    [self.model_id, *bands],
+                ).fetchall()
+                best = None
+                for candidate, stored in rows:
+                    distance = ((stored & (2 ** 64 - 1)) ^ fingerprint).bit_count()
+                    if distance <= self.fuzzy_distance and (best is None or distance < best[0]):
+                        best = (distance, bytes(candidate))
+                if best is not None:
+                    matched[key] = best[1]
+
+        vectors = self.get_many(matched.values())
+        return {key: vectors[source] for key, source in matched.items() if source in vectors}
+
+    def put_many(
+        self,
+        items: Mapping[bytes, Sequence[float]],
+        simhashes: Optional[Mapping[bytes, int]] = None,
+    ) -> None:
+        """
+        Store vectors, replacing existing entries.
+
+        Args:
+            items: Dict of key -> vector
+            simhashes: Optional key -> simhash64 to index for fuzzy lookup
+        """
+        if not items:
+            return
+
+        rows = []
+        for key, vector in items.items():
+            vec = np.asarray(vector, dtype=np.float16)
+            rows.append((self.model_id, key, int(vec.size), vec.tobytes()))
+
+        hash_rows = [
+            (
+                self.model_id,
+                key,
+                _to_signed(fingerprint),
+                *((fingerprint >> (_BAND_BITS * i)) & _BAND_MASK for i in range(_BANDS)),
+            )
+            for key, fingerprint in (simhashes or {}).items()
+            if key in items and fingerprint
+        ]
+
+        with self._lock:
+            conn = self._connect()
+            conn.executemany(
+                "INSERT OR REPLACE INTO embeddings (model_id, key, dim, vec) VALUES (?, ?, ?, ?)",
+                rows,
+            )
+            if hash_rows:
+                conn.executemany(
+                    "INSERT OR REPLACE INTO simhashes (model_id, key, simhash, "
+                    + ", ".join(f"b{i}" for i in range(_BANDS))
+                    + f") VALUES ({', '.join('?' * (3 + _BANDS))})",
+                    hash_rows,
+                )
+            conn.commit()
+
+    def close(self) -> None:
+        """Close this process's connection (reopened on next use)."""
+        with self._lock:
+            if self._conn is not None and self._pid == os.getpid():
+                self._conn.close()
+            self._conn = None
+            self._pid = None
@@ -4,12 +4,44 @@ Profile Mapper - Convert database ProfileDTO to matching UserProfile
 Maps database fields to matching service fields by composing text from multiple sources.
 """
 
-import json
 import os
-from typing import Any, List
+import re
+import unicodedata
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Any, List, Optional, Tuple
+
+import numpy as np
+
 from db.pojo.profile import ProfileDTO
+from service.cache.embedding_cache import EmbeddingCache, simhash64
+from src.matching.adapters import Embedder, build_user_vectors
 from src.matching.matching_pojo import UserProfile
 
+__all__ = [
+    "build_exp_text",
+    "build_interest_text",
+    "build_tags",
+    "compact_vector",
+    "embed_user_profiles",
+    "profile_dto_to_user_profile",
+    "profile_dtos_to_user_profiles",
+    "profile_dtos_to_user_profiles_batched",
+]
+
+_EMPTY_VECTOR = np.empty(0, dtype=np.float32)
+# Read once at import; the mapper runs per profile
+_MATCH_VECTOR_DIM = int(os.getenv("MATCH_VECTOR_DIM", "512"))
+# In-memory dtype of matching vectors: "float16" halves and "int8" quarters
+# the cached user pool; cosine scores shift slightly (int8 around 1e-3)
+_MATCH_VECTOR_DTYPE = os.getenv("MATCH_VECTOR_DTYPE", "float32").strip().lower()
+# Threads for converting large profile lists (1 = in the calling thread)
+_MAPPER_WORKERS = max(1, int(os.getenv("PROFILE_MAPPER_WORKERS", "1")))
+# Lists shorter than this are not worth a thread pool
+_PARALLEL_MIN_PROFILES = 256
+_PARALLEL_CHUNK = 64
+
 
 def _list_to_text(field_value) -> str:
     """
@@ -36,20 +68,29 @@ def _list_to_text(field_value) -> str:
 def _flatten_to_strings(value: Any) -> List[str]:
     """
     Flatten nested lists/tuples and coerce leaf values to strings.
+
+    Walks an explicit stack instead of recursing, so nested items cost no
+    extra call frame or list.extend.
     """
     result: List[str] = []
-
-    if value is None:
-        return result
-
-    if isinstance(value, (list, tuple)):
-        for item in value:
-            result.extend(_flatten_to_strings(item))
-        return result
-
-    text = str(value).strip()
-    if text:
-        result.append(text)
+    stack = deque((value,))
+    pop = stack.pop
+
+    while stack:
+        item = pop()
+        if item is None:
+            continue
+        cls = item.__class__
+        if cls is str:
+            text = item.strip()
+        elif cls is list or cls is tuple or isinstance(item, (list, tuple)):
+            # Reversed so items pop off in their original order
+            stack.extend(reversed(item))
+            continue
+        else:
+            text = str(item).strip()
+        if text:
+            result.append(text)
     return result
 
 
@@ -57,39 +98,108 @@ def _as_clean_text(value: Any) -> str:
     """
     Normalize string/list values into a clean text representation.
     """
+    # Most fields are plain strings: skip the list/str dispatch
+    if value.__class__ is str:
+        return value.strip()
     return _list_to_text(value)
 
 
-def _parse_embedding(value: Any) -> List[float]:
+def _canonicalize(text: str) -> str:
+    """
+    Canonical form of a text for embedding-cache keys.
+
+    Case, Unicode compatibility forms, whitespace runs and trailing
+    punctuation do not change the key, so trivially edited texts share
+    one cache entry.
+    """
+    text = unicodedata.normalize("NFKC", text or "").casefold()
+    text = re.sub(r"\s+", " ", text).strip()
+    return text.rstrip(".;,").rstrip()
+
+
+def _parse_embedding(value: Any) -> np.ndarray:
     """
-    Parse pgvector value from DB to List[float].
+    Parse pgvector value from DB to a float32 array.
 
     Supabase may return vector as a list or as string like "[0.1,0.2,...]".
+    Unparseable values give an empty array.
     """
     if value is None:
-        return []
+        return _EMPTY_VECTOR
 
-    if isinstance(value, list):
-        parsed: List[float] = []
-        for item in value:
-            try:
-                parsed.append(float(item))
-            except (TypeError, ValueError):
-                continue
-        return parsed
+    if isinstance(value, (list, tuple)):
+        try:
+            return np.asarray(value, dtype=np.float32)
+        except (TypeError, ValueError):
+            # Mixed content: keep the numeric items
+            parsed: List[float] = []
+            for item in value:
+                try:
+                    parsed.append(float(item))
+                except (TypeError, ValueError):
+                    continue
+            return np.asarray(parsed, dtype=np.float32)
 
     if isinstance(value, str):
         text = value.strip()
-        if not text:
-            return []
+        if not text.startswith("[") or not text.endswith("]"):
+            return _EMPTY_VECTOR
+        body = text[1:-1]
+        if not body.strip():
+            return _EMPTY_VECTOR
         try:
-            loaded = json.loads(text)
-            if isinstance(loaded, list):
-                return [float(item) for item in loaded]
-        except (json.JSONDecodeError, TypeError, ValueError):
-            return []
+            parsed_array = np.fromstring(body, dtype=np.float32, sep=",")
+        except ValueError:
+            return _EMPTY_VECTOR
+        # fromstring stops early on malformed input instead of raising
+        if parsed_array.size != body.count(",") + 1:
+            return _EMPTY_VECTOR
+        return parsed_array
 
-    return []
+    return _EMPTY_VECTOR
+
+
+def _quantize_int8(vector: Any) -> Tuple[np.ndarray, float]:
+    """
+    Symmetric per-vector int8 quantization: vector ≈ q * scale.
+    """
+    values = np.asarray(vector, dtype=np.float32)
+    peak = float(np.max(np.abs(values))) if values.size else 0.0
+    if peak == 0.0:
+        return np.zeros(values.shape, dtype=np.int8), 1.0
+    scale = peak / 127.0
+    return np.round(values / scale).astype(np.int8), scale
+
+
+def _unit_vector(vector: Any) -> np.ndarray:
+    """
+    L2-normalize a matching vector once at ingest (zero vectors stay zero).
+
+    Stored embeddings are unit length, but their leading-dims slice is not;
+    normalizing here lets matching skip the per-row division.
+    """
+    values = np.array(vector, dtype=np.float32)
+    norm = float(np.linalg.norm(values))
+    if norm > 0.0:
+        values /= norm
+    return values
+
+
+def compact_vector(vector: Any) -> Any:
+    """
+    Convert a matching vector to the configured in-memory dtype.
+
+    int8 keeps only the quantized values: matching compares vectors by
+    cosine (and pgvector recall by cosine distance), which the per-vector
+    scale does not change.
+    """
+    if vector is None or _MATCH_VECTOR_DTYPE in ("", "float32"):
+        return vector
+    if _MATCH_VECTOR_DTYPE == "int8":
+        return _quantize_int8(vector)[0]
+    if _MATCH_VECTOR_DTYPE == "float16":
+        return np.asarray(vector, dtype=np.float16)
+    return vector
 
 
 def build_exp_text(profile: ProfileDTO) -> str:
@@ -231,25 +341,26 @@ def build_tags(profile: ProfileDTO) -> List[str]:
         return [tag.strip() for tag in profile.current_skills if tag and tag.strip()]
 
     if isinstance(profile.current_skills, str):
-        if not profile.current_skills.strip():
-            return []
+        return list(_parse_skills_str(profile.current_skills))
 
-        # Replace semicolons with commas for uniform parsing
-        skills_text = profile.current_skills.replace(';', ',')
+    return []
 
-        # Split and clean
-        tags = []
-        for tag in skills_text.split(','):
-            cleaned = tag.strip()
-            if cleaned:
-                tags.append(cleaned)
 
-        return tags
+@lru_cache(maxsize=8192)
+def _parse_skills_str(skills: str) -> Tuple[str, ...]:
+    """
+    Split a comma/semicolon-separated skills string into cleaned tags.
 
-    return []
+    Memoized: many profiles share the same skills string.
+    """
+    # Replace semicolons with commas for uniform parsing
+    skills_text = skills.replace(';', ',')
+
+    # Split and clean
+    return tuple(cleaned for cleaned in (tag.strip() for tag in skills_text.split(',')) if cleaned)
 
 
-def profile_dto_to_user_profile(profile: ProfileDTO) -> UserProfile:
+def profile_dto_to_user_profile(profile: ProfileDTO, needs_text: bool = True) -> UserProfile:
     """
     Convert database ProfileDTO to matching service UserProfile.
 
@@ -257,21 +368,29 @@ def profile_dto_to_user_profile(profile: ProfileDTO) -> UserProfile:
 
     Args:
         profile: ProfileDTO from database
+        needs_text: Build exp_text/interest_text even when a stored embedding
+            is present (needed for re-encoding and match reasons). Profiles
+            without an embedding always get their texts, since those are
+            what gets encoded.
 
     Returns:
         UserProfile for matching service
     """
     cached_embedding = _parse_embedding(profile.user_embedding)
-    match_dim = int(os.getenv("MATCH_VECTOR_DIM", "512"))
-    vector = [float(v) for v in cached_embedding[:match_dim]] if cached_embedding else None
+    vector = (
+        compact_vector(_unit_vector(cached_embedding[:_MATCH_VECTOR_DIM]))
+        if cached_embedding.size
+        else None
+    )
+    build_text = needs_text or vector is None
 
     return UserProfile(
         user_id=str(profile.id),  # Convert UUID to string
         name=profile.name or "Unknown",  # Fallback if name is None
         role=profile.occupation or "attendee",  # Map occupation to role
         tags=build_tags(profile),
-        exp_text=build_exp_text(profile),
-        interest_text=build_interest_text(profile),
+        exp_text=build_exp_text(profile) if build_text else "",
+        interest_text=build_interest_text(profile) if build_text else "",
         # Reuse cached DB embedding for all matching dimensions to avoid on-request re-encoding.
         v_exp=vector,
         v_interest=vector,
@@ -281,19 +400,149 @@ def profile_dto_to_user_profile(profile: ProfileDTO) -> UserProfile:
             "email": profile.email,
             "github": profile.github,
             "linkedin": profile.linkedin,
-            "created_at": profile.created_at.isoformat() if profile.created_at else None,
+            "created_at": profile.created_at_iso,
         }
     )
 
 
-def profile_dtos_to_user_profiles(profiles: List[ProfileDTO]) -> List[UserProfile]:
+def profile_dtos_to_user_profiles(
+    profiles: List[ProfileDTO],
+    needs_text: bool = True,
+) -> List[UserProfile]:
     """
     Convert a list of ProfileDTOs to UserProfiles.
 
+    With PROFILE_MAPPER_WORKERS > 1, large lists are converted in chunks on
+    a thread pool; the order of the result is unchanged.
+
     Args:
-        profiles: List of ProfileDTOs from database
+        profiles: List of ProfileDTOs (or ProfileStructs) from database
+        needs_text: See profile_dto_to_user_profile
 
     Returns:
         List of UserProfiles for matching service
     """
-    return [profile_dto_to_user_profile(p) for p in profiles]
\ No newline at end of file
+    if _MAPPER_WORKERS <= 1 or len(profiles) < _PARALLEL_MIN_PROFILES:
+        return [profile_dto_to_user_profile(p, needs_text) for p in profiles]
+
+    def convert(chunk: List[ProfileDTO]) -> List[UserProfile]:
+        return [profile_dto_to_user_profile(p, needs_text) for p in chunk]
+
+    chunks = [
+        profiles[start:start + _PARALLEL_CHUNK]
+        for start in range(0, len(profiles), _PARALLEL_CHUNK)
+    ]
+    with ThreadPoolExecutor(max_workers=_MAPPER_WORKERS) as executor:
+        return [user for converted in executor.map(convert, chunks) for user in converted]
+
+
+def embed_user_profiles(
+    users: List[UserProfile],
+    embedder: Embedder,
+    batch_size: int = 64,
+    cache: Optional[EmbeddingCache] = None,
+    fuzzy: bool = True,
+) -> None:
+    """
+    Fill the vectors of users that have none, from their profile text.
+
+    Texts are looked up in the on-disk cache (when given) by canonical text,
+    then (with fuzzy) by SimHash for near-duplicates; only the remaining
+    texts are encoded, in batches of batch_size, one embedder call per batch,
+    and stored back in the cache. Vectors are left as the embedder returns
+    them.
+
+    Args:
+        users: UserProfiles; those with v_profile set are left untouched
+        embedder: Embedder for texts the cache does not have
+        batch_size: Profiles per embedder call
+        cache: Optional persistent cache consulted before the embedder
+        fuzzy: Also reuse near-duplicate entries; pass False when the vectors
+            are going to be stored, so a small edit is never served the old
+            text's vector
+    """
+    missing = [u for u in users if u.v_profile is None]
+    if not missing:
+        return
+
+    keys: List[Optional[bytes]] = [None] * len(missing)
+    simhashes: dict = {}
+    if cache is not None:
+        canonical = [_canonicalize(u.build_profile_text()) for u in missing]
+        keys = [cache.key(text) for text in canonical]
+        hits = cache.get_many(keys)
+        if fuzzy and cache.fuzzy_distance:
+            simhashes = {
+                key: simhash64(text) for key, text in zip(keys, canonical) if key not in hits
+            }
+            fuzzy_hits = cache.get_similar_many(simhashes)
+            # Remember the near-duplicate under its own key for exact hits next time
+            cache.put_many(fuzzy_hits)
+            hits.update(fuzzy_hits)
+        for u, key in zip(missing, keys):
+            vector = hits.get(key)
+            if vector is not None:
+                u.v_exp = u.v_interest = u.v_profile = vector
+        pending = [(u, key) for u, key in zip(missing, keys) if u.v_profile is None]
+    else:
+        pending = list(zip(missing, keys))
+
+    for start in range(0, len(pending), batch_size):
+        chunk = pending[start:start + batch_size]
+        build_user_vectors(
+            [u for u, _ in chunk],
+            embedder,
+            build_profile=True,
+            overwrite=False,
+            single_vector=True,
+        )
+        if cache is not None:
+            cache.put_many(
+                {key: u.v_profile for u, key in chunk if u.v_profile is not None},
+                simhashes,
+            )
+
+
+def profile_dtos_to_user_profiles_batched(
+    profiles: List[ProfileDTO],
+    embedder: Embedder,
+    batch_size: int = 64,
+    cache: Optional[EmbeddingCache] = None,
+    needs_text: bool = True,
+    compact: bool = True,
+    fuzzy: bool = True,
+) -> List[UserProfile]:
+    """
+    Convert ProfileDTOs and embed the ones without a stored embedding.
+
+    Profiles that carry user_embedding reuse it; the rest are embedded by
+    embed_user_profiles (on-disk cache first, then the embedder in batches).
+    Pass compact=False when the new vectors are going to be stored: they are
+    then left as the embedder returned them, in float32.
+
+    Args:
+        profiles: List of ProfileDTOs (or ProfileStructs) from database
+        embedder: Embedder for profiles missing a stored embedding
+        batch_size: Profiles per embedder call
+        cache: Optional persistent cache consulted before the embedder
+        needs_text: See profile_dto_to_user_profile
+        compact: Normalize and convert new vectors to the in-memory matching
+            dtype (MATCH_VECTOR_DTYPE)
+        fuzzy: See embed_user_profiles
+
+    Returns:
+        List of UserProfiles with vectors filled where text was available
+    """
+    users = profile_dtos_to_user_profiles(profiles, needs_text)
+    missing = [u for u in users if u.v_profile is None]
+    if not missing:
+        return users
+
+    embed_user_profiles(missing, embedder, batch_size=batch_size, cache=cache, fuzzy=fuzzy)
+    if not compact:
+        return users
+
+    for u in missing:
+        if u.v_profile is not None:
+            u.v_exp = u.v_interest = u.v_profile = compact_vector(_unit_vector(u.v_profile))
+    return users
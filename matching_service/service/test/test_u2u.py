@@ -6,11 +6,14 @@ Simplest possible test - get top 5 matches with detailed info and print them.
 
 import sys
 from pathlib import Path
-import json
+
+import orjson
+from dotenv import load_dotenv
 
 # Add project root to path
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
+load_dotenv(dotenv_path=Path(__file__).parents[2] / ".env")  # matching_service/.env
 
 from service.u2u_service import MatchingService
 from db.repositories.profile_repository import ProfileRepository
@@ -42,6 +45,8 @@ def main():
     # Initialize service and find matches
     print("Initializing matching service...")
     service = MatchingService(device="cpu", cache_vectors=True)
+    # Load and stack the candidate pool once; matching calls reuse it
+    service.prewarm()
 
     print("Running matching algorithm...\n")
 
@@ -61,7 +66,11 @@ def main():
         mmr_lambda=0.5,
     )
     match = parser(str(target.id), match)
-    print(json.dumps(match, ensure_ascii=False, indent=2, default=str))
+    # orjson serializes UUIDs natively and writes UTF-8 bytes
+    sys.stdout.flush()
+    sys.stdout.buffer.write(
+        orjson.dumps(match, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY) + b"\n"
+    )
 
 
 
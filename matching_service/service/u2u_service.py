@@ -11,25 +11,39 @@ This service orchestrates:
 import json
 import os
 import logging
+import queue
+import threading
+import time
+from collections import OrderedDict
 from concurrent.futures import ThreadPoolExecutor, as_completed
-from typing import List, Optional, Dict, Tuple, Any
+from typing import Iterable, List, Optional, Dict, Tuple, Any, Union
 from uuid import UUID
 
+import numpy as np
 from openai import OpenAI
 
 from db.repositories.profile_repository import ProfileRepository
 from db.repositories.conference_participant_repository import ConferenceParticipantRepository
+from db.repositories.base_repository import DatabaseError, cache_invalidate
 from src.matching.matching_pojo import UserProfile, MatchingParams
 from src.matching.adapters import (
     BgeM3Embedder,
+    CachedEmbedder,
     Qwen3Embedder,
     SentenceTransformerEmbedder,
     InMemoryRetriever,
-    build_user_vectors,
     Embedder,
+    resolve_device,
 )
+from src.matching.algos import UserProfileBatch
 from src.matching.engine import MatchingEngine
-from service.mapper.profile_mapper import profile_dto_to_user_profile, profile_dtos_to_user_profiles
+from service.cache.embedding_cache import EmbeddingCache
+from service.mapper.profile_mapper import (
+    compact_vector,
+    embed_user_profiles,
+    profile_dto_to_user_profile,
+    profile_dtos_to_user_profiles_batched,
+)
 
 from openai import OpenAI
 
@@ -39,6 +53,10 @@ _OPENAI_CLIENT: Any = None
 GPT_MODEL_NAME = "gpt-4o-mini"
 logger = logging.getLogger(__name__)
 
+# Vector dimensions, read once at import (used per user in backfills)
+_MATCH_VECTOR_DIM = int(os.getenv("MATCH_VECTOR_DIM", "512"))
+_USER_EMBEDDING_DIM = int(os.getenv("USER_EMBEDDING_DIM", "1024"))
+
 def _get_openai_client() -> OpenAI:
     global _OPENAI_CLIENT
     if _OPENAI_CLIENT is None:
@@ -74,7 +92,7 @@ class MatchingService:
             self,
             embedder_type: str = "qwen",
             embedder_model: Optional[str] = None,
-            device: str = "cpu",
+            device: str = "auto",
             cache_vectors: bool = True,
     ):
         """
@@ -83,19 +101,34 @@ class MatchingService:
         Args:
             embedder_type: "qwen" or "bge-m3" (or "sentence-transformer")
             embedder_model: Optional model override
-            device: Device for computation ("cpu" or "cuda")
+            device: Device for computation ("cpu", "cuda", or "auto" for
+                CUDA when a GPU is visible, else CPU)
             cache_vectors: Whether to cache user vectors in memory
         """
         # Initialize database repository
         self.profile_repo = ProfileRepository()
         self.conference_participant_repo = ConferenceParticipantRepository()
 
-        # Initialize matching components
-        self.embedder = self._create_embedder(
+        # Initialize matching components; repeated texts skip the model
+        base_embedder = self._create_embedder(
             embedder_type=embedder_type,
             embedder_model=embedder_model,
             device=device,
         )
+        self.embedder = CachedEmbedder(
+            base_embedder,
+            max_entries=int(os.getenv("EMBED_CACHE_SIZE", "10000")),
+        )
+        # EMBED_DISK_CACHE_PATH: persist profile embeddings across restarts
+        disk_cache_path = os.getenv("EMBED_DISK_CACHE_PATH", "").strip()
+        self.embedding_cache: Optional[EmbeddingCache] = (
+            EmbeddingCache(
+                disk_cache_path,
+                self._embedding_model_id(base_embedder),
+                fuzzy_distance=int(os.getenv("EMBED_CACHE_FUZZY_DISTANCE", "0")),
+            )
+            if disk_cache_path else None
+        )
 
         self.retriever = InMemoryRetriever()
         self.engine = MatchingEngine(
@@ -116,7 +149,25 @@ class MatchingService:
 
         # Vector cache (optional)
         self.cache_vectors = cache_vectors
-        self._user_profile_cache: Dict[str, UserProfile] = {}
+        # LRU-bounded by USER_CACHE_SIZE; least recently used users are evicted
+        self._user_profile_cache: "OrderedDict[str, UserProfile]" = OrderedDict()
+        self._cache_max_users = int(os.getenv("USER_CACHE_SIZE", "5000"))
+        # Shared across gunicorn worker threads; guards cache mutation.
+        self._cache_lock = threading.RLock()
+        # MATCH_DB_RECALL_TOP_N > 0: single-user matching recalls that many
+        # nearest profiles via pgvector instead of loading the whole table
+        self._db_recall_top_n = int(os.getenv("MATCH_DB_RECALL_TOP_N", "0"))
+        # Full-table pool stacked once (see prewarm); reused across requests
+        # until a user is re-cached or MATCH_POOL_TTL_SECONDS passes
+        self._pool_ttl_seconds = float(os.getenv("MATCH_POOL_TTL_SECONDS", "300"))
+        self._pool_batch: Optional[UserProfileBatch] = None
+        self._pool_expires_at = 0.0
+        self._pool_lock = threading.Lock()
+        # Bumped on every invalidation: a load that started before one is
+        # returned to its caller but not kept
+        self._pool_version = 0
+        # Small pool for overlapping independent Supabase reads on one request
+        self._io_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="u2u-io")
 
         # OpenAI client (created once; reused for reason generation)
         self._reason_model = os.getenv("OPENAI_REASON_MODEL", GPT_MODEL_NAME)
@@ -129,6 +180,11 @@ class MatchingService:
             device: str,
     ) -> Embedder:
         normalized = (embedder_type or "qwen").strip().lower()
+        device = resolve_device(device)
+        # Opt-in reduced precision: "fp16" on CUDA, "int8" on CPU
+        precision = os.getenv("EMBED_PRECISION", "fp32")
+        # Texts per forward pass; GPUs benefit from larger batches
+        batch_size = int(os.getenv("EMBED_BATCH_SIZE", "32"))
 
         if normalized in {"qwen", "qwen3", "qwen3-embedding"}:
             model_name = embedder_model or "Qwen/Qwen3-Embedding-0.6B"
@@ -136,6 +192,8 @@ class MatchingService:
                 model_name=model_name,
                 device=device,
                 normalize=True,
+                precision=precision,
+                batch_size=batch_size,
                 truncate_dim=512,  # Use 512d for faster computation
             )
 
@@ -145,6 +203,8 @@ class MatchingService:
                 model_name=model_name,
                 device=device,
                 normalize=True,
+                precision=precision,
+                batch_size=batch_size,
             )
 
         if normalized in {"sentence-transformer", "sentence_transformer", "st"}:
@@ -153,6 +213,8 @@ class MatchingService:
                 model_name=model_name,
                 device=device,
                 normalize=True,
+                precision=precision,
+                batch_size=batch_size,
             )
 
         raise ValueError(
@@ -160,6 +222,14 @@ class MatchingService:
             "Use 'qwen', 'bge-m3', or 'sentence-transformer'."
         )
 
+    @staticmethod
+    def _embedding_model_id(embedder: Embedder) -> str:
+        """Identify the model and output settings that produce a vector."""
+        return "|".join(
+            str(getattr(embedder, attr, ""))
+            for attr in ("model_name", "precision", "truncate_dim")
+        )
+
     def _fetch_all_users(self) -> List[UserProfile]:
         """
         Fetch all users from database and convert to UserProfile format.
@@ -167,37 +237,65 @@ class MatchingService:
         Returns:
             List of UserProfiles
         """
-        # Get all profiles from database
-        profile_dtos = self.profile_repo.get_all()
-
-        # Convert to UserProfile format
-        user_profiles = profile_dtos_to_user_profiles(profile_dtos)
-
-        # Reuse pre-computed embeddings from DB when available.
-        # overwrite=False preserves existing vectors and only computes
-        # embeddings for users whose vectors are None (no pre-computed
-        # embedding in the DB). Embeddings are kept fresh by
-        # rebuild_user_embedding() called on profile create/update.
-        build_user_vectors(
-            user_profiles,
+        # Get all profiles from database (msgspec structs: typed C decode, no pydantic)
+        profile_rows = self.profile_repo.get_all_structs()
+
+        # Convert to UserProfile format, reusing pre-computed embeddings from
+        # the DB; only users without one are encoded (in batches). Embeddings
+        # are kept fresh by rebuild_user_embedding() on profile create/update.
+        user_profiles = profile_dtos_to_user_profiles_batched(
+            profile_rows,
             self.embedder,
-            build_profile=True,
-            overwrite=False
+            cache=self.embedding_cache,
+            needs_text=_is_reason_generation_enabled(),
         )
 
         # Cache if enabled
         if self.cache_vectors:
-            for user in user_profiles:
-                self._user_profile_cache[user.user_id] = user
+            self._cache_put(user_profiles)
 
         return user_profiles
 
-    def _get_user_by_id(self, user_id: UUID) -> Optional[UserProfile]:
+    def _cache_get(self, user_id_str: str) -> Optional[UserProfile]:
+        """
+        Look up a cached user, marking it as recently used.
+
+        Args:
+            user_id_str: User id string
+
+        Returns:
+            Cached UserProfile, or None (also when caching is disabled)
+        """
+        if not self.cache_vectors:
+            return None
+        with self._cache_lock:
+            user = self._user_profile_cache.get(user_id_str)
+            if user is not None:
+                self._user_profile_cache.move_to_end(user_id_str)
+            return user
+
+    def _cache_put(self, users: Iterable[UserProfile]) -> None:
+        """
+        Insert users as most recently used, evicting the least recently used.
+
+        Args:
+            users: UserProfiles to cache
+        """
+        with self._cache_lock:
+            cache = self._user_profile_cache
+            for user in users:
+                cache[user.user_id] = user
+                cache.move_to_end(user.user_id)
+            while len(cache) > self._cache_max_users:
+                cache.popitem(last=False)
+
+    def _get_user_by_id(self, user_id: Union[UUID, str]) -> Optional[UserProfile]:
         """
         Get a single user by ID.
 
         Args:
-            user_id: User UUID
+            user_id: User UUID, or its string form (avoids a UUID round-trip
+                for ids that already come from UserProfile/RankedUser)
 
         Returns:
             UserProfile if found, None otherwise
@@ -205,58 +303,228 @@ class MatchingService:
         user_id_str = str(user_id)
 
         # Check cache first
-        if self.cache_vectors and user_id_str in self._user_profile_cache:
-            return self._user_profile_cache[user_id_str]
+        cached = self._cache_get(user_id_str)
+        if cached is not None:
+            return cached
 
         # Fetch from database
         profile_dto = self.profile_repo.get_by_id(user_id)
         if not profile_dto:
             return None
 
-        # Convert to UserProfile
-        user_profile = profile_dto_to_user_profile(profile_dto)
-
-        # Build vectors
-        build_user_vectors(
-            [user_profile],
+        # Convert to UserProfile and build vectors
+        user_profile = profile_dtos_to_user_profiles_batched(
+            [profile_dto],
             self.embedder,
-            build_profile=True,
-            overwrite=False
-        )
+            cache=self.embedding_cache,
+            needs_text=_is_reason_generation_enabled(),
+        )[0]
 
         # Cache if enabled
         if self.cache_vectors:
-            self._user_profile_cache[user_id_str] = user_profile
+            self._cache_put([user_profile])
 
         return user_profile
 
+    def prewarm(self) -> UserProfileBatch:
+        """
+        Load every profile once and keep the stacked candidate matrix.
+
+        Single-user matching over the full table then reuses it instead of
+        re-reading and re-stacking the table on every request.
+
+        Returns:
+            The freshly built pool batch
+        """
+        version = self._pool_version
+        batch = self.engine.build_batch(self._fetch_all_users())
+        if self.cache_vectors:
+            with self._cache_lock:
+                if version == self._pool_version:
+                    self._pool_batch = batch
+                    self._pool_expires_at = time.monotonic() + self._pool_ttl_seconds
+        return batch
+
+    def _drop_pool(self) -> None:
+        """Forget the pool batch; the next full-pool match reloads it."""
+        with self._cache_lock:
+            self._pool_batch = None
+            self._pool_version += 1
+
+    def invalidate_user(self, user_id: Union[UUID, str]) -> None:
+        """
+        Forget one user after their profile changed or was deleted.
+
+        Drops the user from the profile cache and the pool batch (which is
+        reloaded on the next full-pool match).
+
+        Args:
+            user_id: User UUID
+        """
+        with self._cache_lock:
+            self._user_profile_cache.pop(str(user_id), None)
+            self._drop_pool()
+
+    def _pool(self) -> UserProfileBatch:
+        """
+        Full-table pool batch, from memory while it is fresh.
+
+        Returns:
+            UserProfileBatch of every profile
+        """
+        if not self.cache_vectors:
+            return self.prewarm()
+        batch = self._pool_batch
+        if batch is not None and time.monotonic() < self._pool_expires_at:
+            return batch
+        # One reload at a time; concurrent requests wait and reuse it
+        with self._pool_lock:
+            batch = self._pool_batch
+            if batch is not None and time.monotonic() < self._pool_expires_at:
+                return batch
+            return self.prewarm()
+
+    def _target_and_batch(self, user_id: Union[UUID, str]) -> Tuple[UserProfile, UserProfileBatch]:
+        """
+        Target user plus candidate pool batch for single-user matching.
+
+        When the whole table is the pool, the target is taken from the
+        (prewarmed) pool batch. A target missing from the batch is checked
+        in the database directly (not through the profile cache): one that
+        exists (created since the batch was built) triggers one reload, one
+        that does not is evicted from the profile cache.
+
+        Args:
+            user_id: Target user's UUID
+
+        Returns:
+            (target user, pool batch including the target)
+
+        Raises:
+            ValueError: If user_id not found in database
+        """
+        user_id_str = str(user_id)
+        if self._db_recall_top_n <= 0:
+            batch = self._pool()
+            if user_id_str not in batch.index:
+                if self.profile_repo.exists({"id": user_id_str}):
+                    with self._cache_lock:
+                        if self._pool_batch is batch:
+                            self._drop_pool()
+                    batch = self._pool()
+                else:
+                    # Deleted since it was cached: don't let it pin a reload
+                    with self._cache_lock:
+                        self._user_profile_cache.pop(user_id_str, None)
+            row = batch.index.get(user_id_str)
+            target_user = batch.users[row] if row is not None else None
+        else:
+            target_user = self._get_user_by_id(user_id)
+            pool = self._match_pool(target_user) if target_user else []
+            batch = self.engine.build_batch(pool)
+
+        if not target_user:
+            raise ValueError(f"User {user_id} not found in database")
+        return target_user, batch
+
+    def _match_pool(self, target_user: UserProfile) -> List[UserProfile]:
+        """
+        Candidate pool for matching one target user.
+
+        With MATCH_DB_RECALL_TOP_N set, the nearest stored embeddings are
+        recalled in Postgres and only those profiles are loaded; otherwise
+        (or if the RPC is unavailable) every user is.
+
+        Args:
+            target_user: User to match
+
+        Returns:
+            List of UserProfiles including the target
+        """
+        vector = target_user.v_profile
+        if self._db_recall_top_n > 0 and vector is not None and any(vector):
+            try:
+                hits = self.profile_repo.match_by_embedding(
+                    self._align_vector_for_storage(vector),
+                    self._db_recall_top_n,
+                    exclude_id=target_user.user_id,
+                )
+            except DatabaseError as exc:
+                logger.warning("pgvector recall failed, using the full pool: %s", exc)
+            else:
+                recalled = self._get_users_by_ids(user_id for user_id, _ in hits)
+                return [target_user, *recalled.values()]
+        return self._pool().users
+
+    def _get_users_by_ids(self, user_ids: Iterable[UUID]) -> Dict[str, UserProfile]:
+        """
+        Get multiple users by ID, fetching cache misses in one batched query.
+
+        Args:
+            user_ids: User UUIDs (or UUID strings)
+
+        Returns:
+            Dict of user_id string -> UserProfile (missing users are omitted)
+        """
+        users: Dict[str, UserProfile] = {}
+        missing: List[str] = []
+        for user_id in user_ids:
+            user_id_str = str(user_id)
+            cached = self._cache_get(user_id_str)
+            if cached is not None:
+                users[user_id_str] = cached
+            else:
+                missing.append(user_id_str)
+
+        if not missing:
+            return users
+
+        # One round-trip for all misses instead of one query per user
+        fetched = profile_dtos_to_user_profiles_batched(
+            self.profile_repo.get_many(missing),
+            self.embedder,
+            cache=self.embedding_cache,
+            needs_text=_is_reason_generation_enabled(),
+        )
+
+        if self.cache_vectors:
+            self._cache_put(fetched)
+
+        for user in fetched:
+            users[user.user_id] = user
+        return users
+
     def rebuild_user_embedding(self, user_id: UUID) -> Dict[str, Any]:
         """
         Recompute one user's embedding and persist into profiles.user_embedding.
         """
         profile_dto = self.profile_repo.get_by_id(user_id)
         if not profile_dto:
+            # Deleted profile: stop offering it as a match
+            self.invalidate_user(user_id)
             raise ValueError(f"User {user_id} not found in database")
 
         user_profile = profile_dto_to_user_profile(profile_dto)
-        build_user_vectors(
-            [user_profile],
-            self.embedder,
-            build_profile=True,
-            overwrite=True,
-        )
+        # Recompute from the current text, ignoring the stored vector; with
+        # EMBED_DISK_CACHE_PATH set, an unchanged text (e.g. only links were
+        # edited) is served from disk instead of the model, across restarts
+        user_profile.v_exp = user_profile.v_interest = user_profile.v_profile = None
+        embed_user_profiles([user_profile], self.embedder, cache=self.embedding_cache, fuzzy=False)
 
-        vector = list(user_profile.v_profile or [])
-        if not vector:
-            # Fallback for sparse/empty profiles: persist a zero vector so we can
-            # avoid repeated on-request embedding attempts.
-            vector = [0.0] * int(os.getenv("MATCH_VECTOR_DIM", "512"))
+        return self._persist_user_embedding(user_profile)
 
-        storage_vector = self._align_vector_for_storage(vector)
-        runtime_vector = self._vector_for_matching(storage_vector)
-        user_profile.v_exp = runtime_vector
-        user_profile.v_interest = runtime_vector
-        user_profile.v_profile = runtime_vector
+    def _persist_user_embedding(self, user_profile: UserProfile) -> Dict[str, Any]:
+        """
+        Store a freshly built profile vector and cache the matching copy.
+
+        Args:
+            user_profile: UserProfile whose v_profile was just computed
+
+        Returns:
+            Dict with user_id, stored dimension and update status
+        """
+        user_id = UUID(user_profile.user_id)
+        storage_vector = self._prepare_user_embedding(user_profile)
 
         updated_profile = self.profile_repo.update_user_embedding(user_id, storage_vector)
         if not updated_profile:
@@ -265,9 +533,7 @@ class MatchingService:
                 "Check RLS/key configuration."
             )
 
-        user_id_str = str(user_id)
-        if self.cache_vectors:
-            self._user_profile_cache[user_id_str] = user_profile
+        self._cache_user(user_profile)
 
         return {
             "user_id": user_id,
@@ -275,80 +541,205 @@ class MatchingService:
             "updated": True,
         }
 
-    def backfill_missing_user_embeddings(self, limit: Optional[int] = None) -> Dict[str, Any]:
+    def _prepare_user_embedding(self, user_profile: UserProfile) -> List[float]:
+        """
+        Align a freshly built profile vector for storage and matching.
+
+        Sets the runtime (matching) vectors on user_profile, in the in-memory
+        MATCH_VECTOR_DTYPE; the stored vector stays float32.
+
+        Args:
+            user_profile: UserProfile whose v_profile was just computed
+
+        Returns:
+            Vector to store in profiles.user_embedding
+        """
+        vector = list(user_profile.v_profile) if user_profile.v_profile is not None else []
+        if not vector:
+            # Fallback for sparse/empty profiles: persist a zero vector so we can
+            # avoid repeated on-request embedding attempts.
+            vector = [0.0] * _MATCH_VECTOR_DIM
+
+        storage_vector = self._align_vector_for_storage(vector)
+        runtime_vector = compact_vector(self._vector_for_matching(storage_vector))
+        user_profile.v_exp = runtime_vector
+        user_profile.v_interest = runtime_vector
+        user_profile.v_profile = runtime_vector
+        return storage_vector
+
+    def _cache_user(self, user_profile: UserProfile) -> None:
+        """Keep a user with fresh vectors in the profile cache, if enabled."""
+        if self.cache_vectors:
+            with self._cache_lock:
+                self._cache_put([user_profile])
+                # The pool batch holds the old vector
+                self._drop_pool()
+
+    def backfill_missing_user_embeddings(
+            self,
+            limit: Optional[int] = None,
+            batch_size: int = 256,
+    ) -> Dict[str, Any]:
         """
         Backfill user_embedding for profiles where it is currently null.
+
+        Runs as a three-stage pipeline: a reader thread pages the missing
+        profiles, this thread encodes each page, and a writer thread stores
+        each page's vectors in one bulk update. Bounded queues let the next
+        page load and the previous one write while the model is busy, and
+        cap memory at a few pages.
+
+        Args:
+            limit: Optional max number of profiles to process
+            batch_size: Profiles per page and per embedder call
         """
-        all_profiles_before = self.profile_repo.get_all()
-        already_has_before = sum(
-            1 for profile in all_profiles_before
-            if self._has_embedding_value(getattr(profile, "user_embedding", None))
-        )
-        profiles = self.profile_repo.get_profiles_missing_embedding(limit=limit)
+        # Counts are HEAD requests, so no profile rows (or vectors) come back
+        total_future = self._io_pool.submit(self.profile_repo.count)
+        before_future = self._io_pool.submit(self.profile_repo.count_with_embedding)
+
+        pages: "queue.Queue[Optional[List[Any]]]" = queue.Queue(maxsize=2)
+        encoded: "queue.Queue[Optional[List[UserProfile]]]" = queue.Queue(maxsize=2)
+        stop = threading.Event()
+        reader_errors: List[Exception] = []
+        writer_errors: List[Exception] = []
+        requested = 0
         updated = 0
         failed = 0
         errors: List[Dict[str, str]] = []
 
-        for profile in profiles:
+        def read_pages() -> None:
             try:
-                self.rebuild_user_embedding(profile.id)
-                updated += 1
+                for page in self.profile_repo.iter_profiles_missing_embedding(
+                    page_size=batch_size, limit=limit
+                ):
+                    if stop.is_set():
+                        break
+                    pages.put(page)
             except Exception as exc:
-                failed += 1
-                errors.append({
-                    "user_id": str(profile.id),
-                    "error": str(exc),
-                })
-
-        all_profiles_after = self.profile_repo.get_all()
-        already_has_after = sum(
-            1 for profile in all_profiles_after
-            if self._has_embedding_value(getattr(profile, "user_embedding", None))
-        )
+                reader_errors.append(exc)
+            finally:
+                pages.put(None)
+
+        def write_pages() -> None:
+            nonlocal updated, failed
+            try:
+                while True:
+                    users = encoded.get()
+                    if users is None:
+                        return
+                    # One bulk write per page
+                    vectors = {user.user_id: self._prepare_user_embedding(user) for user in users}
+                    try:
+                        stored = self.profile_repo.update_user_embeddings(vectors)
+                    except DatabaseError as exc:
+                        stored = set()
+                        error = str(exc)
+                    else:
+                        error = "Embedding computed but update affected 0 rows. Check RLS/key configuration."
+                    for user in users:
+                        if user.user_id in stored:
+                            updated += 1
+                            self._cache_user(user)
+                        else:
+                            failed += 1
+                            errors.append({"user_id": user.user_id, "error": error})
+            except Exception as exc:
+                writer_errors.append(exc)
+                # Stop the pipeline, but keep draining so the encoder never blocks
+                stop.set()
+                while encoded.get() is not None:
+                    pass
+
+        reader = threading.Thread(target=read_pages, name="backfill-read", daemon=True)
+        writer = threading.Thread(target=write_pages, name="backfill-write", daemon=True)
+        reader.start()
+        writer.start()
+        try:
+            while True:
+                page = pages.get()
+                if page is None:
+                    break
+                if stop.is_set():
+                    # Writer failed: drain the reader without encoding
+                    continue
+                requested += len(page)
+                encoded.put(profile_dtos_to_user_profiles_batched(
+                    page, self.embedder, batch_size=batch_size, cache=self.embedding_cache,
+                    compact=False, fuzzy=False,
+                ))
+        except BaseException:
+            # Unblock the reader so it can exit
+            stop.set()
+            while pages.get() is not None:
+                pass
+            raise
+        finally:
+            encoded.put(None)
+            writer.join()
+        reader.join()
+        if writer_errors:
+            raise writer_errors[0]
+        if reader_errors:
+            raise reader_errors[0]
+
+        total_profiles = total_future.result()
+        already_has_before = before_future.result()
+        already_has_after = self.profile_repo.count_with_embedding()
 
         return {
-            "total_profiles": len(all_profiles_before),
+            "total_profiles": total_profiles,
             "already_has_embedding_before": already_has_before,
             "already_has_embedding_after": already_has_after,
-            "requested": len(profiles),
+            "requested": requested,
             "updated": updated,
             "failed": failed,
             "errors": errors[:20],
         }
 
-    @staticmethod
-    def _has_embedding_value(value: Any) -> bool:
-        """
-        Check if a stored embedding value is present and non-empty.
-        """
-        if value is None:
-            return False
-        if isinstance(value, list):
-            return len(value) > 0
-        if isinstance(value, str):
-            text = value.strip()
-            return text not in {"", "null", "None", "[]"}
-        return False
-
     @staticmethod
     def _align_vector_for_storage(vector: List[float]) -> List[float]:
         """
         Align embedding to DB vector dimension (default 1024).
         If shorter -> pad zeros on the right; if longer -> truncate.
         """
-        storage_dim = int(os.getenv("USER_EMBEDDING_DIM", "1024"))
-        trimmed = [float(v) for v in vector[:storage_dim]]
-        if len(trimmed) < storage_dim:
-            trimmed.extend([0.0] * (storage_dim - len(trimmed)))
+        trimmed = [float(v) for v in vector[:_USER_EMBEDDING_DIM]]
+        if len(trimmed) < _USER_EMBEDDING_DIM:
+            trimmed.extend([0.0] * (_USER_EMBEDDING_DIM - len(trimmed)))
         return trimmed
 
     @staticmethod
-    def _vector_for_matching(vector: List[float]) -> List[float]:
+    def _vector_for_matching(vector: List[float]) -> np.ndarray:
         """
-        Runtime vector used by matching algorithm (default first 512 dims).
+        Runtime vector used by matching algorithm (default first 512 dims),
+        L2-normalized like vectors loaded by the mapper.
         """
-        match_dim = int(os.getenv("MATCH_VECTOR_DIM", "512"))
-        return [float(v) for v in vector[:match_dim]]
+        runtime = np.array(vector[:_MATCH_VECTOR_DIM], dtype=np.float32)
+        norm = float(np.linalg.norm(runtime))
+        if norm > 0.0:
+            runtime /= norm
+        return runtime
+
+    @staticmethod
+    def _template_match_reason(user1: "UserProfile", user2: "UserProfile") -> str:
+        """
+        Reason used when generation is disabled: shared tags only, no model call.
+        """
+        common_tags = list(user1.tag_set & user2.tag_set)[:3]
+        if common_tags:
+            topics = ", ".join(common_tags)
+            return (
+                f"We’re recommending {user2.name} because you share overlapping themes in your profile. "
+                f"Based on what you both mention, you have common ground around {topics}. "
+                f"That overlap can make it easier to start a conversation and compare perspectives. "
+                f"You could ask {user2.name} what they’re currently building or learning in these areas, "
+                f"and share what you’re working on as well."
+            )
+        return (
+            f"We’re recommending {user2.name} because your experience and interests show meaningful overlap. "
+            f"Even if your backgrounds aren’t identical, there’s enough shared context to have a productive chat. "
+            f"A good way to start is to compare what you each care about most in your work or interests, "
+            f"and then see if there’s a topic you’d both like to go deeper on."
+        )
 
     def _generate_match_reason(
             self,
@@ -363,6 +754,12 @@ class MatchingService:
         Input/output signature unchanged.
         """
 
+        # Checked first: the template only uses tags, and with reasons off the
+        # mapper skips building texts for users with a stored embedding
+        if not _is_reason_generation_enabled():
+            logger.info("Match reason generation disabled by ENABLE_MATCH_REASON.")
+            return self._template_match_reason(user1, user2)
+
         u1_exp = _safe_trim(user1.exp_text)
         u1_int = _safe_trim(user1.interest_text)
         u2_exp = _safe_trim(user2.exp_text)
@@ -414,24 +811,6 @@ class MatchingService:
         }
 
         model_name = os.getenv("OPENAI_REASON_MODEL", "gpt-4o-mini")
-        if not _is_reason_generation_enabled():
-            logger.info("Match reason generation disabled by ENABLE_MATCH_REASON.")
-            common_tags = list((set(user1.tags or []) & set(user2.tags or [])))[:3]
-            if common_tags:
-                topics = ", ".join(common_tags)
-                return (
-                    f"We’re recommending {user2.name} because you share overlapping themes in your profile. "
-                    f"Based on what you both mention, you have common ground around {topics}. "
-                    f"That overlap can make it easier to start a conversation and compare perspectives. "
-                    f"You could ask {user2.name} what they’re currently building or learning in these areas, "
-                    f"and share what you’re working on as well."
-                )
-            return (
-                f"We’re recommending {user2.name} because your experience and interests show meaningful overlap. "
-                f"Even if your backgrounds aren’t identical, there’s enough shared context to have a productive chat. "
-                f"A good way to start is to compare what you each care about most in your work or interests, "
-                f"and then see if there’s a topic you’d both like to go deeper on."
-            )
 
         if not os.getenv("OPENAI_API_KEY", "").strip():
             logger.warning(
@@ -501,29 +880,22 @@ class MatchingService:
         Raises:
             ValueError: If user_id not found in database
         """
-        # 1. Fetch target user
-        target_user = self._get_user_by_id(user_id)
-        if not target_user:
-            raise ValueError(f"User {user_id} not found in database")
-
-        # 2. Fetch all users (for matching pool)
-        all_users = self._fetch_all_users()
-
-        # 3. Run matching algorithm
-        matches = self.engine.match_users(
-            users=all_users,
-            params=self.default_params,
+        # 1-2. Target user and matching pool (the full pool is loaded once
+        # and reused while fresh)
+        _, batch = self._target_and_batch(user_id)
+
+        # 3. Run matching algorithm for the target only (one score row,
+        # not the full matrix)
+        ranked_users = self.engine.match_user_batch(
+            str(user_id),
+            batch,
+            self.default_params,
             top_k=top_k,
             apply_mmr=apply_mmr,
             mmr_lambda=mmr_lambda,
-            min_score=min_score,
         )
 
-        # 4. Extract results for target user
-        user_id_str = str(user_id)
-        ranked_users = matches.get(user_id_str, [])
-
-        # 5. Convert to (UUID, score) tuples
+        # 4. Convert to (UUID, score) tuples
         results = [
             (UUID(ranked_user.user_id), ranked_user.score)
             for ranked_user in ranked_users
@@ -545,28 +917,24 @@ class MatchingService:
         This keeps the initial recommendation path fast. Match reasons can be
         generated later on demand via generate_reason_for_pair().
         """
-        target_user = self._get_user_by_id(user_id)
-        if not target_user:
-            raise ValueError(f"User {user_id} not found in database")
-
-        all_users = self._fetch_all_users()
-        match_results = self.engine.match_users(
-            users=all_users,
-            params=self.default_params,
+        _, batch = self._target_and_batch(user_id)
+        # Rank only the target user (one score row, not the full matrix)
+        ranked_users = self.engine.match_user_batch(
+            str(user_id),
+            batch,
+            self.default_params,
             top_k=top_k,
             apply_mmr=apply_mmr,
             mmr_lambda=mmr_lambda,
-            min_score=min_score,
         )
 
-        user_id_str = str(user_id)
-        ranked_users = match_results.get(user_id_str, [])
-
+        # Matches always come from the batch rows
         results = []
         for ranked_user in ranked_users:
-            matched_user = self._get_user_by_id(UUID(ranked_user.user_id))
-            if not matched_user:
+            row = batch.index.get(ranked_user.user_id)
+            if row is None:
                 continue
+            matched_user = batch.users[row]
 
             results.append({
                 'user_id': UUID(ranked_user.user_id),
@@ -595,44 +963,48 @@ class MatchingService:
         """
         Find matching users only within one event's participant pool.
         """
+        # The target profile and the participant pool are independent reads;
+        # overlap them so the request pays one round-trip instead of two.
+        participants_future = self._io_pool.submit(
+            self.conference_participant_repo.get_conference_participant_ids, event_id
+        )
         target_user = self._get_user_by_id(user_id)
+        participant_ids = set(participants_future.result())
         if not target_user:
             raise ValueError(f"User {user_id} not found in database")
 
-        participants = self.conference_participant_repo.get_conference_participants(event_id)
-        if not participants:
+        if not participant_ids:
             return []
 
-        participant_ids = {str(p.researcher_id) for p in participants}
-        if str(user_id) not in participant_ids:
+        user_id_str = str(user_id)
+        if user_id_str not in participant_ids:
+            # Participant reads are cached briefly; the user may have just joined
+            # (e.g. via the Node server), so confirm against a fresh read.
+            cache_invalidate(self.conference_participant_repo.table_name)
+            participant_ids = set(self.conference_participant_repo.get_conference_participant_ids(event_id))
+        if user_id_str not in participant_ids:
             raise ValueError(f"User {user_id} is not a participant of event {event_id}")
 
-        event_users: List[UserProfile] = []
-        for participant_id in participant_ids:
-            try:
-                profile = self._get_user_by_id(UUID(participant_id))
-                if profile is not None:
-                    event_users.append(profile)
-            except Exception:
-                # Skip malformed ids or missing users to keep endpoint resilient.
-                continue
+        # Missing users are skipped to keep the endpoint resilient.
+        users_by_id = self._get_users_by_ids(participant_ids)
+        event_users: List[UserProfile] = list(users_by_id.values())
 
         if len(event_users) <= 1:
             return []
 
-        match_results = self.engine.match_users(
-            users=event_users,
-            params=self.default_params,
+        # Rank only the target user (one score row, not the full matrix)
+        ranked_users = self.engine.match_user(
+            user_id_str,
+            event_users,
+            self.default_params,
             top_k=top_k,
             apply_mmr=apply_mmr,
             mmr_lambda=mmr_lambda,
-            min_score=min_score,
         )
 
-        ranked_users = match_results.get(str(user_id), [])
         results = []
         for ranked_user in ranked_users:
-            matched_user = self._get_user_by_id(UUID(ranked_user.user_id))
+            matched_user = users_by_id.get(ranked_user.user_id)
             if not matched_user:
                 continue
 
@@ -662,11 +1034,14 @@ class MatchingService:
         """
         Generate one match reason on demand for (user_id -> matched_user_id).
         """
-        target_user = self._get_user_by_id(user_id)
+        # Both users in one lookup: cache misses share one query and one
+        # embedder batch instead of two single-profile ones
+        users = self._get_users_by_ids([user_id, matched_user_id])
+        target_user = users.get(str(user_id))
         if not target_user:
             raise ValueError(f"User {user_id} not found in database")
 
-        matched_user = self._get_user_by_id(matched_user_id)
+        matched_user = users.get(str(matched_user_id))
         if not matched_user:
             raise ValueError(f"User {matched_user_id} not found in database")
 
@@ -684,6 +1059,51 @@ class MatchingService:
             "reason": reason,
         }
 
+    def _generate_reasons_parallel(
+            self,
+            target_user: "UserProfile",
+            match_data: List[Dict[str, Any]],
+    ) -> List[str]:
+        """
+        Generate reasons for target_user's matches concurrently (model calls).
+
+        Args:
+            target_user: User the reasons are written for
+            match_data: Entries with matched_user, exp_sim, interest_sim and
+                overall_score
+
+        Returns:
+            One reason per entry, in order
+        """
+        def _gen_reason(entry):
+            return self._generate_match_reason(
+                target_user,
+                entry['matched_user'],
+                entry['exp_sim'],
+                entry['interest_sim'],
+                entry['overall_score'],
+            )
+
+        reasons = [None] * len(match_data)
+        max_workers = min(10, len(match_data)) or 1
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            future_to_idx = {
+                executor.submit(_gen_reason, entry): idx
+                for idx, entry in enumerate(match_data)
+            }
+            for future in as_completed(future_to_idx):
+                idx = future_to_idx[future]
+                try:
+                    reasons[idx] = future.result()
+                except Exception as exc:
+                    logger.warning(
+                        "Parallel reason generation failed for match %d: %s",
+                        idx, exc,
+                    )
+                    reasons[idx] = "No match reason available."
+
+        return reasons
+
     def find_matches_with_reasons(
             self,
             user_id: UUID,
@@ -722,34 +1142,59 @@ class MatchingService:
             for match in matches:
                 print(f"{match['name']}: {match['reason']}")
         """
-        # 1. Get target user
-        target_user = self._get_user_by_id(user_id)
-        if not target_user:
-            raise ValueError(f"User {user_id} not found in database")
+        # 1-2. Target user and matching pool, stacked into contiguous
+        # vector matrices (the full pool is loaded once and reused while fresh)
+        target_user, batch = self._target_and_batch(user_id)
+        return self._matches_with_reasons(
+            target_user,
+            batch,
+            top_k=top_k,
+            apply_mmr=apply_mmr,
+            mmr_lambda=mmr_lambda,
+        )
 
-        # 2. Fetch all users
-        all_users = self._fetch_all_users()
+    def _matches_with_reasons(
+            self,
+            target_user: UserProfile,
+            batch: UserProfileBatch,
+            *,
+            top_k: int,
+            apply_mmr: bool,
+            mmr_lambda: float,
+    ) -> List[Dict[str, Any]]:
+        """
+        Rank target_user within batch and attach a reason to each match.
 
-        # 3. Run matching algorithm
-        match_results = self.engine.match_users(
-            users=all_users,
-            params=self.default_params,
+        Args:
+            target_user: User to match (must be in batch)
+            batch: Candidate pool batch
+            top_k: Number of matches to return
+            apply_mmr: Whether to apply diversity selection
+            mmr_lambda: MMR diversity parameter
+
+        Returns:
+            Match dicts as described in find_matches_with_reasons
+        """
+        # 3. Run matching algorithm for the target only (one score row,
+        # not the full matrix)
+        ranked_users = self.engine.match_user_batch(
+            target_user.user_id,
+            batch,
+            self.default_params,
             top_k=top_k,
             apply_mmr=apply_mmr,
             mmr_lambda=mmr_lambda,
-            min_score=min_score,
         )
 
-        # 4. Extract and enrich results
-        user_id_str = str(user_id)
-        ranked_users = match_results.get(user_id_str, [])
-
-        # Phase 1: Collect match data (no OpenAI calls yet)
+        # 4. Enrich results
+        # Phase 1: Collect match data (no OpenAI calls yet); matches always
+        # come from the batch rows
         match_data = []
         for ranked_user in ranked_users:
-            matched_user = self._get_user_by_id(UUID(ranked_user.user_id))
-            if not matched_user:
+            row = batch.index.get(ranked_user.user_id)
+            if row is None:
                 continue
+            matched_user = batch.users[row]
 
             exp_sim = ranked_user.debug_info.get('exp_sim', 0.1)
             interest_sim = ranked_user.debug_info.get('interest_sim', 0.1)
@@ -763,33 +1208,16 @@ class MatchingService:
                 'overall_score': overall_score,
             })
 
-        # Phase 2: Generate reasons in parallel
-        def _gen_reason(entry):
-            return self._generate_match_reason(
-                target_user,
-                entry['matched_user'],
-                entry['exp_sim'],
-                entry['interest_sim'],
-                entry['overall_score'],
-            )
-
-        reasons = [None] * len(match_data)
-        max_workers = min(10, len(match_data)) or 1
-        with ThreadPoolExecutor(max_workers=max_workers) as executor:
-            future_to_idx = {
-                executor.submit(_gen_reason, entry): idx
-                for idx, entry in enumerate(match_data)
-            }
-            for future in as_completed(future_to_idx):
-                idx = future_to_idx[future]
-                try:
-                    reasons[idx] = future.result()
-                except Exception as exc:
-                    logger.warning(
-                        "Parallel reason generation failed for match %d: %s",
-                        idx, exc,
-                    )
-                    reasons[idx] = "No match reason available."
+        # Phase 2: Generate reasons (template reasons are plain string work:
+        # built inline, without a thread pool)
+        if _is_reason_generation_enabled():
+            reasons = self._generate_reasons_parallel(target_user, match_data)
+        else:
+            logger.info("Match reason generation disabled by ENABLE_MATCH_REASON.")
+            reasons = [
+                self._template_match_reason(target_user, entry['matched_user'])
+                for entry in match_data
+            ]
 
         # Phase 3: Assemble results (preserves original order)
         results_with_reasons = []
@@ -844,44 +1272,35 @@ class MatchingService:
                 'tags': List[str],
             }
         """
-        # Get basic matches
-        matches = self.find_matches_for_user(
-            user_id, top_k, min_score, apply_mmr, mmr_lambda
+        # One matching run; each RankedUser already carries its debug info
+        _, batch = self._target_and_batch(user_id)
+        ranked_users = self.engine.match_user_batch(
+            str(user_id),
+            batch,
+            self.default_params,
+            top_k=top_k,
+            apply_mmr=apply_mmr,
+            mmr_lambda=mmr_lambda,
         )
 
-        # Enrich with profile details
+        # Enrich with profile details from the batch rows
         detailed_results = []
-        for matched_user_id, score in matches:
-            matched_profile = self._get_user_by_id(matched_user_id)
-            if matched_profile:
-                # Get debug info from cached results
-                user_id_str = str(user_id)
-                if user_id_str in self._user_profile_cache:
-                    all_users = self._fetch_all_users()
-                    match_results = self.engine.match_users(
-                        users=all_users,
-                        params=self.default_params,
-                        top_k=top_k,
-                        min_score=min_score,
-                    )
+        for ranked_user in ranked_users:
+            row = batch.index.get(ranked_user.user_id)
+            if row is None:
+                continue
+            matched_profile = batch.users[row]
 
-                    ranked = match_results.get(user_id_str, [])
-                    debug_info = {}
-                    for r in ranked:
-                        if r.user_id == str(matched_user_id):
-                            debug_info = r.debug_info
-                            break
-
-                detailed_results.append({
-                    'user_id': matched_user_id,
-                    'name': matched_profile.name,
-                    'role': matched_profile.role,
-                    'score': score,
-                    'exp_similarity': debug_info.get('exp_sim', 0.0),
-                    'interest_similarity': debug_info.get('interest_sim', 0.0),
-                    'tags': matched_profile.tags,
-                    'metadata': matched_profile.metadata,
-                })
+            detailed_results.append({
+                'user_id': UUID(ranked_user.user_id),
+                'name': matched_profile.name,
+                'role': matched_profile.role,
+                'score': ranked_user.score,
+                'exp_similarity': ranked_user.debug_info.get('exp_sim', 0.0),
+                'interest_similarity': ranked_user.debug_info.get('interest_sim', 0.0),
+                'tags': matched_profile.tags,
+                'metadata': matched_profile.metadata,
+            })
 
         return detailed_results
 
@@ -902,8 +1321,8 @@ class MatchingService:
         Returns:
             Dictionary mapping user_id -> list of (matched_id, score)
         """
-        # Fetch all users once
-        all_users = self._fetch_all_users()
+        # Full pool, loaded once and reused while fresh
+        all_users = self._pool().users
 
         # Run matching for all users
         matches = self.engine.match_users(
@@ -947,21 +1366,62 @@ class MatchingService:
         Returns:
             Dictionary mapping user_id -> list of match dicts with reasons
         """
+        # Every target is ranked against the same cached pool batch (one
+        # score row each); only pgvector recall builds per-target pools
         results = {}
         for user_id in user_ids:
             try:
-                matches = self.find_matches_with_reasons(
-                    user_id=user_id,
-                    top_k=top_k,
-                    min_score=min_score,
-                )
-                results[user_id] = matches
+                target_user, batch = self._target_and_batch(user_id)
             except ValueError:
                 # User not found
                 results[user_id] = []
+                continue
+            results[user_id] = self._matches_with_reasons(
+                target_user,
+                batch,
+                top_k=top_k,
+                apply_mmr=True,
+                mmr_lambda=0.5,
+            )
 
         return results
 
+    def warmup(
+            self,
+            user_ids: Optional[List[UUID]] = None,
+            prefetch_pool: bool = True,
+            warm_embedder: bool = True,
+    ) -> Dict[str, Any]:
+        """
+        Warm up the embedder and user cache before serving traffic.
+
+        Moves model load / first-inference cost off the first request.
+
+        Args:
+            user_ids: Optional hot user IDs to load into the cache
+            prefetch_pool: Whether to fetch and vectorize the full candidate pool
+            warm_embedder: Whether to run a first inference through the embedder
+
+        Returns:
+            Warmup stats (timings and cache size)
+        """
+        stats: Dict[str, Any] = {}
+        if warm_embedder:
+            started = time.perf_counter()
+            self.embedder.encode(["warmup"])
+            stats["embedder_ms"] = round((time.perf_counter() - started) * 1000, 1)
+
+        if prefetch_pool:
+            stats["pool_size"] = len(self.prewarm().users)
+
+        if user_ids:
+            self._get_users_by_ids(user_ids)
+
+        stats["cached_users"] = len(self._user_profile_cache)
+        return stats
+
     def clear_cache(self):
         """Clear the vector cache (useful for testing or after data updates)"""
-        self._user_profile_cache.clear()
\ No newline at end of file
+        with self._cache_lock:
+            self._user_profile_cache.clear()
+            self._drop_pool()
\ No newline at end of file
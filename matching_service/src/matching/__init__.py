@@ -6,6 +6,7 @@ from .matching_pojo import UserProfile, MatchingParams, RankedUser
 from .engine import MatchingEngine
 from .adapters import (
     BgeM3Embedder,
+    CachedEmbedder,
     Qwen3Embedder,
     InMemoryRetriever,
     build_user_vectors,
@@ -18,6 +19,7 @@ __all__ = [
     "RankedUser",
     "MatchingEngine",
     "BgeM3Embedder",
+    "CachedEmbedder",
     "Qwen3Embedder",
     "InMemoryRetriever",
     "build_user_vectors",
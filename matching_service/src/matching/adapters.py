@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+import hashlib
+import threading
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from typing import List, Optional, Protocol, Sequence, Tuple
 
@@ -83,6 +86,41 @@ def cosine_sim(u: Vector, v: Vector) -> float:
     return float(np.dot(a, b) / denom)
 
 
+def resolve_device(device: Optional[str]) -> str:
+    """
+    Map "auto" (or empty) to "cuda" when a GPU is visible, else "cpu".
+    Explicit devices ("cpu", "cuda", "cuda:1", "mps", ...) pass through.
+    """
+    device = (device or "auto").strip().lower()
+    if device != "auto":
+        return device
+    import torch
+
+    return "cuda" if torch.cuda.is_available() else "cpu"
+
+
+def _apply_precision(model, precision: str, device: str):
+    """
+    Optionally lower a SentenceTransformer's inference precision.
+
+    "fp16" halves the weights on CUDA; "int8" applies dynamic int8
+    quantization to the Linear layers on CPU. Anything else (default "fp32")
+    leaves the model untouched. Lower precision shifts cosine scores around
+    the 4th-5th decimal.
+    """
+    precision = (precision or "fp32").lower()
+    if precision == "fp16" and str(device).startswith("cuda"):
+        model.half()
+    elif precision == "int8" and str(device) == "cpu":
+        import torch
+
+        transformer = model[0]
+        transformer.auto_model = torch.ao.quantization.quantize_dynamic(
+            transformer.auto_model, {torch.nn.Linear}, dtype=torch.qint8
+        )
+    return model
+
+
 # =========================
 # 3) TF-IDF Embedder
 # =========================
@@ -138,15 +176,25 @@ class Qwen3Embedder:
     device: str = "cpu"
     normalize: bool = True
     truncate_dim: Optional[int] = None  # MRL: optional dimension truncation
+    precision: str = "fp32"  # "fp16" (CUDA) or "int8" (CPU) for faster inference
+    batch_size: int = 32  # Texts per forward pass (raise on GPU)
 
     _model: Optional[object] = field(default=None, repr=False)
+    _load_lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
 
     def _load_model(self):
         if self._model is None:
-            self._model = SentenceTransformer(self.model_name, device=self.device)
-
-            if self.truncate_dim is not None:
-                self._model.truncate_dim = self.truncate_dim
+            # Request threads may race to the first encode; load exactly once
+            with self._load_lock:
+                if self._model is None:
+                    model = _apply_precision(
+                        SentenceTransformer(self.model_name, device=self.device),
+                        self.precision,
+                        self.device,
+                    )
+                    if self.truncate_dim is not None:
+                        model.truncate_dim = self.truncate_dim
+                    self._model = model
 
         return self._model
 
@@ -155,9 +203,12 @@ class Qwen3Embedder:
         embeddings = model.encode(
             list(texts),
             normalize_embeddings=self.normalize,
+            batch_size=self.batch_size,
             show_progress_bar=False,
+            convert_to_numpy=True,
         )
-        return [emb.tolist() for emb in embeddings]
+        # fp16 models return half-precision arrays; score in float32
+        return np.asarray(embeddings, dtype=np.float32).tolist()
 
     def encode_one(self, text: str) -> Vector:
         return self.encode([text])[0]
@@ -180,12 +231,22 @@ class SentenceTransformerEmbedder:
     model_name: str = "BAAI/bge-small-en-v1.5"
     device: str = "cpu"
     normalize: bool = True
+    precision: str = "fp32"  # "fp16" (CUDA) or "int8" (CPU) for faster inference
+    batch_size: int = 32  # Texts per forward pass (raise on GPU)
 
     _model: Optional[object] = field(default=None, repr=False)
+    _load_lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
 
     def _load_model(self):
         if self._model is None:
-            self._model = SentenceTransformer(self.model_name, device=self.device)
+            # Request threads may race to the first encode; load exactly once
+            with self._load_lock:
+                if self._model is None:
+                    self._model = _apply_precision(
+                        SentenceTransformer(self.model_name, device=self.device),
+                        self.precision,
+                        self.device,
+                    )
         return self._model
 
     def encode(self, texts: Sequence[str]) -> List[Vector]:
@@ -193,9 +254,12 @@ class SentenceTransformerEmbedder:
         embeddings = model.encode(
             list(texts),
             normalize_embeddings=self.normalize,
+            batch_size=self.batch_size,
             show_progress_bar=False,
+            convert_to_numpy=True,
         )
-        return [emb.tolist() for emb in embeddings]
+        # fp16 models return half-precision arrays; score in float32
+        return np.asarray(embeddings, dtype=np.float32).tolist()
 
     def encode_one(self, text: str) -> Vector:
         return self.encode([text])[0]
@@ -213,6 +277,63 @@ class BgeM3Embedder(SentenceTransformerEmbedder):
     model_name: str = "BAAI/bge-m3"
 
 
+# =========================
+# 5c) Cached Embedder
+# =========================
+
+@dataclass
+class CachedEmbedder:
+    """
+    LRU cache in front of any Embedder, keyed by sha1 of the text.
+
+    Profiles repeat a lot of text (same institution, same research area,
+    identical rebuilds), so only unseen texts reach the model. Duplicates
+    inside one batch are encoded once. Returned vectors are shared between
+    callers and must be treated as read-only.
+    """
+    embedder: Embedder
+    max_entries: int = 10_000
+
+    _cache: "OrderedDict[bytes, Vector]" = field(default_factory=OrderedDict, repr=False)
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    @staticmethod
+    def _key(text: str) -> bytes:
+        return hashlib.sha1(text.encode("utf-8")).digest()
+
+    def encode(self, texts: Sequence[str]) -> List[Vector]:
+        keys = [self._key(t) for t in texts]
+        found: dict = {}
+        missing: dict = {}  # key -> text, first occurrence wins
+
+        with self._lock:
+            for key, text in zip(keys, texts):
+                vec = self._cache.get(key)
+                if vec is not None:
+                    self._cache.move_to_end(key)
+                    found[key] = vec
+                elif key not in found:
+                    missing.setdefault(key, text)
+
+        if missing:
+            vecs = self.embedder.encode(list(missing.values()))
+            with self._lock:
+                for key, vec in zip(missing.keys(), vecs):
+                    found[key] = vec
+                    self._cache[key] = vec
+                while len(self._cache) > self.max_entries:
+                    self._cache.popitem(last=False)
+
+        return [found[key] for key in keys]
+
+    def encode_one(self, text: str) -> Vector:
+        return self.encode([text])[0]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._cache.clear()
+
+
 # =========================
 # 6) In-Memory Retriever (Simplified)
 # =========================
@@ -230,26 +351,26 @@ class InMemoryRetriever:
             users: Sequence[UserProfile],
             top_n: int,
     ) -> List[Tuple[UserProfile, float]]:
-        q = np.asarray(query_vector, dtype=np.float32)
-        qn = np.linalg.norm(q) + 1e-12
+        pool = [u for u in users if u.v_profile is not None]
+        if not pool or top_n <= 0:
+            return []
 
-        scored: List[Tuple[UserProfile, float]] = []
-
-        for u in users:
-            if u.v_profile is None:
-                continue
-
-            v = np.asarray(u.v_profile, dtype=np.float32)
-            vn = np.linalg.norm(v) + 1e-12
+        q = np.asarray(query_vector, dtype=np.float32)
+        q = q / (np.linalg.norm(q) + 1e-12)
 
-            # Cosine similarity
-            sim = float(np.dot(q, v) / (qn * vn))
-            scored.append((u, sim))
+        # One GEMV over the stacked, row-normalized candidate matrix
+        mat = np.asarray([u.v_profile for u in pool], dtype=np.float32)
+        mat /= np.linalg.norm(mat, axis=1, keepdims=True) + 1e-12
+        sims = mat @ q
 
-        # Sort by similarity descending
-        scored.sort(key=lambda x: x[1], reverse=True)
+        # Top-N via argpartition (O(N)), then sort only the selected slice
+        if top_n < len(pool):
+            idx = np.argpartition(-sims, top_n - 1)[:top_n]
+        else:
+            idx = np.arange(len(pool))
+        idx = idx[np.argsort(-sims[idx], kind="stable")]
 
-        return scored[:top_n]
+        return [(pool[i], float(sims[i])) for i in idx]
 
 
 # =========================
@@ -286,6 +407,7 @@ def build_user_vectors(
         embedder: Embedder,
         build_profile: bool = True,
         overwrite: bool = False,
+        single_vector: bool = False,
 ) -> None:
     """
     Batch generate vectors for users.
@@ -296,7 +418,29 @@ def build_user_vectors(
         embedder: Embedder instance
         build_profile: Whether to build combined v_profile
         overwrite: Whether to overwrite existing vectors
+        single_vector: Encode only the combined profile text (one forward
+            pass per user) and share it across v_exp, v_interest and v_profile
     """
+    if single_vector:
+        texts = []
+        targets = []
+        for u in users:
+            if overwrite or u.v_exp is None or u.v_interest is None or u.v_profile is None:
+                profile_text = u.build_profile_text()
+                if profile_text.strip():
+                    texts.append(profile_text)
+                    targets.append(u)
+        if not texts:
+            return
+
+        for u, vec in zip(targets, embedder.encode(texts)):
+            if overwrite or u.v_exp is None:
+                u.v_exp = vec
+            if overwrite or u.v_interest is None:
+                u.v_interest = vec
+            if overwrite or u.v_profile is None:
+                u.v_profile = vec
+        return
 
     # Collect texts that need encoding
     exp_texts = []
@@ -324,18 +468,21 @@ def build_user_vectors(
                 profile_texts.append(profile_text)
                 profile_indices.append(i)
 
-    # Encode in batches
-    if exp_texts:
-        exp_vecs = embedder.encode(exp_texts)
-        for idx, vec in zip(exp_indices, exp_vecs):
-            users[idx].v_exp = vec
-
-    if interest_texts:
-        interest_vecs = embedder.encode(interest_texts)
-        for idx, vec in zip(interest_indices, interest_vecs):
-            users[idx].v_interest = vec
-
-    if profile_texts:
-        profile_vecs = embedder.encode(profile_texts)
-        for idx, vec in zip(profile_indices, profile_vecs):
-            users[idx].v_profile = vec
\ No newline at end of file
+    # Encode everything in one embedder call (one batched forward pass
+    # sequence instead of three), then split the results back out
+    all_texts = exp_texts + interest_texts + profile_texts
+    if not all_texts:
+        return
+
+    all_vecs = embedder.encode(all_texts)
+    n_exp = len(exp_texts)
+    n_interest = len(interest_texts)
+
+    for idx, vec in zip(exp_indices, all_vecs[:n_exp]):
+        users[idx].v_exp = vec
+
+    for idx, vec in zip(interest_indices, all_vecs[n_exp:n_exp + n_interest]):
+        users[idx].v_interest = vec
+
+    for idx, vec in zip(profile_indices, all_vecs[n_exp + n_interest:]):
+        users[idx].v_profile = vec
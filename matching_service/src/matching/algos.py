@@ -76,6 +76,9 @@ def safe_cosine_sim_with_debug(
         dbg[f"{name}_fallback"] = f"eps({eps})"
         return float(eps), dbg
 
+    # Compact (float16/int8) vectors must not accumulate in their own dtype
+    u1 = np.asarray(u1, dtype=np.float32)
+    u2 = np.asarray(u2, dtype=np.float32)
     denom = (np.linalg.norm(u1) * np.linalg.norm(u2))
     if denom == 0:
         dbg[f"{name}_status"] = "zero_norm"
@@ -125,6 +128,227 @@ def calculate_similarity_score(
     return float(total_score), debug_info
 
 
+_ROW_OK, _ROW_NONE, _ROW_ZERO = 0, 1, 2
+
+
+def unit_rows(vectors: Sequence[Optional[Vector]]) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Stack vectors into an L2-normalized float32 matrix.
+    Missing and zero-norm rows stay all-zero; their state is returned per row.
+    Returns: (matrix, row_status)
+    """
+    n = len(vectors)
+    status = np.full(n, _ROW_NONE, dtype=np.int8)
+    present = [i for i, v in enumerate(vectors) if v is not None]
+    if not present:
+        return np.zeros((n, 1), dtype=np.float32), status
+
+    stacked = np.asarray([vectors[i] for i in present], dtype=np.float32)
+    mat = np.zeros((n, stacked.shape[1]), dtype=np.float32)
+    norms = np.linalg.norm(stacked, axis=1)
+    nonzero = norms > 0
+    # Vectors loaded by the service are normalized at ingest: skip the division
+    if not np.allclose(norms[nonzero], 1.0, atol=1e-5):
+        stacked[nonzero] /= norms[nonzero, None]
+    idx = np.asarray(present)
+    mat[idx] = stacked
+    status[idx] = np.where(nonzero, _ROW_OK, _ROW_ZERO)
+    return mat, status
+
+
+@dataclass
+class UserProfileBatch:
+    """
+    Column layout of a candidate pool for single-user matching.
+
+    Each vector field is stacked once into a contiguous L2-normalized
+    float32 matrix, so a match call is a GEMV over ready rows instead of
+    re-stacking per-user vectors.
+    """
+    users: List[UserProfile]
+    ids: np.ndarray  # object array of user ids, row-aligned with users
+    index: Dict[UserId, int]
+    exp_unit: np.ndarray
+    exp_status: np.ndarray
+    interest_unit: np.ndarray
+    interest_status: np.ndarray
+    profile_unit: np.ndarray
+    has_profile: np.ndarray
+
+    @classmethod
+    def from_users(cls, users: Sequence[UserProfile]) -> "UserProfileBatch":
+        """Stack users' vectors (as they are; nothing is encoded here)."""
+        user_list = list(users)
+        if all(u.v_exp is u.v_interest is u.v_profile for u in user_list):
+            # Users loaded from the DB share one vector across fields: stack it once
+            unit, status = unit_rows([u.v_profile for u in user_list])
+            exp = interest = profile = (unit, status)
+        else:
+            exp = unit_rows([u.v_exp for u in user_list])
+            interest = unit_rows([u.v_interest for u in user_list])
+            profile = unit_rows([u.v_profile for u in user_list])
+
+        ids = np.asarray([u.user_id for u in user_list], dtype=object)
+        return cls(
+            users=user_list,
+            ids=ids,
+            # First occurrence wins for duplicate ids, like a linear search
+            index={user_id: i for i, user_id in reversed(list(enumerate(ids)))},
+            exp_unit=exp[0],
+            exp_status=exp[1],
+            interest_unit=interest[0],
+            interest_status=interest[1],
+            profile_unit=profile[0],
+            has_profile=profile[1] != _ROW_NONE,
+        )
+
+
+def pair_status(a: int, b: int) -> str:
+    """Debug status for one pair, matching safe_cosine_sim_with_debug"""
+    if a == _ROW_NONE and b == _ROW_NONE:
+        return "both_none"
+    if a == _ROW_NONE:
+        return "u1_none"
+    if b == _ROW_NONE:
+        return "u2_none"
+    if a == _ROW_ZERO or b == _ROW_ZERO:
+        return "zero_norm"
+    return "ok"
+
+
+def similarity_matrix(
+    users: Sequence[UserProfile],
+    params: MatchingParams,
+    *,
+    eps: float = DEFAULT_EPS,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    All-pairs calculate_similarity_score: one GEMM per field instead of
+    n² Python-level cosine calls. Entry [i, j] equals
+    calculate_similarity_score(users[i], users[j], params)[0].
+    Returns: (total, exp_sim, interest_sim, exp_row_status, interest_row_status)
+    """
+    weights = np.asarray([params.w_exp, params.w_interest], dtype=np.float32)
+    sims: List[np.ndarray] = []
+    statuses: List[np.ndarray] = []
+    # Users loaded from the DB share one vector across fields: one GEMM
+    shared = all(u.v_exp is u.v_interest for u in users)
+    for attr in ("v_exp", "v_interest"):
+        if shared and sims:
+            sims.append(sims[0])
+            statuses.append(statuses[0])
+            continue
+        unit, status = unit_rows([getattr(u, attr) for u in users])
+        sim = unit @ unit.T
+        bad = status != _ROW_OK
+        sim[bad, :] = eps
+        sim[:, bad] = eps
+        sims.append(sim)
+        statuses.append(status)
+
+    total = np.multiply(sims[0], weights[0])
+    buf = np.empty_like(total)
+    np.multiply(sims[1], weights[1], out=buf)
+    total += buf
+    return total, sims[0], sims[1], statuses[0], statuses[1]
+
+
+def similarity_row(
+    target_index: int,
+    users: Sequence[UserProfile],
+    params: MatchingParams,
+    *,
+    eps: float = DEFAULT_EPS,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Row target_index of similarity_matrix: one GEMV per field instead of
+    the full n² GEMM when only one user is being matched.
+    Returns: (total, exp_sim, interest_sim, exp_row_status, interest_row_status)
+    """
+    fields = [unit_rows([getattr(u, attr) for u in users]) for attr in ("v_exp", "v_interest")]
+    return _similarity_row(target_index, fields, params, eps)
+
+
+def batch_similarity_row(
+    target_index: int,
+    batch: UserProfileBatch,
+    params: MatchingParams,
+    *,
+    eps: float = DEFAULT_EPS,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    similarity_row over a prebuilt UserProfileBatch (no re-stacking).
+    Returns: (total, exp_sim, interest_sim, exp_row_status, interest_row_status)
+    """
+    fields = [
+        (batch.exp_unit, batch.exp_status),
+        (batch.interest_unit, batch.interest_status),
+    ]
+    return _similarity_row(target_index, fields, params, eps)
+
+
+def _similarity_row(
+    target_index: int,
+    fields: List[Tuple[np.ndarray, np.ndarray]],
+    params: MatchingParams,
+    eps: float,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    weights = np.asarray([params.w_exp, params.w_interest], dtype=np.float32)
+    sims: List[np.ndarray] = []
+    statuses: List[np.ndarray] = []
+    for unit, status in fields:
+        if sims and unit is fields[0][0]:
+            # Same matrix as the first field (shared vectors): same row
+            sims.append(sims[0])
+            statuses.append(statuses[0])
+            continue
+        sim = unit @ unit[target_index]
+        if status[target_index] != _ROW_OK:
+            sim[:] = eps
+        else:
+            sim[status != _ROW_OK] = eps
+        sims.append(sim)
+        statuses.append(status)
+
+    total = np.multiply(sims[0], weights[0])
+    total += np.multiply(sims[1], weights[1])
+    return total, sims[0], sims[1], statuses[0], statuses[1]
+
+
+def similarity_debug(
+    s_exp: float,
+    s_interest: float,
+    total_score: float,
+    exp_status: str,
+    interest_status: str,
+    *,
+    eps: float = DEFAULT_EPS,
+) -> Dict[str, Any]:
+    """Rebuild calculate_similarity_score's debug_info from precomputed parts"""
+    dbg_exp: Dict[str, Any] = {"exp_status": exp_status}
+    if exp_status != "ok":
+        dbg_exp["exp_fallback"] = f"eps({eps})"
+    dbg_int: Dict[str, Any] = {"interest_status": interest_status}
+    if interest_status != "ok":
+        dbg_int["interest_fallback"] = f"eps({eps})"
+
+    debug_info: Dict[str, Any] = {
+        "exp_sim": round(float(s_exp), 6),
+        "interest_sim": round(float(s_interest), 6),
+        "weighted_total": round(float(total_score), 6),
+        "exp_debug": dbg_exp,
+        "interest_debug": dbg_int,
+    }
+    missing = []
+    if exp_status != "ok":
+        missing.append(f"exp:{exp_status}")
+    if interest_status != "ok":
+        missing.append(f"interest:{interest_status}")
+    if missing:
+        debug_info["warnings"] = missing
+    return debug_info
+
+
 # =========================
 # 3) MMR Diversity Selection
 # =========================
@@ -204,6 +428,73 @@ def mmr_select(
     return selected
 
 
+def profile_unit_rows(users: Sequence[UserProfile]) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Row-normalized v_profile matrix for mmr_select_rows.
+    Returns: (matrix, has_vector per row)
+    """
+    unit, status = unit_rows([u.v_profile for u in users])
+    return unit, status != _ROW_NONE
+
+
+def mmr_select_rows(
+        order: np.ndarray,
+        relevance: np.ndarray,
+        unit: np.ndarray,
+        has_vector: np.ndarray,
+        k: int,
+        lam: float,
+) -> List[int]:
+    """
+    mmr_select over matrix rows, with the diversity term vectorized.
+
+    Each pick costs one GEMV of the picked row against the candidates; the
+    running max similarity to the selected set replaces the per-candidate
+    loop over selected vectors.
+
+    Args:
+        order: Candidate row indices (ties go to the earlier one)
+        relevance: Relevance per row, indexed by row
+        unit: L2-normalized vectors per row (zero rows for zero vectors)
+        has_vector: Whether each row has a vector; rows without one are
+            never penalized and never penalize others
+        k: Number of rows to select
+        lam: Trade-off parameter (0 < λ <= 1)
+
+    Returns: Selected row indices, in pick order
+    """
+    order = np.asarray(order)
+    if k <= 0 or order.size == 0:
+        return []
+    if not (0.0 < lam <= 1.0):
+        raise ValueError("lam must be in (0, 1].")
+
+    cand_unit = unit[order]
+    cand_has_vector = has_vector[order]
+    rel = lam * relevance[order].astype(np.float64)
+    max_sim = np.full(order.size, -np.inf)
+    penalized = False
+    available = np.ones(order.size, dtype=bool)
+
+    picked: List[int] = []
+    for _ in range(min(k, order.size)):
+        if penalized:
+            # Max similarity to any selected item (0 for items without a vector)
+            penalty = np.where(cand_has_vector, max_sim, 0.0)
+            score = rel - (1.0 - lam) * penalty
+        else:
+            score = rel.copy()
+        score[~available] = -np.inf
+        best = int(np.argmax(score))
+        available[best] = False
+        picked.append(int(order[best]))
+        if cand_has_vector[best]:
+            penalized = True
+            np.maximum(max_sim, cand_unit @ cand_unit[best], out=max_sim)
+
+    return picked
+
+
 # =========================
 # 4) Graph Construction (Optional - for future use)
 # =========================
@@ -3,6 +3,8 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import Dict, List, Optional, Sequence, Tuple
 
+import numpy as np
+
 from .matching_pojo import (
     MatchingParams,
     RankedUser,
@@ -11,9 +13,15 @@ from .matching_pojo import (
 )
 from .adapters import Embedder, Retriever, Reranker, build_user_vectors
 from .algos import (
-    calculate_similarity_score,
+    UserProfileBatch,
+    batch_similarity_row,
     cosine_sim,
     mmr_select,
+    mmr_select_rows,
+    pair_status,
+    profile_unit_rows,
+    similarity_debug,
+    similarity_matrix,
 )
 
 
@@ -177,46 +185,176 @@ class MatchingEngine:
 
         results: Dict[UserId, List[RankedUser]] = {}
 
-        for u in user_list:
-            candidates: List[RankedUser] = []
+        # All pair scores in one pass
+        total, s_exp, s_int, exp_status, int_status = similarity_matrix(user_list, params)
+        exp_status = exp_status.tolist()
+        int_status = int_status.tolist()
+        ids = np.asarray([u.user_id for u in user_list], dtype=object)
+        mmr_vectors = profile_unit_rows(user_list) if apply_mmr else None
+
+        for i, u in enumerate(user_list):
+            results[u.user_id] = _rank_row(
+                i,
+                total[i],
+                s_exp[i],
+                s_int[i],
+                exp_status,
+                int_status,
+                user_list,
+                ids,
+                top_k=top_k,
+                mmr_vectors=mmr_vectors,
+                mmr_lambda=mmr_lambda,
+            )
 
-            for v in user_list:
-                if v.user_id == u.user_id:
-                    continue
+        return results
 
-                # Calculate similarity score
-                score, dbg = calculate_similarity_score(u, v, params)
+    def build_batch(self, users: Sequence[UserProfile]) -> UserProfileBatch:
+        """
+        Ensure users have vectors and stack them into a UserProfileBatch.
 
-                candidates.append(
-                    RankedUser(
-                        user_id=v.user_id,
-                        score=score,
-                        debug_info=dbg,
-                    )
-                )
+        The batch can be reused by match_user_batch for any target in it
+        for as long as the users' vectors do not change.
+        """
+        build_user_vectors(users, self.embedder, build_profile=True, overwrite=False)
+        return UserProfileBatch.from_users(users)
 
-            # Sort by score
-            candidates.sort(key=lambda x: x.score, reverse=True)
+    def match_user(
+            self,
+            user_id: UserId,
+            users: Sequence[UserProfile],
+            params: MatchingParams,
+            *,
+            top_k: Optional[int] = None,
+            apply_mmr: bool = True,
+            mmr_lambda: float = 0.5,
+    ) -> List[RankedUser]:
+        """
+        Matches for one user; equals match_users(users, ...)[user_id].
 
-            # Apply MMR diversity (optional)
-            if apply_mmr and candidates:
-                def _get_rel(x: RankedUser) -> float:
-                    return x.score
+        Only the target's score row is computed (one GEMV per field, not the
+        n² matrix) and only the target is ranked.
 
-                def _get_vec(x: RankedUser):
-                    up = user_by_id.get(x.user_id)
-                    return up.v_profile if up is not None else None
+        Args:
+            user_id: Target user (must be in users, else [] is returned)
+            users: All users, including the target
+            params: Matching parameters
+            top_k: Number of recommendations (default: params.user_top_k)
+            apply_mmr: Whether to apply diversity
+            mmr_lambda: MMR parameter (0.5 = balance)
+        """
+        return self.match_user_batch(
+            user_id,
+            self.build_batch(users),
+            params,
+            top_k=top_k,
+            apply_mmr=apply_mmr,
+            mmr_lambda=mmr_lambda,
+        )
+
+    def match_user_batch(
+            self,
+            user_id: UserId,
+            batch: UserProfileBatch,
+            params: MatchingParams,
+            *,
+            top_k: Optional[int] = None,
+            apply_mmr: bool = True,
+            mmr_lambda: float = 0.5,
+    ) -> List[RankedUser]:
+        """
+        match_user over a batch from build_batch.
+
+        Args:
+            user_id: Target user (must be in the batch, else [] is returned)
+            batch: Candidate pool, including the target
+            params: Matching parameters
+            top_k: Number of recommendations (default: params.user_top_k)
+            apply_mmr: Whether to apply diversity
+            mmr_lambda: MMR parameter (0.5 = balance)
+        """
+        params.validate_logic()
+
+        top_k = top_k or params.user_top_k
+
+        target = batch.index.get(user_id)
+        if target is None:
+            return []
+
+        total, s_exp, s_int, exp_status, int_status = batch_similarity_row(target, batch, params)
+        return _rank_row(
+            target,
+            total,
+            s_exp,
+            s_int,
+            exp_status.tolist(),
+            int_status.tolist(),
+            batch.users,
+            batch.ids,
+            top_k=top_k,
+            mmr_vectors=(batch.profile_unit, batch.has_profile) if apply_mmr else None,
+            mmr_lambda=mmr_lambda,
+        )
 
-                candidates = mmr_select(
-                    items=candidates,
-                    k=min(top_k, len(candidates)),
-                    lam=mmr_lambda,
-                    get_relevance=_get_rel,
-                    get_vector=_get_vec,
-                )
-            else:
-                candidates = candidates[:top_k]
 
-            results[u.user_id] = candidates
+def _rank_row(
+        i: int,
+        row: np.ndarray,
+        exp_row: np.ndarray,
+        int_row: np.ndarray,
+        exp_status: List[int],
+        int_status: List[int],
+        user_list: List[UserProfile],
+        ids: np.ndarray,
+        *,
+        top_k: int,
+        mmr_vectors: Optional[Tuple[np.ndarray, np.ndarray]],
+        mmr_lambda: float,
+) -> List[RankedUser]:
+    """
+    Rank every other user for user i from its score row.
 
-        return results
\ No newline at end of file
+    Ranking runs on the float32 row; RankedUser objects and rounded debug
+    info are only built for the survivors.
+    """
+    others = np.flatnonzero(ids != user_list[i].user_id)
+
+    if mmr_vectors is not None and others.size:
+        # MMR may pick from anywhere in the list: keep the full
+        # score-descending order (stable, like list.sort)
+        order = others[np.argsort(-row[others], kind="stable")]
+        unit, has_vector = mmr_vectors
+        picked = mmr_select_rows(
+            order,
+            row,
+            unit,
+            has_vector,
+            k=min(top_k, order.size),
+            lam=mmr_lambda,
+        )
+    else:
+        k = min(top_k, others.size)
+        if k < others.size:
+            top = others[np.argpartition(-row[others], k - 1)[:k]]
+        else:
+            top = others
+        # Score descending, ties by position (matches a stable sort)
+        picked = top[np.lexsort((top, -row[top]))].tolist()
+
+    candidates: List[RankedUser] = []
+    for j in picked:
+        score = float(row[j])
+        candidates.append(
+            RankedUser(
+                user_id=user_list[j].user_id,
+                score=score,
+                debug_info=similarity_debug(
+                    exp_row[j],
+                    int_row[j],
+                    score,
+                    pair_status(exp_status[i], exp_status[j]),
+                    pair_status(int_status[i], int_status[j]),
+                ),
+            )
+        )
+    return candidates
@@ -1,11 +1,14 @@
 from __future__ import annotations
 
-from pydantic import BaseModel, Field
+import numpy as np
+from pydantic import BaseModel, ConfigDict, Field
 from enum import Enum
-from typing import Any, Dict, List, Optional, Sequence, Tuple
+from functools import cached_property
+from typing import Any, Dict, FrozenSet, List, Optional, Sequence, Tuple, Union
 
 # Type aliases
-Vector = Sequence[float]
+# Embeddings parsed from the DB stay float32 arrays; embedder output is a list
+Vector = Union[np.ndarray, Sequence[float]]
 UserId = str
 
 
@@ -20,6 +23,8 @@ class UserProfile(BaseModel):
 
     Focus: Experience and Interest matching only.
     """
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
     user_id: UserId
     name: str
     role: Optional[str] = "attendee"  # Maps to occupation
@@ -42,6 +47,13 @@ class UserProfile(BaseModel):
     # Optional: debugging/extensions
     metadata: Dict[str, Any] = Field(default_factory=dict)
 
+    @cached_property
+    def tag_set(self) -> FrozenSet[str]:
+        """
+        Tags as a set, built on first use (tags are fixed once a profile is mapped).
+        """
+        return frozenset(self.tags or ())
+
     def build_profile_text(self) -> str:
         """
         Build unified text for embedding.
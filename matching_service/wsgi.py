@@ -0,0 +1,8 @@
+"""
+WSGI entry point for production serving.
+
+    gunicorn -c gunicorn.conf.py wsgi:application
+"""
+from app import app
+
+application = app
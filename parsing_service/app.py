@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import os
+from functools import singledispatch
 from uuid import UUID
 from typing import Any
 
@@ -13,18 +14,28 @@ app = Flask(__name__)
 PARSING_SERVICE = ParsingService()
 
 
+@singledispatch
 def to_jsonable(x: Any) -> Any:
-    if isinstance(x, UUID):
-        return str(x)
-    if isinstance(x, dict):
-        return {k: to_jsonable(v) for k, v in x.items()}
-    if isinstance(x, list):
-        return [to_jsonable(v) for v in x]
-    if isinstance(x, tuple):
-        return [to_jsonable(v) for v in x]
+    """Convert objects (UUID, etc.) into JSON-serializable types; dispatch follows the MRO, so subclasses of dict/list/tuple/UUID match too."""
     return x
 
 
+@to_jsonable.register
+def _(x: UUID) -> str:
+    return str(x)
+
+
+@to_jsonable.register
+def _(x: dict) -> dict:
+    return {k: to_jsonable(v) for k, v in x.items()}
+
+
+@to_jsonable.register(list)
+@to_jsonable.register(tuple)
+def _(x) -> list:
+    return [to_jsonable(v) for v in x]
+
+
 @app.get("/health")
 def health():
     return jsonify({"ok": True})
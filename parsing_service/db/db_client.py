@@ -3,19 +3,24 @@ Supabase Client Singleton
 """
 
 import os
+import threading
 from typing import Optional
-from supabase import create_client, Client
+from supabase import create_client, Client, ClientOptions
 from dotenv import load_dotenv
 
 
 class SupabaseClient:
     _instance: Optional[Client] = None
     _initialized: bool = False
+    _lock = threading.Lock()
 
     @classmethod
     def get_instance(cls) -> Client:
         if cls._instance is None:
-            cls._initialize()
+            # Request threads share one client; never build a second one
+            with cls._lock:
+                if cls._instance is None:
+                    cls._initialize()
         return cls._instance
 
     @classmethod
@@ -34,7 +39,13 @@ class SupabaseClient:
                 "Please set SUPABASE_URL and SUPABASE_SERVICE_ROLE_KEY environment variables."
             )
 
-        cls._instance = create_client(url, key)
+        cls._instance = create_client(
+            url,
+            key,
+            options=ClientOptions(
+                postgrest_client_timeout=float(os.environ.get("SUPABASE_TIMEOUT", "30")),
+            ),
+        )
         cls._initialized = True
 
     @classmethod
@@ -1804,15 +1804,8 @@ app.post('/api/messages', async (req, res) => {
       .eq('id', sender_id)
       .single();
 
-    // Update conversation's last_message_at
-    const { error: updateError } = await supabase
-      .from('conversations')
-      .update({ last_message_at: new Date().toISOString() })
-      .eq('id', conversation_id);
-
-    if (updateError) {
-      console.error('Failed to update conversation timestamp:', updateError);
-    }
+    // conversations.last_message_at is bumped by the
+    // touch_conversation_on_message trigger on insert
 
     // Add sender name to message
     const messageWithName = {
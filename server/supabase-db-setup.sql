@@ -437,3 +437,153 @@ CREATE POLICY "Service role can manage linkedin_profiles" ON public.linkedin_pro
   FOR ALL USING (auth.role() = 'service_role');
 
 ALTER TABLE linkedin_profiles ADD COLUMN experiences jsonb DEFAULT '[]';
+
+-- ============================================================
+-- MATCHING SERVICE RPCs
+-- ============================================================
+
+-- Researchers registered for both conferences, intersected in Postgres so the
+-- matching service does not pull two full participant lists.
+CREATE OR REPLACE FUNCTION public.get_common_participants(c1 text, c2 text)
+RETURNS TABLE (researcher_id uuid)
+LANGUAGE sql STABLE
+AS $$
+  SELECT cp.researcher_id
+  FROM public.conference_participants cp
+  WHERE cp.conference_id IN (c1, c2)
+  GROUP BY cp.researcher_id
+  HAVING count(DISTINCT cp.conference_id) = CASE WHEN c1 = c2 THEN 1 ELSE 2 END;
+$$;
+
+-- Keyset pagination indexes: (filter column, sort column, id) lets the
+-- matching service seek straight to a (created_at, id) cursor instead of
+-- scanning and discarding OFFSET rows.
+CREATE INDEX IF NOT EXISTS idx_messages_conversation_created_id
+  ON public.messages(conversation_id, created_at, id);
+CREATE INDEX IF NOT EXISTS idx_messages_sender_created_id
+  ON public.messages(sender_id, created_at, id);
+CREATE INDEX IF NOT EXISTS idx_conversations_last_message_id
+  ON public.conversations(last_message_at DESC, id DESC);
+
+-- Conversations store their participant pair in canonical order
+-- (participant1_id < participant2_id, as written by the API server and the
+-- matching service) so a pair lookup is one seek on the existing
+-- UNIQUE(participant1_id, participant2_id) index instead of an OR of both
+-- orders. Merge pairs stored in both orders into the canonical row (moving
+-- the reversed row's messages onto it), swap the remaining legacy rows, then
+-- enforce the invariant.
+WITH dup AS (
+  SELECT rev.id AS drop_id, keep.id AS keep_id, rev.last_message_at
+  FROM public.conversations rev
+  JOIN public.conversations keep
+    ON keep.participant1_id = rev.participant2_id
+   AND keep.participant2_id = rev.participant1_id
+  WHERE rev.participant1_id > rev.participant2_id
+), moved AS (
+  UPDATE public.messages m
+    SET conversation_id = dup.keep_id
+    FROM dup
+    WHERE m.conversation_id = dup.drop_id
+)
+UPDATE public.conversations c
+  SET last_message_at = GREATEST(c.last_message_at, dup.last_message_at)
+  FROM dup
+  WHERE c.id = dup.keep_id;
+DELETE FROM public.conversations rev
+  USING public.conversations keep
+  WHERE rev.participant1_id > rev.participant2_id
+    AND keep.participant1_id = rev.participant2_id
+    AND keep.participant2_id = rev.participant1_id;
+UPDATE public.conversations
+  SET participant1_id = participant2_id, participant2_id = participant1_id
+  WHERE participant1_id > participant2_id;
+ALTER TABLE public.conversations DROP CONSTRAINT IF EXISTS conversations_participants_ordered;
+ALTER TABLE public.conversations ADD CONSTRAINT conversations_participants_ordered
+  CHECK (participant1_id < participant2_id);
+
+-- Per-participant activity feed (get_active_conversations): each side of the
+-- participant OR gets a partial index already sorted by recency, so Postgres
+-- can combine two small index scans and take the top N without a table sort.
+CREATE INDEX IF NOT EXISTS idx_conversations_p1_last_message
+  ON public.conversations(participant1_id, last_message_at DESC)
+  WHERE last_message_at IS NOT NULL;
+CREATE INDEX IF NOT EXISTS idx_conversations_p2_last_message
+  ON public.conversations(participant2_id, last_message_at DESC)
+  WHERE last_message_at IS NOT NULL;
+
+-- Substring profile search (ILIKE '%term%') cannot use a btree index; trigram
+-- GIN indexes on the bare columns let the planner serve it without a seq scan.
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+CREATE INDEX IF NOT EXISTS idx_profiles_name_trgm
+  ON public.profiles USING gin (name gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS idx_profiles_research_area_trgm
+  ON public.profiles USING gin (research_area gin_trgm_ops);
+
+-- Keep conversations.last_message_at in step with message inserts inside the
+-- same transaction, so senders do not need a second UPDATE round-trip.
+CREATE OR REPLACE FUNCTION public.touch_conversation_on_message()
+RETURNS trigger
+LANGUAGE plpgsql SECURITY DEFINER SET search_path = public
+AS $$
+BEGIN
+  UPDATE public.conversations
+    SET last_message_at = NEW.created_at
+    WHERE id = NEW.conversation_id;
+  RETURN NEW;
+END;
+$$;
+
+DROP TRIGGER IF EXISTS touch_conversation_on_message ON public.messages;
+CREATE TRIGGER touch_conversation_on_message
+  AFTER INSERT ON public.messages
+  FOR EACH ROW EXECUTE FUNCTION public.touch_conversation_on_message();
+
+-- Manual touch with the database clock (ConversationRepository.update_last_message_time).
+CREATE OR REPLACE FUNCTION public.touch_conversation(conversation_id bigint)
+RETURNS SETOF public.conversations
+LANGUAGE sql
+AS $$
+  UPDATE public.conversations c
+    SET last_message_at = now()
+    WHERE c.id = touch_conversation.conversation_id
+    RETURNING c.*;
+$$;
+
+-- Nearest-profile recall for the matching service (MATCH_DB_RECALL_TOP_N):
+-- cosine top-K over stored embeddings via an HNSW index, so a single-user
+-- match loads K candidate rows instead of every profile and vector.
+CREATE INDEX IF NOT EXISTS idx_profiles_user_embedding_hnsw
+  ON public.profiles USING hnsw (user_embedding vector_cosine_ops);
+
+CREATE OR REPLACE FUNCTION public.match_profiles(
+  query_embedding vector,
+  match_count int,
+  exclude_id uuid DEFAULT NULL
+)
+RETURNS TABLE (id uuid, similarity float8)
+LANGUAGE sql STABLE
+AS $$
+  SELECT p.id, 1 - (p.user_embedding <=> query_embedding) AS similarity
+  FROM public.profiles p
+  WHERE p.user_embedding IS NOT NULL
+    AND (exclude_id IS NULL OR p.id <> exclude_id)
+  ORDER BY p.user_embedding <=> query_embedding
+  LIMIT match_count;
+$$;
+
+-- Bulk embedding writes for the matching-service backfill: one round-trip
+-- updates a whole batch (ids[i] gets embeddings[i], pgvector text form)
+-- instead of one PATCH per profile. Returns the ids that were updated.
+CREATE OR REPLACE FUNCTION public.update_user_embeddings(
+  ids uuid[],
+  embeddings text[]
+)
+RETURNS SETOF uuid
+LANGUAGE sql
+AS $$
+  UPDATE public.profiles p
+  SET user_embedding = v.embedding::vector
+  FROM unnest(ids, embeddings) AS v(id, embedding)
+  WHERE p.id = v.id
+  RETURNING p.id;
+$$;